@@ -0,0 +1,200 @@
+"""Bounded-concurrency bulk API calls, behind ``client.map``.
+
+Input parameters are only pulled while fewer than ``concurrency`` calls are
+unconsumed, i.e. in flight or done but not yet taken by the caller, so a
+slow consumer holds the producer back instead of buffering results.
+"""
+
+import asyncio
+from collections import deque
+
+
+class _Call:
+    __slots__ = ('params', 'result', 'exception', 'done', 'handle')
+
+    def __init__(self, params):
+        self.params = params
+        self.result = None
+        self.exception = None
+        self.done = False
+        # The task, or cancel scope, running the call.
+        self.handle = None
+
+
+class BulkCall:
+    """Async iterator over the results of ``method(**params)`` for each of
+    ``params``, which may be an iterable or an async iterable.
+
+    Must be used as an async context manager, which cancels the calls still
+    in flight on exit.
+    """
+
+    def __init__(
+        self, method, params, concurrency, ordered, return_exceptions
+    ):
+        if not isinstance(concurrency, int) or concurrency < 1:
+            raise ValueError('concurrency must be a positive integer')
+        self._method = method
+        if hasattr(params, '__aiter__'):
+            self._params = params.__aiter__()
+            self._params_async = True
+        else:
+            self._params = iter(params)
+            self._params_async = False
+        self._params_exhausted = False
+        self._concurrency = concurrency
+        self._ordered = ordered
+        self._return_exceptions = return_exceptions
+        # Unconsumed calls in input order, and those done in completion order.
+        self._calls = deque()
+        self._done = deque()
+        self._changed = None
+        # The first call that failed, raised ahead of any other result.
+        self._failed = None
+        self._entered = False
+        self._closed = False
+
+    def _create_event(self):
+        return asyncio.Event()
+
+    def _start(self, call):
+        call.handle = asyncio.ensure_future(self._run(call))
+
+    async def _cancel(self, calls):
+        for call in calls:
+            call.handle.cancel()
+        await asyncio.gather(
+            *(call.handle for call in calls), return_exceptions=True
+        )
+
+    async def __aenter__(self):
+        self._entered = True
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """Cancel the calls in flight and stop iterating."""
+        self._closed = True
+        in_flight = [call for call in self._calls if not call.done]
+        self._calls.clear()
+        self._done.clear()
+        await self._cancel(in_flight)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._entered:
+            raise RuntimeError(
+                'Use "async with client.map(...) as results" to iterate'
+            )
+        if self._closed:
+            raise StopAsyncIteration
+        try:
+            await self._fill()
+        except BaseException:
+            await self.aclose()
+            raise
+
+        while (call := self._next_done()) is None:
+            if not self._calls:
+                self._closed = True
+                raise StopAsyncIteration
+            self._changed = self._create_event()
+            await self._changed.wait()
+
+        if call.exception is None:
+            return call.result
+        if self._return_exceptions:
+            return call.exception
+        await self.aclose()
+        raise call.exception
+
+    async def _fill(self):
+        while (
+            not self._params_exhausted and len(self._calls) < self._concurrency
+        ):
+            try:
+                if self._params_async:
+                    params = await self._params.__anext__()
+                else:
+                    params = next(self._params)
+            except (StopIteration, StopAsyncIteration):
+                self._params_exhausted = True
+                return
+            call = _Call(params)
+            self._calls.append(call)
+            self._start(call)
+
+    def _next_done(self):
+        if self._failed is not None:
+            return self._failed
+        if self._ordered:
+            if self._calls and self._calls[0].done:
+                return self._calls.popleft()
+            return None
+        if self._done:
+            call = self._done.popleft()
+            self._calls.remove(call)
+            return call
+        return None
+
+    async def _run(self, call):
+        try:
+            result = await self._method(**call.params)
+        except Exception as e:
+            call.exception = e
+            if not self._return_exceptions and self._failed is None:
+                # Raised, cancelling the others, without waiting for the
+                # calls before it to be consumed.
+                self._failed = call
+        else:
+            call.result = result
+        call.done = True
+        if not self._ordered:
+            self._done.append(call)
+        if self._changed is not None:
+            self._changed.set()
+
+
+class AnyioBulkCall(BulkCall):
+    """Runs the calls in a task group, so they also run on trio."""
+
+    def _create_event(self):
+        import anyio
+
+        return anyio.Event()
+
+    def _start(self, call):
+        import anyio
+
+        # A scope per call, as cancelling the task group's would also cancel
+        # the caller's code in the ``async with`` block.
+        call.handle = anyio.CancelScope()
+        self._task_group.start_soon(self._run_in_scope, call)
+
+    async def _run_in_scope(self, call):
+        with call.handle:
+            await self._run(call)
+
+    async def _cancel(self, calls):
+        for call in calls:
+            call.handle.cancel()
+
+    async def __aenter__(self):
+        import anyio
+
+        self._task_group = anyio.create_task_group()
+        await self._task_group.__aenter__()
+        return await super().__aenter__()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        try:
+            await self.aclose()
+        finally:
+            # The calls are cancelled, so this only waits for them to end.
+            # An exception of the block is not passed on, as the task group
+            # would raise it in an exception group.
+            await self._task_group.__aexit__(None, None, None)
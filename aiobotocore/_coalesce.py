@@ -0,0 +1,154 @@
+"""Opt-in coalescing of identical concurrent API calls.
+
+With ``AioConfig(coalesce_operations=['HeadObject', ...])``, a call to one of
+those operations with the same parameters as a call that is still in flight
+does not make its own request. It waits for the one in flight and gets a copy
+of its response, or its exception. Operations with streaming or event stream
+output are never coalesced, as their body can only be read once, and neither
+are calls with parameters that cannot be compared, such as file objects.
+
+Only list operations that are safe to share: reads whose response does not
+depend on anything but their parameters and the client.
+"""
+
+import asyncio
+import copy
+import datetime
+from functools import wraps
+from typing import NamedTuple
+
+# Parameter values compared as they are.
+_SCALAR_TYPES = (str, bytes, int, float, bool, datetime.datetime)
+
+_NO_RESULT = object()
+
+
+class CoalescingInfo(NamedTuple):
+    # Calls that made a request.
+    calls: int
+    # Calls that shared the request of another one.
+    coalesced: int
+    in_flight: int
+
+
+def _freeze(value):
+    if value is None or isinstance(value, _SCALAR_TYPES):
+        return value
+    if isinstance(value, dict):
+        return tuple(
+            sorted((key, _freeze(item)) for key, item in value.items())
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    raise TypeError(f'Cannot coalesce calls with {type(value)} parameters')
+
+
+def _copy_exception(exception):
+    """Return a copy of exception to raise to one caller.
+
+    Raising one exception object in every caller would grow its traceback
+    with each raise, and share a ``ClientError``'s ``response`` dict.
+    """
+    try:
+        copied = copy.copy(exception)
+    except Exception:
+        return exception
+    if isinstance(getattr(copied, 'response', None), dict):
+        copied.response = copy.deepcopy(copied.response)
+    copied.__cause__ = exception.__cause__
+    copied.__suppress_context__ = exception.__suppress_context__
+    return copied
+
+
+class _Flight:
+    __slots__ = ('event', 'result', 'exception', 'waiters')
+
+    def __init__(self, event):
+        self.event = event
+        self.result = _NO_RESULT
+        self.exception = None
+        self.waiters = 0
+
+
+class RequestCoalescer:
+    def __init__(self, operations=()):
+        self.operations = frozenset(operations)
+        self._flights = {}
+        self._calls = 0
+        self._coalesced = 0
+
+    def _create_event(self):
+        return asyncio.Event()
+
+    def info(self):
+        return CoalescingInfo(self._calls, self._coalesced, len(self._flights))
+
+    def key_for(self, operation_model, api_params):
+        """Return the key of a coalescable call, or None."""
+        if (
+            operation_model.name not in self.operations
+            or operation_model.has_streaming_output
+            or operation_model.has_event_stream_output
+        ):
+            return None
+        try:
+            return operation_model.name, _freeze(api_params)
+        except TypeError:
+            return None
+
+    async def call(self, key, func, *args):
+        """Await ``func(*args)``, or the in-flight call with the same key."""
+        while (flight := self._flights.get(key)) is not None:
+            flight.waiters += 1
+            await flight.event.wait()
+            if flight.exception is not None:
+                self._coalesced += 1
+                raise _copy_exception(flight.exception)
+            if flight.result is not _NO_RESULT:
+                self._coalesced += 1
+                return copy.deepcopy(flight.result)
+            # The call was cancelled, which only concerns its own task.
+
+        flight = self._flights[key] = _Flight(self._create_event())
+        self._calls += 1
+        try:
+            result = await func(*args)
+            if flight.waiters:
+                # Waiters copy this snapshot, not what the caller may
+                # have changed by the time they run.
+                flight.result = copy.deepcopy(result)
+            return result
+        except Exception as e:
+            # A snapshot, as for results.
+            flight.exception = _copy_exception(e)
+            raise
+        finally:
+            del self._flights[key]
+            flight.event.set()
+
+
+class AnyioRequestCoalescer(RequestCoalescer):
+    def _create_event(self):
+        import anyio
+
+        return anyio.Event()
+
+
+def with_request_coalescing(func):
+    """Coalesce calls to ``_make_api_call`` through the client's coalescer."""
+
+    @wraps(func)
+    async def wrapper(self, operation_name, api_params):
+        coalescer = self._request_coalescer
+        if operation_name in coalescer.operations:
+            key = coalescer.key_for(
+                self._service_model.operation_model(operation_name),
+                api_params,
+            )
+            if key is not None:
+                return await coalescer.call(
+                    key, func, self, operation_name, api_params
+                )
+        return await func(self, operation_name, api_params)
+
+    return wrapper
@@ -0,0 +1,134 @@
+"""Opt-in hedging of requests, to cut tail latency.
+
+With ``AioConfig(hedging={'operations': ['GetItem', 'Query']})``, when an
+attempt at one of those operations has not returned within a delay, the
+endpoint sends a second, identical one, which takes another pooled
+connection since the first is busy. Whichever returns first is used and the
+other is cancelled. Only list idempotent operations. Operations with
+streaming input or event stream output are never hedged.
+
+The options are:
+
+- ``operations``: the operation names to hedge.
+- ``delay``: seconds to wait before hedging, 0.05 by default.
+- ``percentile``: if set, e.g. to 95, the delay is that percentile of the
+  recent latencies of the operation instead, once enough are known. Until
+  then ``delay`` is used.
+- ``budget``: how many hedged attempts may be sent per request, 0.1 by
+  default. Requests add ``budget`` to a small token bucket and a hedge takes
+  a whole token, so hedging cannot multiply the load when a service is slow
+  for everyone.
+"""
+
+import math
+import time
+from collections import deque
+from typing import NamedTuple
+
+DEFAULT_DELAY = 0.05
+DEFAULT_BUDGET = 0.1
+
+# Hedges that can be sent in a burst.
+_MAX_TOKENS = 10
+# Latencies kept per operation, and needed for a percentile.
+_WINDOW_SIZE = 256
+_MIN_SAMPLES = 20
+# Samples between recomputing the percentile.
+_RECOMPUTE_EVERY = 16
+
+OPTIONS = frozenset({'operations', 'delay', 'percentile', 'budget'})
+
+
+class HedgingInfo(NamedTuple):
+    # Requests, including retries, to operations that may be hedged.
+    requests: int
+    # Requests for which a second attempt was sent.
+    hedged: int
+    # Hedged requests answered by the second attempt.
+    hedge_wins: int
+
+
+class _LatencyWindow:
+    __slots__ = ('_samples', '_percentile', '_value', '_pending')
+
+    def __init__(self, percentile):
+        self._samples = deque(maxlen=_WINDOW_SIZE)
+        self._percentile = percentile
+        self._value = None
+        self._pending = 0
+
+    def add(self, latency):
+        self._samples.append(latency)
+        self._pending += 1
+        if self._pending >= _RECOMPUTE_EVERY:
+            self._value = None
+            self._pending = 0
+
+    def value(self):
+        if self._value is None and len(self._samples) >= _MIN_SAMPLES:
+            ordered = sorted(self._samples)
+            index = math.ceil(len(ordered) * self._percentile / 100) - 1
+            self._value = ordered[max(index, 0)]
+        return self._value
+
+
+class HedgingPolicy:
+    def __init__(
+        self,
+        operations,
+        delay=DEFAULT_DELAY,
+        percentile=None,
+        budget=DEFAULT_BUDGET,
+    ):
+        self.operations = frozenset(operations)
+        self._delay = delay
+        self._percentile = percentile
+        self._budget = budget
+        self._tokens = 0.0
+        self._latencies = {}
+        self._requests = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+
+    def info(self):
+        return HedgingInfo(self._requests, self._hedged, self._hedge_wins)
+
+    def hedge_delay(self, operation_model):
+        """Return the delay before hedging a request, or None."""
+        if (
+            operation_model.name not in self.operations
+            or operation_model.has_streaming_input
+            or operation_model.has_event_stream_output
+        ):
+            return None
+        self._requests += 1
+        self._tokens = min(self._tokens + self._budget, _MAX_TOKENS)
+        if self._percentile is not None:
+            window = self._latencies.get(operation_model.name)
+            if window is not None and (latency := window.value()) is not None:
+                return latency
+        return self._delay
+
+    def acquire_hedge(self):
+        """Take a token from the budget for a hedge, if there is one."""
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        self._hedged += 1
+        return True
+
+    def record_latency(self, operation_name, start):
+        """Record how long an attempt took, or ran until it was cancelled,
+        since ``start``.
+        """
+        if self._percentile is None:
+            return
+        window = self._latencies.get(operation_name)
+        if window is None:
+            window = self._latencies[operation_name] = _LatencyWindow(
+                self._percentile
+            )
+        window.add(time.monotonic() - start)
+
+    def record_hedge_win(self):
+        self._hedge_wins += 1
@@ -26,3 +26,12 @@ except ImportError:
     except ImportError:
         httpx = None
         HTTPX_IS_LEGACY = False
+
+# The httpcore package matching the resolved httpx, for the network backend
+# hook used by the DNS cache.
+if httpx is None:
+    httpcore = None
+elif HTTPX_IS_LEGACY:
+    import httpcore
+else:
+    import httpcore2 as httpcore  # noqa: F401
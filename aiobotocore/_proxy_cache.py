@@ -0,0 +1,66 @@
+"""Per-session cache of the proxy used for each origin.
+
+``ProxyConfiguration`` parses the request URL, fixes up the proxy URL and
+builds the proxy headers on every call. The result only depends on the
+request's origin, so the HTTP sessions look it up here instead. Environment
+values that affect it are read when the session is entered, so changing them
+afterwards only applies to sessions entered later.
+"""
+
+import os
+import re
+from typing import NamedTuple
+
+from botocore.httpsession import ensure_boolean, urlparse
+
+# Sessions that talk to many virtual-hosted S3 buckets see many origins.
+_MAX_CACHED_ORIGINS = 1024
+
+# Scheme and authority, e.g. ``https://bucket.s3.amazonaws.com:443``.
+_ORIGIN_RE = re.compile(r'[^:/?#]+://[^/?#]*')
+
+
+class ProxyDecision(NamedTuple):
+    proxy_url: str | None
+    # Must not be modified; shared by every request to the origin.
+    proxy_headers: dict[str, str]
+
+
+class ProxyDecisionCache:
+    def __init__(self, proxy_config, maxsize=_MAX_CACHED_ORIGINS):
+        self._proxy_config = proxy_config
+        self._maxsize = maxsize
+        self._decisions = {}
+        self._add_host_header = False
+
+    def reset(self):
+        """Forget cached decisions and re-read the environment."""
+        self._decisions.clear()
+        self._add_host_header = ensure_boolean(
+            os.environ.get('BOTO_EXPERIMENTAL__ADD_PROXY_HOST_HEADER', '')
+        )
+
+    def decision_for(self, url):
+        match = _ORIGIN_RE.match(url)
+        origin = match.group() if match else url
+        decision = self._decisions.get(origin)
+        if decision is None:
+            decision = self._decide(url)
+            if len(self._decisions) >= self._maxsize:
+                del self._decisions[next(iter(self._decisions))]
+            self._decisions[origin] = decision
+        return decision
+
+    def proxy_url_for(self, url):
+        return self.decision_for(url).proxy_url
+
+    def _decide(self, url):
+        proxy_url = self._proxy_config.proxy_url_for(url)
+        proxy_headers = self._proxy_config.proxy_headers_for(url)
+        if self._add_host_header:
+            # This is currently an "experimental" feature which provides
+            # no guarantees of backwards compatibility. It may be subject
+            # to change or removal in any patch version. Anyone opting in
+            # to this feature should strictly pin botocore.
+            proxy_headers['host'] = urlparse(url).hostname
+        return ProxyDecision(proxy_url, proxy_headers)
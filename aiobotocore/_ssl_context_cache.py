@@ -0,0 +1,105 @@
+"""Process-wide cache of the SSL contexts built by the HTTP sessions.
+
+Building a context loads the CA bundle and any client certificate from disk,
+which costs tens of milliseconds of CPU for every new client. Contexts are
+keyed by the settings and files they were built from, including each file's
+modification time, so rewriting a file produces a fresh context. Call
+:func:`clear_ssl_context_cache` to force a rebuild, e.g. after rotating
+certificates in place within the same mtime granularity.
+
+Cached contexts are shared between sessions and must not be modified.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+from botocore.httpsession import get_cert_path
+
+_MAX_CACHED_CONTEXTS = 64
+
+
+def _file_state(path):
+    if path is None:
+        return None
+    try:
+        return path, os.stat(path).st_mtime_ns
+    except OSError:
+        # Let the build report the missing file.
+        return path, None
+
+
+def ssl_context_files(verify, cert_file, key_file, proxies_settings):
+    """Files read when building the contexts for these settings.
+
+    Each file is paired with its role, as the same path used as a client
+    certificate or only as the proxy's builds a different context.
+    """
+    proxy_cert = proxies_settings.get('proxy_client_cert')
+    if isinstance(proxy_cert, tuple):
+        proxy_cert, proxy_key = proxy_cert
+    else:
+        proxy_key = None
+    files = {
+        'verify': get_cert_path(verify) if verify else None,
+        'cert': cert_file,
+        'key': key_file,
+        'proxy_ca': proxies_settings.get('proxy_ca_bundle'),
+        'proxy_cert': proxy_cert,
+        'proxy_key': proxy_key,
+    }
+    return tuple(
+        (role, path if isinstance(path, str) else None)
+        for role, path in files.items()
+    )
+
+
+class SSLContextCache:
+    def __init__(self, maxsize=_MAX_CACHED_CONTEXTS):
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._contexts = OrderedDict()
+
+    def get_or_build(self, settings, files, build):
+        """Return the cached result of ``build()`` for ``settings``.
+
+        ``files`` are the ``(role, path)`` pairs of the files ``build``
+        reads, with ``None`` for a role without a file. Checking their
+        modification times blocks, so like ``build`` this must run off the
+        event loop.
+        """
+        key = (
+            settings,
+            tuple((role, _file_state(path)) for role, path in files),
+        )
+        with self._lock:
+            if key in self._contexts:
+                self._contexts.move_to_end(key)
+                return self._contexts[key]
+
+        # Built outside the lock; a concurrent miss builds its own copy.
+        contexts = build()
+        with self._lock:
+            self._contexts[key] = contexts
+            while len(self._contexts) > self._maxsize:
+                self._contexts.popitem(last=False)
+        return contexts
+
+    def clear(self):
+        with self._lock:
+            self._contexts.clear()
+
+    def __len__(self):
+        return len(self._contexts)
+
+
+ssl_context_cache = SSLContextCache()
+
+
+def clear_ssl_context_cache():
+    """Drop all cached SSL contexts, e.g. after certificates were rotated.
+
+    HTTP sessions that already built their contexts keep using them; only
+    sessions set up afterwards load the files again.
+    """
+    ssl_context_cache.clear()
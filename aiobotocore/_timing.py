@@ -0,0 +1,112 @@
+"""Opt-in timing of the phases of an API call.
+
+With ``AioConfig(collect_phase_timings=True)`` each API call records
+``(phase, start, end)`` tuples of ``time.monotonic()`` timestamps, in the
+order the phases finish:
+
+- ``resolve_endpoint``: endpoint ruleset resolution.
+- ``serialize``: parameter validation and serialization.
+- ``sign``: signing, including fetching credentials.
+- ``send``: from handing the request to the HTTP session until the response
+  headers arrive, i.e. up to the first byte. Contains these when they apply:
+
+  - ``pool_wait``: waiting for a free pooled connection (aiohttp only).
+  - ``connect``: opening a new connection, including the TLS handshake.
+
+- ``download``: reading a response body that is not streamed.
+- ``parse``: parsing the response.
+
+Phases repeat when a request is retried. The timings are added to the
+response as ``ResponseMetadata['PhaseTimings']`` and passed as ``timings``
+to handlers of the ``phase-timings.<service>.<operation>`` event, which is
+emitted even when the call fails.
+
+The timings of the current call are found through a context variable, so
+layers that do not see the request context can add to them. When disabled,
+a phase costs a context variable lookup.
+"""
+
+import time
+from contextlib import nullcontext
+from contextvars import ContextVar
+from functools import wraps
+
+_current_timings = ContextVar('aiobotocore_phase_timings', default=None)
+
+_NOT_TIMED = nullcontext()
+
+
+class PhaseTimings(list):
+    """``(phase, start, end)`` tuples of one API call."""
+
+    __slots__ = ()
+
+    def record(self, phase, start, end=None):
+        if end is None:
+            end = time.monotonic()
+        self.append((phase, start, end))
+
+
+class _TimedPhase:
+    __slots__ = ('_timings', '_phase', '_start')
+
+    def __init__(self, timings, phase):
+        self._timings = timings
+        self._phase = phase
+
+    def __enter__(self):
+        self._start = time.monotonic()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._timings.record(self._phase, self._start)
+
+
+def current_timings():
+    """Return the ``PhaseTimings`` of the current call, or None."""
+    return _current_timings.get()
+
+
+def timed_phase(phase):
+    """Context manager recording ``phase`` if the current call is timed."""
+    timings = _current_timings.get()
+    if timings is None:
+        return _NOT_TIMED
+    return _TimedPhase(timings, phase)
+
+
+def start_timings(enabled):
+    """Make a new ``PhaseTimings``, or None, current.
+
+    Also called when disabled, so a call does not record into the timings of
+    an enclosing call, e.g. when fetching credentials. Returns the timings
+    and a token for :func:`reset_timings`.
+    """
+    timings = PhaseTimings() if enabled else None
+    return timings, _current_timings.set(timings)
+
+
+def reset_timings(token):
+    _current_timings.reset(token)
+
+
+def with_phase_timings(func):
+    """Time the client API call ``func`` if its config asks for it."""
+
+    @wraps(func)
+    async def wrapper(self, operation_name, api_params):
+        timings, token = start_timings(
+            getattr(self.meta.config, 'collect_phase_timings', False)
+        )
+        try:
+            return await func(self, operation_name, api_params)
+        finally:
+            reset_timings(token)
+            if timings is not None:
+                service_id = self._service_model.service_id.hyphenize()
+                await self.meta.events.emit(
+                    f'phase-timings.{service_id}.{operation_name}',
+                    timings=timings,
+                    operation_name=operation_name,
+                )
+
+    return wrapper
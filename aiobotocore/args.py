@@ -12,6 +12,10 @@ from .signers import AioRequestSigner
 
 
 class AioClientArgsCreator(ClientArgsCreator):
+    def __init__(self, *args, http_session_registry=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._http_session_registry = http_session_registry
+
     # NOTE: we override this so we can pull out the custom AioConfig params and
     #       use an AioEndpointCreator
     async def get_client_args(
@@ -83,9 +87,32 @@ class AioClientArgsCreator(ClientArgsCreator):
             warm_up_loader_caches=getattr(
                 client_config, 'warm_up_loader_caches', False
             ),
+            share_http_session=getattr(
+                client_config, 'share_http_session', False
+            ),
+            socket_options=getattr(client_config, 'socket_options', None),
+            collect_phase_timings=getattr(
+                client_config, 'collect_phase_timings', False
+            ),
+            compile_endpoint_rulesets=getattr(
+                client_config, 'compile_endpoint_rulesets', False
+            ),
+            coalesce_operations=getattr(
+                client_config, 'coalesce_operations', ()
+            ),
+            response_cache=getattr(client_config, 'response_cache', None),
+            hedging=getattr(client_config, 'hedging', None),
+            circuit_breaker=getattr(client_config, 'circuit_breaker', None),
             **config_kwargs,
         )
+        # Options from the client config override botocore's defaults, since
+        # they are applied in order.
+        socket_options = socket_options + new_config.socket_options
         endpoint_creator = AioEndpointCreator(event_emitter)
+        if new_config.share_http_session:
+            http_session_registry = self._http_session_registry
+        else:
+            http_session_registry = None
 
         endpoint = endpoint_creator.create_endpoint(
             service_model,
@@ -101,6 +128,8 @@ class AioClientArgsCreator(ClientArgsCreator):
             client_cert=new_config.client_cert,
             proxies_config=new_config.proxies_config,
             connector_args=new_config.connector_args,
+            http_session_registry=http_session_registry,
+            hedging=new_config.hedging,
         )
 
         # Emit event to allow service-specific or customer customization of serializer kwargs
@@ -242,4 +271,14 @@ class AioClientArgsCreator(ClientArgsCreator):
             use_ssl=is_secure,
             requested_auth_scheme=sig_version,
             auth_scheme_preference=auth_scheme_preference,
+            compile_ruleset=getattr(
+                client_config, 'compile_endpoint_rulesets', False
+            ),
+            # Sessions loading their rules from other paths, e.g. with
+            # overridden rules, keep their own compiled rules.
+            ruleset_cache_key=(
+                service_model.service_name,
+                service_model.api_version,
+                tuple(getattr(self._loader, 'search_paths', ())),
+            ),
         )
@@ -1,16 +1,83 @@
 import botocore.utils
-from botocore.awsrequest import AWSResponse
+from botocore.awsrequest import AWSResponse, HeadersDict
+
+from ._timing import timed_phase
+
+
+def _lower(key):
+    # Other keys are looked up as they are, and are missing like in a dict.
+    return key.lower() if isinstance(key, str) else key
+
+
+class _LowercaseHeadersDict(dict):
+    """Response headers with lowercase keys and case-insensitive lookups.
+
+    The HTTP sessions build one of these from the transport's headers, and it
+    is used as is for ``AWSResponse.headers``, the parsers' response dict and
+    ``ResponseMetadata['HTTPHeaders']``. Being a plain dict with lowercase
+    keys, it compares equal to what ``lowercase_dict`` would produce.
+
+    The constructor does not lowercase; callers pass lowercase keys.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        return super().__getitem__(_lower(key))
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key.lower(), value)
+
+    def __delitem__(self, key):
+        super().__delitem__(key.lower())
+
+    def __contains__(self, key):
+        return isinstance(key, str) and super().__contains__(key.lower())
+
+    def get(self, key, default=None):
+        return super().get(_lower(key), default)
+
+    def pop(self, key, *args):
+        return super().pop(_lower(key), *args)
+
+    def setdefault(self, key, default=None):
+        return super().setdefault(key.lower(), default)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def copy(self):
+        return type(self)(self)
 
 
 class AioAWSResponse(AWSResponse):
     # Unlike AWSResponse, these return awaitables
 
+    def __init__(self, url, status_code, headers, raw):
+        self.url = url
+        self.status_code = status_code
+        # Headers from the HTTP sessions are already case-insensitive, so
+        # they are not copied into a HeadersDict.
+        if isinstance(headers, _LowercaseHeadersDict):
+            self.headers = headers
+        else:
+            self.headers = HeadersDict(headers)
+        self.raw = raw
+
+        self._content = None
+
+    # Set by the HTTP session when it reports on the connection used; copied
+    # to ResponseMetadata['HTTPConnection'] by the endpoint.
+    connection_metadata = None
+
     async def _content_prop(self):
         """Content of the response as bytes."""
 
         if self._content is None:
             # NOTE: this will cache the data in self.raw
-            self._content = await self.raw.read() or b''
+            with timed_phase('download'):
+                self._content = await self.raw.read() or b''
 
         return self._content
 
@@ -36,6 +103,7 @@ class HttpxAWSResponse(AioAWSResponse):
 
         if self._content is None:
             # NOTE: this will cache the data in self.raw
-            self._content = await self.raw.aread() or b''
+            with timed_phase('download'):
+                self._content = await self.raw.aread() or b''
 
         return self._content
@@ -8,6 +8,7 @@ from botocore.client import (
     logger,
     resolve_checksum_context,
 )
+from botocore.compat import urlsplit
 from botocore.compress import maybe_compress_request
 from botocore.discovery import block_endpoint_discovery_required_operations
 from botocore.exceptions import OperationNotPageableError, UnknownServiceError
@@ -19,6 +20,13 @@ from botocore.waiter import xform_name
 
 from . import waiter
 from ._async_primitives import AsyncPrimitives, infer_async_primitives
+from ._bulk import AnyioBulkCall, BulkCall
+from ._coalesce import (
+    AnyioRequestCoalescer,
+    RequestCoalescer,
+    with_request_coalescing,
+)
+from ._timing import current_timings, timed_phase, with_phase_timings
 from .args import AioClientArgsCreator
 from .context import with_current_context
 from .credentials import (
@@ -40,6 +48,10 @@ history_recorder = get_global_history_recorder()
 
 
 class AioClientCreator(ClientCreator):
+    def __init__(self, *args, http_session_registry=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._http_session_registry = http_session_registry
+
     async def create_client(
         self,
         service_name,
@@ -110,6 +122,7 @@ class AioClientCreator(ClientCreator):
         )
         service_client = cls(**client_args)
         self._register_retries(service_client)
+        self._register_circuit_breaker(service_client)
         self._register_s3_events(
             client=service_client,
             endpoint_bridge=None,
@@ -175,6 +188,14 @@ class AioClientCreator(ClientCreator):
             return
         register_feature_id(f'RETRY_MODE_{retry_mode.upper()}')
 
+    def _register_circuit_breaker(self, client):
+        circuit_breaker = client.meta.config.circuit_breaker
+        if circuit_breaker is not None:
+            circuit_breaker.register(
+                client.meta.events,
+                client.meta.service_model.service_id.hyphenize(),
+            )
+
     def _register_v2_standard_retries(self, client):
         max_attempts = client.meta.config.retries.get('total_max_attempts')
         kwargs = {'client': client}
@@ -310,6 +331,7 @@ class AioClientCreator(ClientCreator):
             self._exceptions_factory,
             config_store=self._config_store,
             user_agent_creator=self._user_agent_creator,
+            http_session_registry=self._http_session_registry,
         )
         return await args_creator.get_client_args(
             service_model,
@@ -328,6 +350,26 @@ class AioClientCreator(ClientCreator):
 
 
 class AioBaseClient(BaseClient):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # aiohttp is asyncio-only; the httpx backend also runs on trio.
+        async_primitives = infer_async_primitives(
+            type(self._endpoint.http_session)
+        )
+        if async_primitives is AsyncPrimitives.ANYIO:
+            coalescer_cls = AnyioRequestCoalescer
+            self._bulk_call_cls = AnyioBulkCall
+        else:
+            coalescer_cls = RequestCoalescer
+            self._bulk_call_cls = BulkCall
+        self._request_coalescer = coalescer_cls(
+            self.meta.config.coalesce_operations
+        )
+        if self.meta.config.response_cache is not None:
+            self.meta.config.response_cache.register(
+                self.meta.events, self._service_model.service_id.hyphenize()
+            )
+
     async def _async_getattr(self, item):
         event_name = (
             f'getattr.{self._service_model.service_id.hyphenize()}.{item}'
@@ -350,7 +392,136 @@ class AioBaseClient(BaseClient):
         """Closes underlying endpoint connections."""
         await self._endpoint.close()
 
+    async def warm_connections(self, n=1, endpoints=None):
+        """Open ``n`` pooled connections per endpoint ahead of time.
+
+        This takes DNS resolution, TCP connect and the TLS handshake out of
+        the path of the first requests. ``endpoints`` is an iterable of
+        endpoint URLs and ``(operation_name, params)`` pairs, where the
+        operation name may also be the client method's name. A pair is
+        warmed at the URL the endpoint ruleset resolves for that call, e.g.
+        ``('HeadBucket', {'Bucket': 'my-bucket'})`` for the bucket's S3
+        virtual-hosted endpoint. Defaults to the client's endpoint URL.
+        """
+        for url in await self._resolve_endpoint_urls(endpoints):
+            await self._endpoint.http_session.warm_connections(url, n)
+
+    async def prefetch_dns(self, endpoints=None):
+        """Resolve the hostnames of endpoints into the DNS cache.
+
+        ``endpoints`` takes the same values as in :meth:`warm_connections`.
+        This does nothing unless the HTTP session caches DNS results, which
+        for the httpx backend needs ``use_dns_cache``, ``ttl_dns_cache`` or
+        ``resolver`` in ``connector_args``.
+        """
+        hosts = []
+        for url in await self._resolve_endpoint_urls(endpoints):
+            parts = urlsplit(url)
+            port = parts.port or (443 if parts.scheme == 'https' else 80)
+            hosts.append((parts.hostname, port))
+        await self._endpoint.http_session.prefetch_dns(hosts)
+
+    def map(
+        self,
+        operation_name,
+        params,
+        concurrency=10,
+        ordered=True,
+        return_exceptions=False,
+    ):
+        """Call an operation with each of ``params``, a few at a time.
+
+        ``operation_name`` may also be the client method's name, or a
+        coroutine function to call with the parameters instead, and
+        ``params`` is an iterable or async iterable of parameter dicts,
+        which is consumed as calls are made::
+
+            keys = ({'Bucket': bucket, 'Key': key} for key in keys)
+            async with client.map('head_object', keys) as responses:
+                async for response in responses:
+                    ...
+
+        At most ``concurrency`` calls are in flight or have results not yet
+        consumed. Results come in the order of ``params``, or as the calls
+        complete if ``ordered`` is false. The first exception of a call is
+        raised and cancels the others, unless ``return_exceptions`` is true,
+        in which case exceptions are returned as results. Leaving the
+        ``async with`` block cancels the calls in flight.
+        """
+        if callable(operation_name):
+            func = operation_name
+        elif operation_name in self._PY_TO_OP_NAME:
+            func = getattr(self, operation_name)
+        else:
+            func = getattr(self, xform_name(operation_name))
+        return self._bulk_call_cls(
+            func,
+            params,
+            concurrency,
+            ordered,
+            return_exceptions,
+        )
+
+    def coalescing_info(self):
+        """Return how many calls to ``coalesce_operations`` were coalesced.
+
+        The result has the number of calls that made a request, of calls
+        that shared the request of another one, and of calls in flight.
+        """
+        return self._request_coalescer.info()
+
+    def hedging_info(self):
+        """Return how many requests were hedged, or None if disabled.
+
+        The result has the number of requests to the hedged operations,
+        including retries, of those that sent a second attempt, and of those
+        answered by the second attempt.
+        """
+        policy = self._endpoint.hedging_policy
+        return policy.info() if policy is not None else None
+
+    async def _resolve_endpoint_urls(self, endpoints):
+        if endpoints is None:
+            endpoints = [self.meta.endpoint_url]
+        urls = []
+        for endpoint in endpoints:
+            if isinstance(endpoint, str):
+                urls.append(endpoint)
+            else:
+                operation_name, params = endpoint
+                urls.append(
+                    await self._resolve_endpoint_url(operation_name, params)
+                )
+        # dict.fromkeys drops duplicates but keeps the order.
+        return list(dict.fromkeys(urls))
+
+    async def _resolve_endpoint_url(self, operation_name, api_params):
+        # The parts of _make_api_call that decide where a request goes.
+        operation_name = self._PY_TO_OP_NAME.get(
+            operation_name, operation_name
+        )
+        operation_model = self._service_model.operation_model(operation_name)
+        request_context = {
+            'client_region': self.meta.region_name,
+            'client_config': self.meta.config,
+            'has_streaming_input': operation_model.has_streaming_input,
+            'auth_type': operation_model.resolved_auth_type,
+            'unsigned_payload': operation_model.unsigned_payload,
+            'auth_options': self._service_model.metadata.get('auth'),
+        }
+        api_params = await self._emit_api_params(
+            api_params=api_params,
+            operation_model=operation_model,
+            context=request_context,
+        )
+        endpoint_url, _, _ = await self._resolve_endpoint_ruleset(
+            operation_model, api_params, request_context
+        )
+        return endpoint_url
+
+    @with_request_coalescing
     @with_current_context()
+    @with_phase_timings
     async def _make_api_call(self, operation_name, api_params):
         operation_model = self._service_model.operation_model(operation_name)
         service_name = self._service_model.service_name
@@ -392,24 +563,26 @@ class AioBaseClient(BaseClient):
             operation_model=operation_model,
             context=request_context,
         )
-        (
-            endpoint_url,
-            additional_headers,
-            properties,
-        ) = await self._resolve_endpoint_ruleset(
-            operation_model, api_params, request_context
-        )
+        with timed_phase('resolve_endpoint'):
+            (
+                endpoint_url,
+                additional_headers,
+                properties,
+            ) = await self._resolve_endpoint_ruleset(
+                operation_model, api_params, request_context
+            )
         if properties:
             # Pass arbitrary endpoint info with the Request
             # for use during construction.
             request_context['endpoint_properties'] = properties
-        request_dict = await self._convert_to_request_dict(
-            api_params=api_params,
-            operation_model=operation_model,
-            endpoint_url=endpoint_url,
-            context=request_context,
-            headers=additional_headers,
-        )
+        with timed_phase('serialize'):
+            request_dict = await self._convert_to_request_dict(
+                api_params=api_params,
+                operation_model=operation_model,
+                endpoint_url=endpoint_url,
+                context=request_context,
+                headers=additional_headers,
+            )
         resolve_checksum_context(request_dict, operation_model, api_params)
 
         service_id = self._service_model.service_id.hyphenize()
@@ -432,6 +605,10 @@ class AioBaseClient(BaseClient):
                 operation_model, request_dict, request_context
             )
 
+        timings = current_timings()
+        if timings is not None and 'ResponseMetadata' in parsed_response:
+            parsed_response['ResponseMetadata']['PhaseTimings'] = timings
+
         await self.meta.events.emit(
             f'after-call.{service_id}.{operation_name}',
             http_response=http,
@@ -671,8 +848,8 @@ class AioBaseClient(BaseClient):
         )
 
     async def __aenter__(self):
-        await self._endpoint.http_session.__aenter__()
+        await self._endpoint.__aenter__()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self._endpoint.http_session.__aexit__(exc_type, exc_val, exc_tb)
+        await self._endpoint.__aexit__(exc_type, exc_val, exc_tb)
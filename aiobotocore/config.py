@@ -1,7 +1,9 @@
 import collections.abc
 import copy
+import socket
 import ssl
 import sys
+from collections.abc import Iterable
 from typing import TypedDict, cast
 
 import botocore.client
@@ -9,10 +11,13 @@ from aiohttp import SocketFactoryType
 from aiohttp.abc import AbstractResolver
 from botocore.exceptions import ParamValidationError
 
+from . import _hedging, httpxresolver
 from ._constants import DEFAULT_KEEPALIVE_TIMEOUT
 from .endpoint import DEFAULT_HTTP_SESSION_CLS
 from .httpsession import AIOHTTPSession
 from .httpxsession import HttpxSession, is_httpx_session_cls
+from .response_cache import ResponseCache
+from .retries.circuitbreaker import CircuitBreaker
 
 if sys.version_info >= (3, 11):
     from typing import NotRequired
@@ -31,12 +36,51 @@ class _ConnectorArgs(TypedDict):
     write_timeout: NotRequired[float | None]
     pool_timeout: NotRequired[float | None]
     force_close: NotRequired[bool]
+    limit_per_host: NotRequired[int]
     ssl_context: NotRequired[ssl.SSLContext]
-    resolver: NotRequired[AbstractResolver]
+    resolver: NotRequired[AbstractResolver | httpxresolver.AbstractResolver]
     socket_factory: NotRequired[SocketFactoryType | None]
+    http2: NotRequired[bool]
 
 
+def _available_socket_options(*options):
+    # Options the platform does not define are left out of the profile.
+    return [
+        (level, getattr(socket, name), value)
+        for level, name, value in options
+        if hasattr(socket, name)
+    ]
+
+
+# Named sets of socket options selectable with AioConfig(socket_options=...).
+# They are applied after botocore's own socket options (TCP_NODELAY, plus
+# SO_KEEPALIVE when tcp_keepalive is enabled).
+SOCKET_OPTIONS_PROFILES = {
+    # Detect dead peers (e.g. connections dropped by a NAT gateway) within
+    # seconds instead of waiting for the kernel's default retransmissions.
+    'low_latency': _available_socket_options(
+        (socket.IPPROTO_TCP, 'TCP_NODELAY', 1),
+        (socket.SOL_SOCKET, 'SO_KEEPALIVE', 1),
+        (socket.IPPROTO_TCP, 'TCP_KEEPIDLE', 15),
+        (socket.IPPROTO_TCP, 'TCP_KEEPINTVL', 5),
+        (socket.IPPROTO_TCP, 'TCP_KEEPCNT', 3),
+        (socket.IPPROTO_TCP, 'TCP_USER_TIMEOUT', 15_000),
+    ),
+    # Large kernel buffers for multi-GB transfers over long fat pipes, with
+    # more lenient dead peer detection.
+    'bulk_transfer': _available_socket_options(
+        (socket.SOL_SOCKET, 'SO_RCVBUF', 4 * 1024 * 1024),
+        (socket.SOL_SOCKET, 'SO_SNDBUF', 4 * 1024 * 1024),
+        (socket.SOL_SOCKET, 'SO_KEEPALIVE', 1),
+        (socket.IPPROTO_TCP, 'TCP_KEEPIDLE', 60),
+        (socket.IPPROTO_TCP, 'TCP_KEEPINTVL', 15),
+        (socket.IPPROTO_TCP, 'TCP_KEEPCNT', 4),
+        (socket.IPPROTO_TCP, 'TCP_USER_TIMEOUT', 120_000),
+    ),
+}
+
 _HttpSessionType = AIOHTTPSession | HttpxSession
+_SocketOption = tuple[int, int, int | bytes]
 _OPTION_DEFAULT = object()
 
 
@@ -46,6 +90,14 @@ class AioConfig(botocore.client.Config):
         connector_args: _ConnectorArgs | None | object = _OPTION_DEFAULT,
         http_session_cls: type[_HttpSessionType] | object = _OPTION_DEFAULT,
         warm_up_loader_caches: bool | object = _OPTION_DEFAULT,
+        share_http_session: bool | object = _OPTION_DEFAULT,
+        socket_options: str | list[_SocketOption] | object = _OPTION_DEFAULT,
+        collect_phase_timings: bool | object = _OPTION_DEFAULT,
+        compile_endpoint_rulesets: bool | object = _OPTION_DEFAULT,
+        coalesce_operations: Iterable[str] | object = _OPTION_DEFAULT,
+        response_cache: ResponseCache | None | object = _OPTION_DEFAULT,
+        hedging: dict | None | object = _OPTION_DEFAULT,
+        circuit_breaker: CircuitBreaker | None | object = _OPTION_DEFAULT,
         **kwargs,
     ):
         aio_options = {}
@@ -61,6 +113,40 @@ class AioConfig(botocore.client.Config):
             aio_options['warm_up_loader_caches'] = warm_up_loader_caches
         else:
             warm_up_loader_caches = False
+        if share_http_session is not _OPTION_DEFAULT:
+            aio_options['share_http_session'] = share_http_session
+        else:
+            share_http_session = False
+        if socket_options is not _OPTION_DEFAULT:
+            aio_options['socket_options'] = socket_options
+        else:
+            socket_options = None
+        if collect_phase_timings is not _OPTION_DEFAULT:
+            aio_options['collect_phase_timings'] = collect_phase_timings
+        else:
+            collect_phase_timings = False
+        if compile_endpoint_rulesets is not _OPTION_DEFAULT:
+            aio_options['compile_endpoint_rulesets'] = (
+                compile_endpoint_rulesets
+            )
+        else:
+            compile_endpoint_rulesets = False
+        if coalesce_operations is not _OPTION_DEFAULT:
+            aio_options['coalesce_operations'] = coalesce_operations
+        else:
+            coalesce_operations = ()
+        if response_cache is not _OPTION_DEFAULT:
+            aio_options['response_cache'] = response_cache
+        else:
+            response_cache = None
+        if hedging is not _OPTION_DEFAULT:
+            aio_options['hedging'] = hedging
+        else:
+            hedging = None
+        if circuit_breaker is not _OPTION_DEFAULT:
+            aio_options['circuit_breaker'] = circuit_breaker
+        else:
+            circuit_breaker = None
 
         super().__init__(**kwargs)
         self._user_provided_options.update(aio_options)
@@ -72,9 +158,45 @@ class AioConfig(botocore.client.Config):
         )
         self.http_session_cls = cast(type[_HttpSessionType], http_session_cls)
         self.warm_up_loader_caches = cast(bool, warm_up_loader_caches)
+        self.share_http_session = cast(bool, share_http_session)
+        if not isinstance(self.share_http_session, bool):
+            raise ParamValidationError(
+                report='share_http_session value must be a boolean'
+            )
+        self.collect_phase_timings = cast(bool, collect_phase_timings)
+        if not isinstance(self.collect_phase_timings, bool):
+            raise ParamValidationError(
+                report='collect_phase_timings value must be a boolean'
+            )
+        self.compile_endpoint_rulesets = cast(bool, compile_endpoint_rulesets)
+        if not isinstance(self.compile_endpoint_rulesets, bool):
+            raise ParamValidationError(
+                report='compile_endpoint_rulesets value must be a boolean'
+            )
+        self.coalesce_operations = self._resolve_coalesce_operations(
+            coalesce_operations
+        )
+        if response_cache is not None and not isinstance(
+            response_cache, ResponseCache
+        ):
+            raise ParamValidationError(
+                report='response_cache must be a ResponseCache or None'
+            )
+        self.response_cache = cast(ResponseCache | None, response_cache)
+        self.hedging = self._resolve_hedging(hedging)
+        if circuit_breaker is not None and not isinstance(
+            circuit_breaker, CircuitBreaker
+        ):
+            raise ParamValidationError(
+                report='circuit_breaker must be a CircuitBreaker or None'
+            )
+        self.circuit_breaker = cast(CircuitBreaker | None, circuit_breaker)
         self._validate_connector_args(
             self.connector_args, self.http_session_cls
         )
+        self.socket_options: list[_SocketOption] = (
+            self._resolve_socket_options(socket_options)
+        )
 
         if 'keepalive_timeout' not in self.connector_args:
             self.connector_args['keepalive_timeout'] = (
@@ -87,6 +209,93 @@ class AioConfig(botocore.client.Config):
         config_options.update(other_config._user_provided_options)
         return AioConfig(**config_options)
 
+    @staticmethod
+    def _resolve_socket_options(socket_options) -> list[_SocketOption]:
+        if socket_options is None:
+            return []
+        if isinstance(socket_options, str):
+            if socket_options not in SOCKET_OPTIONS_PROFILES:
+                raise ParamValidationError(
+                    report=f'unknown socket_options profile: {socket_options}'
+                )
+            return list(SOCKET_OPTIONS_PROFILES[socket_options])
+        if not isinstance(socket_options, (list, tuple)):
+            raise ParamValidationError(
+                report='socket_options must be a profile name or a list'
+            )
+        resolved = []
+        for option in socket_options:
+            if (
+                not isinstance(option, tuple)
+                or len(option) != 3
+                or not all(isinstance(v, int) for v in option[:2])
+                or not isinstance(option[2], (int, bytes))
+            ):
+                raise ParamValidationError(
+                    report=f'invalid socket option: {option!r}, expected '
+                    f'a (level, option, value) tuple'
+                )
+            resolved.append(option)
+        return resolved
+
+    @staticmethod
+    def _resolve_coalesce_operations(operations) -> frozenset[str]:
+        if (
+            operations is None
+            or isinstance(operations, str)
+            or not isinstance(operations, collections.abc.Iterable)
+        ):
+            raise ParamValidationError(
+                report='coalesce_operations must be a list of operation names'
+            )
+        operations = frozenset(operations)
+        if not all(isinstance(name, str) for name in operations):
+            raise ParamValidationError(
+                report='coalesce_operations must be a list of operation names'
+            )
+        return operations
+
+    @staticmethod
+    def _resolve_hedging(hedging) -> dict | None:
+        if hedging is None:
+            return None
+        if not isinstance(hedging, dict):
+            raise ParamValidationError(report='hedging must be a dict or None')
+        unknown = hedging.keys() - _hedging.OPTIONS
+        if unknown:
+            raise ParamValidationError(
+                report=f'unknown hedging options: {", ".join(sorted(unknown))}'
+            )
+        operations = hedging.get('operations')
+        if (
+            operations is None
+            or isinstance(operations, str)
+            or not isinstance(operations, collections.abc.Iterable)
+            or not all(isinstance(name, str) for name in operations)
+        ):
+            raise ParamValidationError(
+                report='hedging operations must be a list of operation names'
+            )
+        for name, valid, message in (
+            ('delay', lambda v: v >= 0, 'a number >= 0'),
+            ('percentile', lambda v: 0 < v < 100, 'between 0 and 100'),
+            ('budget', lambda v: v > 0, 'a number > 0'),
+        ):
+            value = hedging.get(name)
+            if value is None:
+                continue
+            if (
+                isinstance(value, bool)
+                or not isinstance(value, (int, float))
+                or not valid(value)
+            ):
+                raise ParamValidationError(
+                    report=f'hedging {name} must be {message}'
+                )
+        return {
+            name: value for name, value in hedging.items() if value is not None
+        }
+
     @staticmethod
     def _validate_connector_args(
         connector_args: _ConnectorArgs,
@@ -95,10 +304,6 @@ class AioConfig(botocore.client.Config):
         for k, v in connector_args.items():
             # verify_ssl is handled by verify parameter to create_client
             if k == 'use_dns_cache':
-                if is_httpx_session_cls(http_session_cls):
-                    raise ParamValidationError(
-                        report='Httpx does not support dns caching. https://github.com/encode/httpx/discussions/2211'
-                    )
                 if not isinstance(v, bool):
                     raise ParamValidationError(
                         report=f'{k} value must be a boolean'
@@ -123,6 +328,15 @@ class AioConfig(botocore.client.Config):
                         report=f'{k} value must be a boolean'
                     )
             # limit is handled by max_pool_connections
+            elif k == 'limit_per_host':
+                if is_httpx_session_cls(http_session_cls):
+                    raise ParamValidationError(
+                        report=f'Httpx backend does not support {k}.'
+                    )
+                if not isinstance(v, int) or isinstance(v, bool) or v < 0:
+                    raise ParamValidationError(
+                        report=f'{k} value must be a non-negative int'
+                    )
             elif k == 'ssl_context':
                 if not isinstance(v, ssl.SSLContext):
                     raise ParamValidationError(
@@ -130,10 +344,12 @@ class AioConfig(botocore.client.Config):
                     )
             elif k == "resolver":
                 if is_httpx_session_cls(http_session_cls):
-                    raise ParamValidationError(
-                        report=f'Httpx backend does not support {k}.'
-                    )
-                if not isinstance(v, AbstractResolver):
+                    if not isinstance(v, httpxresolver.AbstractResolver):
+                        raise ParamValidationError(
+                            report=f'{k} must be an instance of '
+                            'aiobotocore.httpxresolver.AbstractResolver'
+                        )
+                elif not isinstance(v, AbstractResolver):
                     raise ParamValidationError(
                         report=f'{k} must be an instance of a AbstractResolver'
                     )
@@ -148,5 +364,14 @@ class AioConfig(botocore.client.Config):
                     raise ParamValidationError(
                         report=f'{k} must be a callable'
                     )
+            elif k == 'http2':
+                if not is_httpx_session_cls(http_session_cls):
+                    raise ParamValidationError(
+                        report=f'Aiohttp backend does not support {k}.'
+                    )
+                if not isinstance(v, bool):
+                    raise ParamValidationError(
+                        report=f'{k} value must be a boolean'
+                    )
             else:
                 raise ParamValidationError(report=f'invalid connector_arg:{k}')
@@ -12,14 +12,20 @@ from botocore.context import (
 from ._helpers import resolve_awaitable
 
 
-@asynccontextmanager
-async def start_as_current_context(ctx=None):
+def _new_context(ctx=None):
     current = ctx or get_context()
     if current is None:
-        new = ClientContext()
-    else:
-        new = deepcopy(current)
-    token = set_context(new)
+        return ClientContext()
+    if type(current) is ClientContext:
+        # What deepcopy would make, without its overhead on every API call.
+        # The copy is taken now, as the parent may run on in another task.
+        return ClientContext(set(current.features))
+    return deepcopy(current)
+
+
+@asynccontextmanager
+async def start_as_current_context(ctx=None):
+    token = set_context(_new_context(ctx))
     try:
         yield
     finally:
@@ -30,10 +36,14 @@ def with_current_context(hook=None):
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            async with start_as_current_context():
+            # start_as_current_context inlined, as this wraps every API call.
+            token = set_context(_new_context())
+            try:
                 if hook:
                     await resolve_awaitable(hook())
                 return await func(*args, **kwargs)
+            finally:
+                reset_context(token)
 
         return wrapper
 
@@ -0,0 +1,103 @@
+"""End-to-end deadlines for API calls.
+
+``connect_timeout`` and ``read_timeout`` bound each socket operation, and
+retries may add up to far more than the caller can wait. A deadline bounds
+everything done for the calls made in its scope::
+
+    with deadline(2.5):
+        response = await client.get_object(Bucket=bucket, Key=key)
+        async with response['Body'] as stream:
+            data = await stream.read()
+
+Within it:
+
+- A retry is not made if its backoff would not end before the deadline, so
+  the error of the last attempt is raised instead.
+- Sending a request, which covers waiting for a pooled connection,
+  connecting and reading the response, fails with
+  :class:`DeadlineExceededError` when the deadline passes.
+- So do reads of streamed response bodies, even after leaving the scope.
+
+The deadline is kept in a context variable, so it also applies to tasks
+started in its scope. Nested scopes cannot extend the deadline of an outer
+one.
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from botocore.exceptions import BotoCoreError
+
+_current_deadline = ContextVar('aiobotocore_deadline', default=None)
+
+
+class DeadlineExceededError(BotoCoreError):
+    fmt = 'The deadline of the call was exceeded'
+
+
+class Deadline:
+    """A point in ``time.monotonic()`` time by which calls must be done."""
+
+    __slots__ = ('expires_at',)
+
+    def __init__(self, timeout):
+        self.expires_at = time.monotonic() + timeout
+
+    def remaining(self):
+        """Return the seconds left, negative once the deadline passed."""
+        return self.expires_at - time.monotonic()
+
+    def expired(self):
+        return self.remaining() <= 0
+
+    async def wait_for(self, func, *args):
+        """Return ``await func(*args)``, cancelled at the deadline.
+
+        For asyncio only, see :meth:`anyio_wait_for`.
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceededError()
+        try:
+            return await asyncio.wait_for(func(*args), remaining)
+        except asyncio.TimeoutError:
+            # A timeout of ``func`` itself is not ours to rename.
+            if not self.expired():
+                raise
+            raise DeadlineExceededError() from None
+
+    async def anyio_wait_for(self, func, *args):
+        """Like :meth:`wait_for`, on any event loop supported by anyio."""
+        import anyio
+
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceededError()
+        with anyio.move_on_after(remaining):
+            return await func(*args)
+        raise DeadlineExceededError()
+
+
+def current_deadline():
+    """Return the :class:`Deadline` of the current scope, or None."""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline(timeout):
+    """Make calls in this scope fail once ``timeout`` seconds have passed.
+
+    Yields the :class:`Deadline`, which is that of an enclosing scope if it
+    expires first.
+    """
+    new = Deadline(timeout)
+    outer = _current_deadline.get()
+    if outer is not None and outer.expires_at <= new.expires_at:
+        new = outer
+    token = _current_deadline.set(new)
+    try:
+        yield new
+    finally:
+        _current_deadline.reset(token)
@@ -1,4 +1,6 @@
 import asyncio
+import copy
+import time
 
 from botocore.endpoint import (
     DEFAULT_TIMEOUT,
@@ -13,12 +15,16 @@ from botocore.endpoint import (
     logger,
 )
 from botocore.hooks import first_non_none_response
+from botocore.retries.standard import ThrottledRetryableChecker
 
 from aiobotocore._async_primitives import (
     AsyncPrimitives,
     infer_async_primitives,
 )
+from aiobotocore._hedging import HedgingPolicy
 from aiobotocore._httpx import httpx
+from aiobotocore._timing import timed_phase
+from aiobotocore.deadline import current_deadline
 from aiobotocore.httpchecksum import handle_checksum_body
 from aiobotocore.httpsession import AIOHTTPSession
 from aiobotocore.parsers import AioResponseParserFactory
@@ -26,6 +32,26 @@ from aiobotocore.response import AioHttpxStreamingBody, AioStreamingBody
 
 DEFAULT_HTTP_SESSION_CLS = AIOHTTPSession
 
+_THROTTLED_ERROR_CODES = frozenset(
+    ThrottledRetryableChecker._THROTTLED_ERROR_CODES
+)
+
+
+def _hedge_won(result):
+    """Whether a hedged attempt has a response worth cancelling the other.
+
+    Server errors and throttling would be retried, which the other attempt
+    may save.
+    """
+    success_response, exception = result
+    if exception is not None:
+        return False
+    http_response, parsed_response = success_response
+    if http_response.status_code >= 500 or http_response.status_code == 429:
+        return False
+    error_code = parsed_response.get('Error', {}).get('Code')
+    return error_code not in _THROTTLED_ERROR_CODES
+
 
 async def convert_to_response_dict(http_response, operation_model):
     """Convert an HTTP response object to a request dict.
@@ -74,6 +100,8 @@ class AioEndpoint(Endpoint):
         event_emitter,
         response_parser_factory=None,
         http_session=None,
+        http_session_shared=False,
+        hedging=None,
     ):
         if response_parser_factory is None:
             response_parser_factory = AioResponseParserFactory()
@@ -88,9 +116,38 @@ class AioEndpoint(Endpoint):
             response_parser_factory=response_parser_factory,
             http_session=http_session,
         )
+        # A shared session belongs to the AioSession; this endpoint only
+        # holds a reference to it, taken on entry and released on exit.
+        self._http_session_shared = http_session_shared
+        self._http_session_ref = None
+        self.hedging_policy = (
+            HedgingPolicy(**hedging) if hedging is not None else None
+        )
+
+    async def __aenter__(self):
+        if self._http_session_shared:
+            ref = self.http_session.acquire()
+            await ref.__aenter__()
+            self._http_session_ref = ref
+        else:
+            await self.http_session.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._http_session_shared:
+            ref, self._http_session_ref = self._http_session_ref, None
+            if ref is not None:
+                await ref.__aexit__(exc_type, exc_val, exc_tb)
+        else:
+            await self.http_session.__aexit__(exc_type, exc_val, exc_tb)
 
     async def close(self):
-        await self.http_session.close()
+        if self._http_session_shared:
+            # Only release this client's reference; other clients of the
+            # AioSession may still be using the pool.
+            await self.__aexit__(None, None, None)
+        else:
+            await self.http_session.close()
 
     async def create_request(self, params, operation_model=None):
         request = create_request_object(params)
@@ -116,8 +173,8 @@ class AioEndpoint(Endpoint):
         context = request_dict['context']
         self._update_retries_context(context, attempts)
         request = await self.create_request(request_dict, operation_model)
-        success_response, exception = await self._get_response(
-            request, operation_model, context
+        success_response, exception = await self._get_hedged_response(
+            request_dict, request, operation_model, context
         )
         while await self._needs_retry(
             attempts,
@@ -135,8 +192,8 @@ class AioEndpoint(Endpoint):
             request.reset_stream()
             # Create a new request when retried (including a new signature).
             request = await self.create_request(request_dict, operation_model)
-            success_response, exception = await self._get_response(
-                request, operation_model, context
+            success_response, exception = await self._get_hedged_response(
+                request_dict, request, operation_model, context
             )
         if (
             success_response is not None
@@ -147,11 +204,116 @@ class AioEndpoint(Endpoint):
             success_response[1]['ResponseMetadata']['RetryAttempts'] = (
                 total_retries
             )
+            connection_metadata = getattr(
+                success_response[0], 'connection_metadata', None
+            )
+            if connection_metadata is not None:
+                success_response[1]['ResponseMetadata']['HTTPConnection'] = (
+                    connection_metadata
+                )
         if exception is not None:
             raise exception
         else:
             return success_response
 
+    async def _get_hedged_response(
+        self, request_dict, request, operation_model, context
+    ):
+        """Like ``_get_response``, hedged if the operation should be."""
+        policy = self.hedging_policy
+        delay = (
+            policy.hedge_delay(operation_model) if policy is not None else None
+        )
+        if delay is None:
+            return await self._get_response(request, operation_model, context)
+
+        # The hedge's handlers run concurrently with the primary's.
+        hedge_context = copy.copy(context)
+
+        async def attempt(request=None, context=hedge_context, primary=False):
+            start = time.monotonic()
+            if request is None:
+                try:
+                    request = await self.create_request(
+                        request_dict, operation_model
+                    )
+                except Exception as e:
+                    return None, e
+            completed = False
+            try:
+                result = await self._get_response(
+                    request, operation_model, context
+                )
+                completed = True
+                return result
+            finally:
+                # A primary cancelled as the hedge won took at least as long
+                # as it ran. Leaving it out would cut the latencies off at
+                # the delay, which would then keep shrinking.
+                if completed or primary:
+                    policy.record_latency(operation_model.name, start)
+
+        results = await self._race_hedged(
+            lambda: attempt(request, context, primary=True),
+            attempt,
+            delay,
+            policy.acquire_hedge,
+        )
+        # The first response that will not be retried wins, or else the
+        # first result.
+        winner = next(
+            (result for result in results if _hedge_won(result[1])),
+            results[0],
+        )
+        if winner[0]:
+            policy.record_hedge_win()
+            context.update(hedge_context)
+        for result in results:
+            if result is not winner:
+                await self._discard_response(result[1], operation_model)
+        return winner[1]
+
+    async def _race_hedged(self, primary, hedge, delay, acquire_hedge):
+        """Run ``primary``, and ``hedge`` if it takes longer than ``delay``.
+
+        Returns ``(is_hedge, result)`` for each attempt that completed, in
+        order. The other attempt is cancelled once one has a response that
+        will not be retried.
+        """
+        tasks = {asyncio.ensure_future(primary()): False}
+        completed = []
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and acquire_hedge():
+                tasks[asyncio.ensure_future(hedge())] = True
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                completed.extend(done)
+                if any(_hedge_won(task.result()) for task in done):
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        # An attempt may have completed before it could be cancelled.
+        completed.extend(
+            task
+            for task in tasks
+            if not task.cancelled() and task not in completed
+        )
+        return [(tasks[task], task.result()) for task in completed]
+
+    async def _discard_response(self, result, operation_model):
+        """Release the streamed body of a hedged attempt that lost."""
+        success_response, _ = result
+        if success_response is not None:
+            body = success_response[1].get('Body')
+            if operation_model.has_streaming_output and body is not None:
+                await body.aclose()
+
     async def _get_response(self, request, operation_model, context):
         # This will return a tuple of (success_response, exception)
         # and success_response is itself a tuple of
@@ -235,9 +397,10 @@ class AioEndpoint(Endpoint):
             customized_response_dict=customized_response_dict,
         )
         parser = self._response_parser_factory.create_parser(protocol)
-        parsed_response = await parser.parse(
-            response_dict, operation_model.output_shape
-        )
+        with timed_phase('parse'):
+            parsed_response = await parser.parse(
+                response_dict, operation_model.output_shape
+            )
         parsed_response.update(customized_response_dict)
 
         if http_response.status_code >= 300:
@@ -268,7 +431,8 @@ class AioEndpoint(Endpoint):
         # TODO: avoid naming conflicts with ResponseMetadata and Error
         parsed_response.update(modeled_parse)
 
-    # NOTE: The only line changed here changing time.sleep to asyncio.sleep
+    # NOTE: The only changes here are time.sleep to asyncio.sleep, and not
+    # retrying past the deadline of the call.
     async def _needs_retry(
         self,
         attempts,
@@ -289,8 +453,14 @@ class AioEndpoint(Endpoint):
             request_dict=request_dict,
         )
         handler_response = first_non_none_response(responses)
+        deadline = current_deadline()
         if handler_response is None or handler_response is False:
             return False
+        elif deadline is not None and handler_response >= deadline.remaining():
+            logger.debug(
+                "Not retrying, the deadline would pass before the retry"
+            )
+            return False
         else:
             # Request needs to be retried, and we need to sleep
             # for the specified number of times.
@@ -305,6 +475,9 @@ class AioEndpoint(Endpoint):
         await asyncio.sleep(sleep_amount)
 
     async def _send(self, request):
+        deadline = current_deadline()
+        if deadline is not None:
+            return await deadline.wait_for(self.http_session.send, request)
         return await self.http_session.send(request)
 
 
@@ -318,6 +491,38 @@ class AnyioEndpoint(AioEndpoint):
 
         await anyio.sleep(sleep_amount)
 
+    async def _send(self, request):
+        deadline = current_deadline()
+        if deadline is not None:
+            return await deadline.anyio_wait_for(
+                self.http_session.send, request
+            )
+        return await self.http_session.send(request)
+
+    async def _race_hedged(self, primary, hedge, delay, acquire_hedge):
+        import anyio
+
+        results = []
+        started = 1
+        finished = anyio.Event()
+
+        async def run(func, is_hedge):
+            result = await func()
+            results.append((is_hedge, result))
+            if _hedge_won(result) or len(results) == started:
+                finished.set()
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(run, primary, False)
+            with anyio.move_on_after(delay):
+                await finished.wait()
+            if not finished.is_set() and acquire_hedge():
+                started = 2
+                tg.start_soon(run, hedge, True)
+            await finished.wait()
+            tg.cancel_scope.cancel()
+        return results
+
 
 class AioEndpointCreator(EndpointCreator):
     def create_endpoint(
@@ -335,6 +540,8 @@ class AioEndpointCreator(EndpointCreator):
         client_cert=None,
         proxies_config=None,
         connector_args=None,
+        http_session_registry=None,
+        hedging=None,
     ):
         if not is_valid_endpoint_url(
             endpoint_url
@@ -346,7 +553,7 @@ class AioEndpointCreator(EndpointCreator):
         endpoint_prefix = service_model.endpoint_prefix
 
         logger.debug('Setting %s timeout as %s', endpoint_prefix, timeout)
-        http_session = http_session_cls(
+        http_session_kwargs = dict(
             timeout=timeout,
             proxies=proxies,
             verify=self._get_verify_value(verify),
@@ -356,6 +563,12 @@ class AioEndpointCreator(EndpointCreator):
             proxies_config=proxies_config,
             connector_args=connector_args,
         )
+        if http_session_registry is not None:
+            http_session = http_session_registry.get_session(
+                http_session_cls, **http_session_kwargs
+            )
+        else:
+            http_session = http_session_cls(**http_session_kwargs)
 
         if infer_async_primitives(http_session_cls) is AsyncPrimitives.ANYIO:
             endpoint_cls = AnyioEndpoint
@@ -368,4 +581,6 @@ class AioEndpointCreator(EndpointCreator):
             event_emitter=self._event_emitter,
             response_parser_factory=response_parser_factory,
             http_session=http_session,
+            http_session_shared=http_session_registry is not None,
+            hedging=hedging,
         )
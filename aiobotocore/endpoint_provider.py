@@ -0,0 +1,354 @@
+"""Endpoint rule sets compiled into Python closures.
+
+botocore's :class:`~botocore.endpoint_provider.RuleSet` interprets the
+``endpoint-rule-set-1`` JSON on every resolution: each argument is
+classified as a function, reference, template or literal, function names are
+normalized and looked up, template strings are re-parsed and the scope is
+copied for every rule. Wide rule sets like S3's evaluate hundreds of
+conditions that way for every new bucket or region.
+
+:func:`compile_rules` does that work once, turning the rules into a tree of
+closures with the same semantics, and :class:`CompiledEndpointProvider` uses
+them in place of the interpreter. Compiled rules only depend on the rule
+JSON, so they are shared by every client of a service in the process whose
+rules are loaded from the same data paths.
+"""
+
+from string import Formatter
+
+from botocore.endpoint_provider import (
+    EndpointProvider,
+    RuleSet,
+    RuleSetEndpoint,
+    RuleSetStandardLibrary,
+)
+from botocore.exceptions import EndpointResolutionError
+
+STRING_FORMATTER = Formatter()
+
+# Only used for its stateless helpers.
+_RULE_LIB = RuleSetStandardLibrary(None)
+
+# Functions comparing values of a single type, see _compile_equals().
+_EQUALS_TYPES = {'boolean_equals': bool, 'string_equals': str}
+
+# Compiled rules by cache key, usually the service and the loader's search
+# paths, along with the rule JSON they were compiled from.
+_compiled_rules = {}
+
+
+def _constant(value):
+    return lambda scope, rule_lib: value
+
+
+def _compile_template(value):
+    try:
+        parts = [
+            (literal, None if reference is None else reference.split('#'))
+            for literal, reference, _, _ in STRING_FORMATTER.parse(value)
+        ]
+    except ValueError:
+        # Malformed templates only fail if they are ever evaluated.
+        return lambda scope, rule_lib: rule_lib.resolve_template_string(
+            value, scope
+        )
+
+    if len(parts) == 1 and parts[0][1] is None:
+        return _constant(parts[0][0])
+
+    def resolve_template(scope, rule_lib):
+        result = ''
+        for literal, path in parts:
+            if path is None:
+                result += literal
+                continue
+            template_value = scope
+            for param in path:
+                template_value = template_value[param]
+            result += f'{literal}{template_value}'
+        return result
+
+    return resolve_template
+
+
+def _compile_value(value):
+    """Compile the equivalent of ``RuleSetStandardLibrary.resolve_value``."""
+    if _RULE_LIB.is_func(value):
+        return _compile_function(value)
+    elif _RULE_LIB.is_ref(value):
+        ref = value['ref']
+        return lambda scope, rule_lib: scope.get(ref)
+    elif _RULE_LIB.is_template(value):
+        return _compile_template(value)
+    return _constant(value)
+
+
+def _compile_equals(func, func_name, argv, args):
+    """Compare against a literal without going through the rule library.
+
+    Values of the wrong type still go through it, to raise its error.
+    """
+    value_type = _EQUALS_TYPES[func_name]
+
+    def is_literal(value):
+        return isinstance(value, value_type) and not _RULE_LIB.is_template(
+            value
+        )
+
+    if is_literal(argv[1]):
+        arg, expected = args[0], argv[1]
+
+        def equals(scope, rule_lib):
+            value = arg(scope, rule_lib)
+            if isinstance(value, value_type):
+                return value == expected
+            return func(rule_lib, value, expected)
+
+    elif is_literal(argv[0]):
+        arg, expected = args[1], argv[0]
+
+        def equals(scope, rule_lib):
+            value = arg(scope, rule_lib)
+            if isinstance(value, value_type):
+                return value == expected
+            return func(rule_lib, expected, value)
+
+    else:
+        return None
+    return equals
+
+
+def _compile_call(func_name, argv):
+    args = [_compile_value(arg) for arg in argv]
+
+    if func_name == 'is_set' and len(args) == 1:
+        (arg,) = args
+        return lambda scope, rule_lib: arg(scope, rule_lib) is not None
+    if func_name == '_not' and len(args) == 1:
+        (arg,) = args
+        return lambda scope, rule_lib: not arg(scope, rule_lib)
+
+    func = getattr(RuleSetStandardLibrary, func_name, None)
+    if func_name in _EQUALS_TYPES and len(args) == 2:
+        equals = _compile_equals(func, func_name, argv, args)
+        if equals is not None:
+            return equals
+    if func is None:
+        # Unknown functions only fail if they are ever called, as with the
+        # interpreter.
+        return lambda scope, rule_lib: getattr(rule_lib, func_name)(
+            *[arg(scope, rule_lib) for arg in args]
+        )
+    if len(args) == 1:
+        (arg,) = args
+        return lambda scope, rule_lib: func(rule_lib, arg(scope, rule_lib))
+    if len(args) == 2:
+        arg1, arg2 = args
+        return lambda scope, rule_lib: func(
+            rule_lib, arg1(scope, rule_lib), arg2(scope, rule_lib)
+        )
+    return lambda scope, rule_lib: func(
+        rule_lib, *[arg(scope, rule_lib) for arg in args]
+    )
+
+
+def _compile_function(func_signature):
+    """Compile the equivalent of ``RuleSetStandardLibrary.call_function``."""
+    call = _compile_call(
+        _RULE_LIB.convert_func_name(func_signature['fn']),
+        func_signature['argv'],
+    )
+    if 'assign' not in func_signature:
+        return call
+
+    assign = func_signature['assign']
+
+    def call_and_assign(scope, rule_lib):
+        result = call(scope, rule_lib)
+        if assign in scope:
+            raise EndpointResolutionError(
+                msg=f"Assignment {assign} already exists in "
+                "scoped variables and cannot be overwritten"
+            )
+        scope[assign] = result
+        return result
+
+    return call_and_assign
+
+
+def _assigns(value):
+    """Whether evaluating ``value`` can add to the scope."""
+    if isinstance(value, dict):
+        return 'assign' in value or any(map(_assigns, value.values()))
+    if isinstance(value, list):
+        return any(map(_assigns, value))
+    return False
+
+
+def _compile_properties(properties):
+    """Compile the equivalent of ``EndpointRule.resolve_properties``."""
+    if isinstance(properties, list):
+        items = [_compile_properties(prop) for prop in properties]
+        return lambda scope, rule_lib: [
+            item(scope, rule_lib) for item in items
+        ]
+    elif isinstance(properties, dict):
+        items = [
+            (key, _compile_properties(value))
+            for key, value in properties.items()
+        ]
+        return lambda scope, rule_lib: {
+            key: item(scope, rule_lib) for key, item in items
+        }
+    elif _RULE_LIB.is_template(properties):
+        return _compile_template(properties)
+    return _constant(properties)
+
+
+def _compile_headers(headers):
+    """Compile the equivalent of ``EndpointRule.resolve_headers``."""
+    items = [
+        (header, [_compile_value(item) for item in values])
+        for header, values in headers.items()
+    ]
+    return lambda scope, rule_lib: {
+        header: [value(scope, rule_lib) for value in values]
+        for header, values in items
+    }
+
+
+def _compile_endpoint(endpoint):
+    url = _compile_value(endpoint['url'])
+    properties = _compile_properties(endpoint.get('properties', {}))
+    headers = _compile_headers(endpoint.get('headers', {}))
+
+    def resolve_endpoint(scope, rule_lib):
+        return RuleSetEndpoint(
+            url=url(scope, rule_lib),
+            properties=properties(scope, rule_lib),
+            headers=headers(scope, rule_lib),
+        )
+
+    return resolve_endpoint
+
+
+def _compile_error(error):
+    message = _compile_value(error)
+
+    def raise_error(scope, rule_lib):
+        raise EndpointResolutionError(msg=message(scope, rule_lib))
+
+    return raise_error
+
+
+def _compile_rule_list(rules):
+    """Compile rules evaluated in order until one of them matches.
+
+    Each rule gets its own copy of the scope, like with the interpreter, but
+    only if it assigns to it. Nested rules get their own copies in turn.
+    """
+    compiled = [
+        (
+            _compile_rule(rule),
+            _assigns({k: v for k, v in rule.items() if k != 'rules'}),
+        )
+        for rule in rules
+    ]
+
+    def evaluate_rules(scope, rule_lib):
+        for rule, copy_scope in compiled:
+            result = rule(scope.copy() if copy_scope else scope, rule_lib)
+            if result:
+                return result
+        return None
+
+    return evaluate_rules
+
+
+def _compile_rule(rule):
+    rule_type = rule.get('type')
+    if rule_type == 'endpoint':
+        action = _compile_endpoint(rule['endpoint'])
+    elif rule_type == 'error':
+        action = _compile_error(rule['error'])
+    elif rule_type == 'tree':
+        action = _compile_rule_list(rule['rules'])
+    else:
+        raise EndpointResolutionError(
+            msg=f"Unknown rule type: {rule_type}. A rule must "
+            "be of type tree, endpoint or error."
+        )
+
+    conditions = [_compile_function(func) for func in rule['conditions']]
+    if not conditions:
+        return action
+
+    def evaluate_rule(scope, rule_lib):
+        for condition in conditions:
+            result = condition(scope, rule_lib)
+            if result is False or result is None:
+                return None
+        return action(scope, rule_lib)
+
+    return evaluate_rule
+
+
+def compile_rules(rules, cache_key=None):
+    """Compile the ``rules`` of an endpoint rule set.
+
+    Returns a callable taking the processed input parameters and a
+    ``RuleSetStandardLibrary`` that returns a ``RuleSetEndpoint``, raises
+    ``EndpointResolutionError`` or returns ``None``, like the interpreter.
+
+    With a ``cache_key``, compiled rules are reused for equal rules with the
+    same key, e.g. by clients created from different sessions.
+    """
+    if cache_key is not None:
+        cached = _compiled_rules.get(cache_key)
+        # Comparing the rules is cheap when they come from the same loader.
+        if cached is not None and cached[0] == rules:
+            return cached[1]
+
+    compiled = _compile_rule_list(rules)
+    if cache_key is not None:
+        _compiled_rules[cache_key] = (rules, compiled)
+    return compiled
+
+
+class CompiledRuleSet(RuleSet):
+    """A ``RuleSet`` that evaluates compiled rules."""
+
+    def __init__(
+        self,
+        version,
+        parameters,
+        rules,
+        partitions,
+        documentation=None,
+        cache_key=None,
+    ):
+        self.version = version
+        self.parameters = self._ingest_parameter_spec(parameters)
+        self.rules = compile_rules(rules, cache_key)
+        self.rule_lib = RuleSetStandardLibrary(partitions)
+        self.documentation = documentation
+
+    def evaluate(self, input_parameters):
+        self.process_input_parameters(input_parameters)
+        return self.rules(input_parameters.copy(), self.rule_lib)
+
+
+class CompiledEndpointProvider(EndpointProvider):
+    """An ``EndpointProvider`` that evaluates compiled rules."""
+
+    def __init__(
+        self,
+        ruleset_data,
+        partition_data,
+        excluded_params=None,
+        cache_key=None,
+    ):
+        self.ruleset = CompiledRuleSet(
+            **ruleset_data, partitions=partition_data, cache_key=cache_key
+        )
+        self._excluded_params = excluded_params or frozenset()
@@ -1,3 +1,6 @@
+import inspect
+import logging
+
 from botocore.handlers import (
     inject_presigned_url_ec2 as boto_inject_presigned_url_ec2,
 )
@@ -21,7 +24,6 @@ from botocore.signers import (
     add_generate_presigned_url as boto_add_generate_presigned_url,
 )
 
-from ._helpers import resolve_awaitable
 from .handlers import (
     inject_presigned_url_ec2,
     inject_presigned_url_rds,
@@ -45,27 +47,52 @@ _HANDLER_MAPPING = {
 }
 
 
+def _is_async_handler(handler):
+    # iscoroutinefunction sees through bound methods and partials; callable
+    # objects are checked through their __call__.
+    return inspect.iscoroutinefunction(handler) or inspect.iscoroutinefunction(
+        getattr(handler, '__call__', None)
+    )
+
+
 class AioHierarchicalEmitter(HierarchicalEmitter):
+    # _lookup_cache maps an event name to a tuple of (handler, is_async)
+    # pairs, so each handler is only inspected once. botocore replaces the
+    # cache whenever handlers are registered or unregistered, and each client
+    # has its own copy of the emitter, so this is a dispatch plan per client
+    # and operation.
+
     async def _emit(self, event_name, kwargs, stop_on_response=False):
-        responses = []
         # Invoke the event handlers from most specific
         # to least specific, each time stripping off a dot.
         handlers_to_call = self._lookup_cache.get(event_name)
         if handlers_to_call is None:
-            handlers_to_call = self._handlers.prefix_search(event_name)
+            handlers_to_call = tuple(
+                (handler, _is_async_handler(handler))
+                for handler in self._handlers.prefix_search(event_name)
+            )
             self._lookup_cache[event_name] = handlers_to_call
-        elif not handlers_to_call:
+        if not handlers_to_call:
             # Short circuit and return an empty response is we have
             # no handlers to call.  This is the common case where
             # for the majority of signals, nothing is listening.
             return []
         kwargs['event_name'] = event_name
         responses = []
-        for handler in handlers_to_call:
-            logger.debug('Event %s: calling handler %s', event_name, handler)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for handler, is_async in handlers_to_call:
+            if debug:
+                logger.debug(
+                    'Event %s: calling handler %s', event_name, handler
+                )
 
-            # Await the handler if its a coroutine.
-            response = await resolve_awaitable(handler(**kwargs))
+            if is_async:
+                response = await handler(**kwargs)
+            else:
+                response = handler(**kwargs)
+                # A plain function may still return an awaitable.
+                if response is not None and inspect.isawaitable(response):
+                    response = await response
             responses.append((handler, response))
             if stop_on_response and response is not None:
                 return responses
@@ -87,13 +87,19 @@ class _ChecksumMixin:
             self._validate_checksum()
         return chunk
 
+    async def _read_any(self, amt):
+        chunk = await super()._read_any(amt)
+        self._checksum.update(chunk)
+        if not chunk:
+            self._validate_checksum()
+        return chunk
+
     async def readinto(self, b: bytearray):
         amount_read = await super().readinto(b)
 
-        if amount_read == len(b):
-            view = b
-        else:
-            view = memoryview(b)[:amount_read]
+        view = memoryview(b).cast('B')
+        if amount_read < len(view):
+            view = view[:amount_read]
 
         self._checksum.update(view)
         if amount_read == 0 and len(b) > 0:
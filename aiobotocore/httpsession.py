@@ -1,9 +1,10 @@
 import asyncio
+import bisect
 import contextlib
 import io
-import os
 import socket
 import ssl
+import time
 from concurrent.futures import CancelledError
 
 import aiohttp  # lgtm [py/import-and-import-from]
@@ -31,12 +32,10 @@ from botocore.httpsession import (
     SSLError,
     _is_ipaddress,
     create_urllib3_context,
-    ensure_boolean,
     get_cert_path,
     logger,
     mask_proxy_url,
     parse_url,
-    urlparse,
 )
 from multidict import CIMultiDict
 
@@ -44,6 +43,52 @@ import aiobotocore.awsrequest
 
 from ._constants import DEFAULT_KEEPALIVE_TIMEOUT
 from ._endpoint_helpers import _IOBaseWrapper, _text
+from ._proxy_cache import ProxyDecisionCache
+from ._ssl_context_cache import (  # noqa: F401 clear_ssl_context_cache is public
+    clear_ssl_context_cache,
+    ssl_context_cache,
+    ssl_context_files,
+)
+from ._timing import current_timings, timed_phase
+
+# Upper bounds, in seconds, of the buckets of the pool wait time histogram.
+POOL_WAIT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    float('inf'),
+)
+
+
+class PoolTimeoutError(ConnectTimeoutError):
+    """No pooled connection became free within ``pool_timeout``.
+
+    A ``ConnectTimeoutError``, so botocore's retry handlers retry it.
+    """
+
+    fmt = (
+        'Timed out waiting for a free pooled connection to endpoint URL: '
+        '"{endpoint_url}"'
+    )
+
+
+class _PoolAcquireTimeout(Exception):
+    # Not an asyncio.TimeoutError, which aiohttp reports as a connect timeout.
+    pass
+
+
+class _PoolStats:
+    def __init__(self):
+        self.wait_counts = [0] * len(POOL_WAIT_BUCKETS)
+        self.timeouts = 0
+
+    def record_wait(self, seconds):
+        self.wait_counts[bisect.bisect_left(POOL_WAIT_BUCKETS, seconds)] += 1
 
 
 class _ProxySSLTCPConnector(aiohttp.TCPConnector):
@@ -54,11 +99,23 @@ class _ProxySSLTCPConnector(aiohttp.TCPConnector):
     context — and the endpoint's client certificate would be offered to the
     proxy. urllib3 passes ``cert_file=None`` when wrapping the proxy socket, so
     botocore never does that; this keeps the two apart the same way.
+
+    It also bounds and records the time spent waiting for a free slot when
+    the pool is at its limit.
     """
 
-    def __init__(self, *args, proxy_ssl_context=None, **kwargs):
+    def __init__(
+        self,
+        *args,
+        proxy_ssl_context=None,
+        pool_timeout=None,
+        pool_stats=None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self._proxy_ssl_context = proxy_ssl_context
+        self._pool_timeout = pool_timeout
+        self._pool_stats = pool_stats or _PoolStats()
 
     def _update_proxy_auth_header_and_build_proxy_req(self, req):
         proxy_req = super()._update_proxy_auth_header_and_build_proxy_req(req)
@@ -66,6 +123,49 @@ class _ProxySSLTCPConnector(aiohttp.TCPConnector):
             proxy_req._ssl = self._proxy_ssl_context
         return proxy_req
 
+    async def _wait_for_available_connection(self, key, traces):
+        start = time.monotonic()
+        try:
+            await asyncio.wait_for(
+                super()._wait_for_available_connection(key, traces),
+                self._pool_timeout,
+            )
+        except asyncio.TimeoutError:
+            self._pool_stats.timeouts += 1
+            raise _PoolAcquireTimeout from None
+        finally:
+            self._pool_stats.record_wait(time.monotonic() - start)
+            if (timings := current_timings()) is not None:
+                timings.record('pool_wait', start)
+
+    async def _create_connection(self, req, traces, timeout):
+        with timed_phase('connect'):
+            return await super()._create_connection(req, traces, timeout)
+
+    def pool_usage(self):
+        """Return the ``(in_use, idle, acquiring)`` connection counts."""
+        idle = sum(len(conns) for conns in self._conns.values())
+        acquiring = sum(len(waiters) for waiters in self._waiters.values())
+        return len(self._acquired), idle, acquiring
+
+
+def _socket_factory_with_options(socket_options, socket_factory=None):
+    def create_socket(addr_info):
+        if socket_factory is not None:
+            sock = socket_factory(addr_info)
+        else:
+            family, type_, proto, _, _ = addr_info
+            sock = socket.socket(family=family, type=type_, proto=proto)
+        try:
+            for option in socket_options:
+                sock.setsockopt(*option)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    return create_socket
+
 
 class AIOHTTPSession:
     def __init__(
@@ -81,13 +181,13 @@ class AIOHTTPSession:
     ):
         self._exit_stack = contextlib.AsyncExitStack()
 
-        # TODO: handle socket_options
         # keep track of sessions by proxy url (if any)
         self._sessions: dict[str | None, aiohttp.ClientSession] | None = None
         self._verify = verify
         self._proxy_config = ProxyConfiguration(
             proxies=proxies, proxies_settings=proxies_config
         )
+        self._proxy_decisions = ProxyDecisionCache(self._proxy_config)
         if isinstance(timeout, (list, tuple)):
             conn_timeout, read_timeout = timeout
         else:
@@ -112,6 +212,7 @@ class AIOHTTPSession:
             )
 
         self._max_pool_connections = max_pool_connections
+        self._pool_stats = _PoolStats()
         self._socket_options = socket_options
         if socket_options is None:
             self._socket_options = []
@@ -123,6 +224,7 @@ class AIOHTTPSession:
     async def __aenter__(self):
         assert self._sessions is None
         self._sessions = {}
+        self._proxy_decisions.reset()
 
         return self
 
@@ -189,6 +291,18 @@ class AIOHTTPSession:
     def _build_ssl_contexts(self, proxy_url):
         # Synchronous SSL context construction. Caller runs off the event loop.
         # (#1469)
+        return ssl_context_cache.get_or_build(
+            (type(self), self._verify, proxy_url),
+            ssl_context_files(
+                self._verify,
+                self._cert_file,
+                self._key_file,
+                self._proxy_config.settings,
+            ),
+            lambda: self._create_ssl_contexts(proxy_url),
+        )
+
+    def _create_ssl_contexts(self, proxy_url):
         ssl_context = self._build_verify_context()
         if self._cert_file:
             # urllib3 keeps sending the client certificate when cert_reqs is
@@ -213,11 +327,23 @@ class AIOHTTPSession:
             ssl_context, proxy_ssl_context = self._build_ssl_contexts(
                 proxy_url
             )
+        connector_args = dict(self._connector_args)
+        # Handled by _ProxySSLTCPConnector, like it is by httpx.
+        pool_timeout = connector_args.pop('pool_timeout', None)
+        if self._socket_options:
+            # Applied before connecting, so buffer sizes also take part in
+            # the TCP window scale negotiation.
+            connector_args['socket_factory'] = _socket_factory_with_options(
+                self._socket_options,
+                connector_args.get('socket_factory'),
+            )
         return _ProxySSLTCPConnector(
             limit=self._max_pool_connections,
             ssl=ssl_context,
             proxy_ssl_context=proxy_ssl_context,
-            **self._connector_args,
+            pool_timeout=pool_timeout,
+            pool_stats=self._pool_stats,
+            **connector_args,
         )
 
     async def _get_session(self, proxy_url):
@@ -239,24 +365,100 @@ class AIOHTTPSession:
     async def close(self):
         await self.__aexit__(None, None, None)
 
+    def pool_stats(self):
+        """Return a snapshot of the connection pool's state.
+
+        ``in_use``, ``idle`` and ``acquiring`` count connections across the
+        session's pools, one per proxy. ``wait_time_histogram`` maps the
+        upper bound of each bucket in ``POOL_WAIT_BUCKETS`` to the number of
+        requests that waited that long for a free slot, and
+        ``pool_timeouts`` counts the waits that hit ``pool_timeout``.
+        """
+        in_use = idle = acquiring = 0
+        for session in (self._sessions or {}).values():
+            pool_in_use, pool_idle, pool_acquiring = (
+                session.connector.pool_usage()
+            )
+            in_use += pool_in_use
+            idle += pool_idle
+            acquiring += pool_acquiring
+        return {
+            'in_use': in_use,
+            'idle': idle,
+            'acquiring': acquiring,
+            'wait_time_histogram': dict(
+                zip(POOL_WAIT_BUCKETS, self._pool_stats.wait_counts)
+            ),
+            'pool_timeouts': self._pool_stats.timeouts,
+        }
+
+    async def prefetch_dns(self, hosts):
+        """Resolve ``(host, port)`` pairs into the connector's DNS cache."""
+        session = await self._get_session(proxy_url=None)
+        if not session.connector.use_dns_cache:
+            return
+        # TCPConnector has no public way to resolve without connecting.
+        await asyncio.gather(
+            *(
+                session.connector._resolve_host(host, port)
+                for host, port in hosts
+            )
+        )
+
+    async def warm_connections(self, url, n):
+        """Open up to ``n`` pooled connections to ``url`` ahead of time."""
+        proxy_url, proxy_headers = self._proxy_decisions.decision_for(url)
+        session = await self._get_session(proxy_url)
+        if self._max_pool_connections:
+            n = min(n, self._max_pool_connections)
+        # The request is only used to pick the pool; it must match the ones
+        # send() makes, so the connections get the same ConnectionKey.
+        request = aiohttp.ClientRequest(
+            'HEAD',
+            URL(url, encoded=True),
+            loop=asyncio.get_running_loop(),
+            proxy=URL(proxy_url) if proxy_url else None,
+            proxy_headers=proxy_headers if proxy_url else None,
+        )
+        # Held concurrently, so each of them is a new connection, and only
+        # then released into the pool.
+        results = await asyncio.gather(
+            *(
+                session.connector.connect(request, [], session.timeout)
+                for _ in range(n)
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, aiohttp.connector.Connection):
+                result.release()
+        for result in results:
+            if isinstance(result, _PoolAcquireTimeout):
+                raise PoolTimeoutError(endpoint_url=url, error=result)
+            if isinstance(result, ClientSSLError):
+                raise SSLError(endpoint_url=url, error=result)
+            if isinstance(
+                result, (ClientProxyConnectionError, ClientHttpProxyError)
+            ):
+                raise ProxyConnectionError(
+                    proxy_url=mask_proxy_url(proxy_url), error=result
+                )
+            if isinstance(result, (ClientConnectionError, socket.gaierror)):
+                raise EndpointConnectionError(endpoint_url=url, error=result)
+            if isinstance(result, asyncio.TimeoutError):
+                raise ConnectTimeoutError(endpoint_url=url, error=result)
+            if isinstance(result, BaseException):
+                raise result
+
     async def send(self, request):
         try:
-            proxy_url = self._proxy_config.proxy_url_for(request.url)
-            proxy_headers = self._proxy_config.proxy_headers_for(request.url)
+            proxy_url, proxy_headers = self._proxy_decisions.decision_for(
+                request.url
+            )
             url = request.url
             headers = request.headers
             data = request.body
 
-            if ensure_boolean(
-                os.environ.get('BOTO_EXPERIMENTAL__ADD_PROXY_HOST_HEADER', '')
-            ):
-                # This is currently an "experimental" feature which provides
-                # no guarantees of backwards compatibility. It may be subject
-                # to change or removal in any patch version. Anyone opting in
-                # to this feature should strictly pin botocore.
-                host = urlparse(request.url).hostname
-                proxy_headers['host'] = host
-
             headers_ = CIMultiDict(
                 (z[0], _text(z[1], encoding='utf-8')) for z in headers.items()
             )
@@ -269,24 +471,25 @@ class AIOHTTPSession:
 
             url = URL(url, encoded=True)
             session = await self._get_session(proxy_url)
-            response = await session.request(
-                request.method,
-                url=url,
-                chunked=self._chunked(headers_),
-                headers=headers_,
-                data=data,
-                proxy=proxy_url,
-                proxy_headers=proxy_headers,
-            )
+            with timed_phase('send'):
+                response = await session.request(
+                    request.method,
+                    url=url,
+                    chunked=self._chunked(headers_),
+                    headers=headers_,
+                    data=data,
+                    proxy=proxy_url,
+                    proxy_headers=proxy_headers,
+                )
 
             # botocore converts keys to str, so make sure that they are in
             # the expected case. See detailed discussion here:
             # https://github.com/aio-libs/aiobotocore/pull/116
             # aiohttp's CIMultiDict camel cases the headers :(
-            headers = {
-                k.decode('utf-8').lower(): v.decode('utf-8')
+            headers = aiobotocore.awsrequest._LowercaseHeadersDict(
+                (k.decode('utf-8').lower(), v.decode('utf-8'))
                 for k, v in response.raw_headers
-            }
+            )
 
             http_response = aiobotocore.awsrequest.AioAWSResponse(
                 str(response.url), response.status, headers, response
@@ -299,6 +502,8 @@ class AIOHTTPSession:
                 await http_response.content
 
             return http_response
+        except _PoolAcquireTimeout as e:
+            raise PoolTimeoutError(endpoint_url=request.url, error=e)
         except ClientSSLError as e:
             raise SSLError(endpoint_url=request.url, error=e)
         except (ClientProxyConnectionError, ClientHttpProxyError) as e:
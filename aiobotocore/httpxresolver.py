@@ -0,0 +1,248 @@
+"""DNS resolution and caching for the httpx backend.
+
+aiohttp caches DNS results in its ``TCPConnector`` (``use_dns_cache`` and
+``ttl_dns_cache``) and accepts a custom ``resolver``. httpcore calls
+``getaddrinfo`` for every new connection, so ``HttpxSession`` gets the same
+behaviour by installing a network backend that resolves hostnames through a
+``DNSCache`` before connecting.
+
+A resolver may report the TTL of the records it returns; otherwise
+``ttl_dns_cache`` applies. Entries are refreshed in the background once most
+of their TTL has passed, so requests do not wait for a lookup while a host
+stays in use.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import socket
+import time
+from typing import Any, NamedTuple
+
+from botocore.httpsession import _is_ipaddress
+
+from ._httpx import httpcore
+
+if httpcore is not None:
+    # anyio is a dependency of both supported httpx implementations.
+    import anyio
+
+logger = logging.getLogger(__name__)
+
+# Fraction of the TTL after which a cached entry is refreshed in the
+# background.
+_REFRESH_AFTER = 0.75
+
+# Strong references to running asyncio refresh tasks.
+_background_tasks: set[asyncio.Task] = set()
+
+
+class ResolveResult(NamedTuple):
+    addresses: list[str]
+    # Seconds the addresses may be cached for; None defers to ttl_dns_cache.
+    ttl: float | None = None
+
+
+class AbstractResolver:
+    """Resolves hostnames for the httpx backend.
+
+    Unlike aiohttp's resolvers, these must work on both asyncio and trio, so
+    implementations should only use anyio or thread offloading.
+    """
+
+    async def resolve(self, host: str, port: int) -> ResolveResult:
+        raise NotImplementedError
+
+
+class ThreadedResolver(AbstractResolver):
+    """Resolves with ``getaddrinfo`` in a worker thread, as httpcore does."""
+
+    async def resolve(self, host: str, port: int) -> ResolveResult:
+        infos = await anyio.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        # Keep the resolver's order, which already prefers the address
+        # family that is likely to work.
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        return ResolveResult(addresses)
+
+
+class _CacheEntry(NamedTuple):
+    addresses: list[str]
+    refresh_at: float
+    expires_at: float
+
+
+def _spawn_system_task(async_fn, *args) -> None:
+    # A refresh must outlive the request that triggered it, so it runs
+    # outside of any task group: as a system task on trio and as a plain
+    # task on asyncio.
+    try:
+        import sniffio
+
+        library = sniffio.current_async_library()
+    except ImportError:  # pragma: no cover
+        library = 'asyncio'
+    if library == 'trio':
+        import trio
+
+        trio.lowlevel.spawn_system_task(async_fn, *args)
+    else:
+        task = asyncio.get_running_loop().create_task(async_fn(*args))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+
+class DNSCache:
+    """TTL-respecting cache in front of a resolver, shared by a session.
+
+    ``ttl`` is used for results that carry no TTL of their own; None caches
+    them until the session is closed, like aiohttp's ``ttl_dns_cache=None``.
+    Concurrent lookups of the same host share one query.
+    """
+
+    def __init__(
+        self,
+        resolver: AbstractResolver | None = None,
+        ttl: float | None = 10,
+    ):
+        self._resolver = resolver or ThreadedResolver()
+        self._ttl = ttl
+        self._entries: dict[str, _CacheEntry] = {}
+        self._pending: dict[str, anyio.Event] = {}
+        self._refresh_scopes: set[anyio.CancelScope] = set()
+
+    async def resolve(self, host: str, port: int) -> list[str]:
+        if _is_ipaddress(host):
+            return [host]
+        entry = self._entries.get(host)
+        if entry is not None:
+            now = time.monotonic()
+            if now < entry.expires_at:
+                if now >= entry.refresh_at and host not in self._pending:
+                    _spawn_system_task(
+                        self._refresh, host, port, self._begin_lookup(host)
+                    )
+                return entry.addresses
+        while (pending := self._pending.get(host)) is not None:
+            await pending.wait()
+            entry = self._entries.get(host)
+            if entry is not None:
+                return entry.addresses
+            # The shared lookup failed; join a retry another waiter started
+            # already, or make our own to get its error.
+        return await self._lookup(host, port, self._begin_lookup(host))
+
+    async def prefetch(self, hosts: list[tuple[str, int]]) -> None:
+        """Resolve ``(host, port)`` pairs ahead of their first connection."""
+        async with anyio.create_task_group() as tg:
+            for host, port in hosts:
+                tg.start_soon(self.resolve, host, port)
+
+    def clear(self) -> None:
+        """Drop the cached entries and stop any background refreshes."""
+        for scope in self._refresh_scopes:
+            scope.cancel()
+        self._entries.clear()
+
+    def _begin_lookup(self, host: str) -> anyio.Event:
+        self._pending[host] = event = anyio.Event()
+        return event
+
+    async def _lookup(
+        self, host: str, port: int, event: anyio.Event
+    ) -> list[str]:
+        try:
+            result = await self._resolver.resolve(host, port)
+            if not result.addresses:
+                raise OSError(f'No addresses found for {host}')
+            ttl = self._ttl if result.ttl is None else result.ttl
+            now = time.monotonic()
+            if ttl is None:
+                refresh_at = expires_at = float('inf')
+            else:
+                refresh_at = now + ttl * _REFRESH_AFTER
+                expires_at = now + ttl
+            self._entries[host] = _CacheEntry(
+                result.addresses, refresh_at, expires_at
+            )
+            return result.addresses
+        finally:
+            if self._pending.get(host) is event:
+                del self._pending[host]
+            event.set()
+
+    async def _refresh(self, host: str, port: int, event: anyio.Event) -> None:
+        with anyio.CancelScope() as scope:
+            self._refresh_scopes.add(scope)
+            try:
+                await self._lookup(host, port, event)
+            except Exception:
+                # The current entry stays usable until it expires.
+                logger.debug('Refreshing %s failed', host, exc_info=True)
+            finally:
+                self._refresh_scopes.discard(scope)
+
+
+if httpcore is None:  # pragma: no cover
+    _CachingNetworkBackend = None
+else:
+
+    class _CachingNetworkBackend(httpcore.AsyncNetworkBackend):
+        """httpcore network backend that connects to cached addresses."""
+
+        def __init__(self, dns_cache: DNSCache):
+            self._dns_cache = dns_cache
+            self._backend = httpcore.AnyIOBackend()
+
+        async def connect_tcp(
+            self,
+            host: str,
+            port: int,
+            timeout: float | None = None,
+            local_address: str | None = None,
+            socket_options: Any = None,
+        ) -> httpcore.AsyncNetworkStream:
+            try:
+                with anyio.fail_after(timeout):
+                    addresses = await self._dns_cache.resolve(host, port)
+            except TimeoutError as e:
+                raise httpcore.ConnectTimeout(e) from e
+            except OSError as e:
+                raise httpcore.ConnectError(e) from e
+            for address in addresses[:-1]:
+                try:
+                    return await self._backend.connect_tcp(
+                        address,
+                        port,
+                        timeout=timeout,
+                        local_address=local_address,
+                        socket_options=socket_options,
+                    )
+                except (httpcore.ConnectError, httpcore.ConnectTimeout):
+                    logger.debug(
+                        'Connecting to %s at %s failed, trying the next '
+                        'address',
+                        host,
+                        address,
+                        exc_info=True,
+                    )
+            return await self._backend.connect_tcp(
+                addresses[-1],
+                port,
+                timeout=timeout,
+                local_address=local_address,
+                socket_options=socket_options,
+            )
+
+        async def connect_unix_socket(
+            self,
+            path: str,
+            timeout: float | None = None,
+            socket_options: Any = None,
+        ) -> httpcore.AsyncNetworkStream:  # pragma: no cover
+            return await self._backend.connect_unix_socket(
+                path, timeout=timeout, socket_options=socket_options
+            )
+
+        async def sleep(self, seconds: float) -> None:
+            await self._backend.sleep(seconds)
@@ -4,14 +4,16 @@ import asyncio
 import io
 import socket
 import ssl
+import time
 import warnings
+import weakref
 from collections.abc import AsyncIterable, Iterable
 from concurrent.futures import CancelledError
 from contextlib import AsyncExitStack
 from typing import TYPE_CHECKING, Any, cast
 
 import botocore
-from botocore.awsrequest import AWSPreparedRequest
+from botocore.awsrequest import AWSPreparedRequest, AWSRequest
 from botocore.httpsession import (
     MAX_POOL_CONNECTIONS,
     ConnectionClosedError,
@@ -31,13 +33,16 @@ from botocore.httpsession import (
     parse_url,
     urlparse,
 )
-from multidict import CIMultiDict
 
 import aiobotocore.awsrequest
-from aiobotocore._endpoint_helpers import _text
 from aiobotocore._httpx import HTTPX_IS_LEGACY, httpx
 
 from ._constants import DEFAULT_KEEPALIVE_TIMEOUT
+from ._proxy_cache import ProxyDecisionCache
+from ._ssl_context_cache import ssl_context_cache, ssl_context_files
+from ._timing import current_timings, timed_phase
+from .httpsession import PoolTimeoutError
+from .httpxresolver import AbstractResolver, DNSCache, _CachingNetworkBackend
 
 if httpx is not None:
     # anyio is a dependency of both supported httpx implementations.
@@ -88,6 +93,49 @@ if httpx is not None:
                 )
             return await super().handle_async_request(request)
 
+    class _ClosingStream(httpx.AsyncByteStream):
+        """Response stream that reports back when the response is closed."""
+
+        def __init__(self, stream, on_close):
+            self._stream = stream
+            self._on_close = on_close
+
+        async def __aiter__(self):
+            async for chunk in self._stream:
+                yield chunk
+
+        async def aclose(self):
+            try:
+                await self._stream.aclose()
+            finally:
+                if self._on_close is not None:
+                    on_close, self._on_close = self._on_close, None
+                    on_close()
+
+
+class _ConnectTracer:
+    """httpcore trace hook timing a connection opened for a request.
+
+    Covers the TCP connect and, for https, the TLS handshake.
+    """
+
+    def __init__(self, timings):
+        self._timings = timings
+        self._start = self._end = None
+
+    async def __call__(self, event_name, info):
+        if event_name == 'connection.connect_tcp.started':
+            self._start = time.monotonic()
+        elif event_name in (
+            'connection.connect_tcp.complete',
+            'connection.start_tls.complete',
+        ):
+            self._end = time.monotonic()
+
+    def record(self):
+        if self._start is not None:
+            self._timings.record('connect', self._start, self._end)
+
 
 def _find_ssl_error(exc: BaseException) -> ssl.SSLError | None:
     """Find an ``ssl.SSLError`` in ``exc``'s cause/context chain.
@@ -141,6 +189,7 @@ class HttpxSession:
         self._proxy_config = ProxyConfiguration(
             proxies=proxies, proxies_settings=proxies_config
         )
+        self._proxy_decisions = ProxyDecisionCache(self._proxy_config)
 
         if connector_args is None:
             self._connector_args: dict[str, Any] = {
@@ -149,7 +198,6 @@ class HttpxSession:
         else:
             self._connector_args = connector_args
 
-        # TODO: neither this nor AIOHTTPSession handles socket_options
         self._entered = False
         self._proxy_ssl_contexts: dict[str, SSLContext]
         conn_timeout: float | None
@@ -179,15 +227,46 @@ class HttpxSession:
         elif client_cert is not None:
             raise TypeError(f'{client_cert} must be str or tuple[str,str]')
 
-        if 'use_dns_cache' in self._connector_args:
-            raise NotImplementedError(
-                "DNS caching is not implemented by httpx. https://github.com/encode/httpx/discussions/2211"
-            )
         if 'force_close' in self._connector_args:
             raise NotImplementedError("Not supported with httpx as backend.")
-        if 'resolver' in self._connector_args:
+        resolver = self._connector_args.get('resolver')
+        if resolver is not None and not isinstance(resolver, AbstractResolver):
+            raise NotImplementedError(
+                "Only aiobotocore.httpxresolver resolvers are supported with "
+                "httpx as backend."
+            )
+        # httpcore resolves every new connection itself unless the DNS cache
+        # is installed as its network backend. Opt-in, unlike aiohttp: on by
+        # default only when a resolver or ttl_dns_cache is given.
+        self._dns_cache: DNSCache | None = None
+        if self._connector_args.get(
+            'use_dns_cache',
+            resolver is not None or 'ttl_dns_cache' in self._connector_args,
+        ):
+            self._dns_cache = DNSCache(
+                resolver, ttl=self._connector_args.get('ttl_dns_cache', 10)
+            )
+        elif resolver is not None:
+            self._dns_cache = DNSCache(resolver, ttl=0)
+        if 'limit_per_host' in self._connector_args:
             raise NotImplementedError("Not supported with httpx as backend.")
 
+        self._http2 = self._connector_args.get('http2', False)
+        if self._http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                package = 'httpx' if HTTPX_IS_LEGACY else 'httpx2'
+                raise RuntimeError(
+                    "Using HTTP/2 with HttpxSession requires h2 to be "
+                    f"installed (e.g. {package}[http2])"
+                )
+        # Open responses per connection, keyed by the network stream; a
+        # connection seen before is a reused one. HTTP/2 only.
+        self._open_responses: weakref.WeakKeyDictionary[Any, int] = (
+            weakref.WeakKeyDictionary()
+        )
+
         self._max_pool_connections = max_pool_connections
         self._socket_options = socket_options
         if socket_options is None:
@@ -280,6 +359,31 @@ class HttpxSession:
         self, proxy_urls: dict[str, str]
     ) -> tuple[SSLContext, dict[str, SSLContext]]:
         # Synchronous SSL context construction. Caller runs off the event loop.
+        if isinstance(self._verify, ssl.SSLContext):
+            # A caller-provided context is not ours to share.
+            return self._create_ssl_contexts(proxy_urls)
+        # httpcore sets the ALPN protocols on the contexts it is given, so
+        # HTTP/1.1 and HTTP/2 sessions must not share them.
+        verify, proxy_ssl_contexts = ssl_context_cache.get_or_build(
+            (
+                type(self),
+                self._verify,
+                self._http2,
+                frozenset(proxy_urls.values()),
+            ),
+            ssl_context_files(
+                self._verify,
+                self._cert_file,
+                self._key_file,
+                self._proxy_config.settings,
+            ),
+            lambda: self._create_ssl_contexts(proxy_urls),
+        )
+        return verify, dict(proxy_ssl_contexts)
+
+    def _create_ssl_contexts(
+        self, proxy_urls: dict[str, str]
+    ) -> tuple[SSLContext, dict[str, SSLContext]]:
         verify = (
             self._verify
             if isinstance(self._verify, ssl.SSLContext)
@@ -300,6 +404,7 @@ class HttpxSession:
         try:
             self._exit_stack = AsyncExitStack()
             await self._exit_stack.__aenter__()
+            self._proxy_decisions.reset()
 
             # Resolve the proxy URL for each scheme so we can mount a transport
             # per proxy. httpx configures proxies on the client/transport rather
@@ -360,16 +465,26 @@ class HttpxSession:
                 verify=self._verify,
                 limits=self._limits,
                 proxy=proxy,
+                http2=self._http2,
+                socket_options=self._socket_options,
             )
 
         # verify carries the endpoint TLS settings, including the client
         # certificate; the proxy hop above gets a context without it. Requests
         # matching a mounted proxy transport use that transport instead.
-        return httpx.AsyncClient(
+        client = httpx.AsyncClient(
             timeout=self._timeout,
-            limits=self._limits,
             mounts=mounts,
-            verify=self._verify,
+            # AsyncClient only accepts socket_options through an explicit
+            # transport. httpcore applies them once the socket is connected.
+            transport=httpx.AsyncHTTPTransport(
+                verify=self._verify,
+                limits=self._limits,
+                # Only used when the endpoint offers h2 via ALPN; plain http
+                # and HTTP/1.1-only endpoints keep using HTTP/1.1.
+                http2=self._http2,
+                socket_options=self._socket_options,
+            ),
             # botocore resolves environment proxies itself (get_environ_proxies,
             # which also honours system bypass settings) and passes the result
             # in, so httpx must not apply its own — aiohttp and urllib3 only
@@ -379,6 +494,14 @@ class HttpxSession:
             # environment must not become a source of trust if that changes.
             trust_env=False,
         )
+        if self._dns_cache is not None:
+            # httpx does not expose httpcore's network_backend argument. The
+            # pools only read it when opening a connection, so it can be
+            # swapped in before the first request.
+            network_backend = _CachingNetworkBackend(self._dns_cache)
+            for transport in (client._transport, *mounts.values()):
+                transport._pool._network_backend = network_backend
+        return client
 
     async def _get_session(self, _request_url: str) -> httpx.AsyncClient:
         # httpcore generates CONNECT's Host header from each request target,
@@ -398,13 +521,67 @@ class HttpxSession:
         finally:
             self._session = None
             self._entered = False
+            if self._dns_cache is not None:
+                self._dns_cache.clear()
 
     def _get_ssl_context(self) -> SSLContext:
         return create_urllib3_context()
 
+    def _track_connection(self, response: httpx.Response) -> dict[str, Any]:
+        """Describe the connection ``response`` arrived on.
+
+        Counts the response as in flight on its connection until it is
+        closed, so concurrent streams multiplexed over one HTTP/2 connection
+        are visible to the caller.
+        """
+        network_stream = response.extensions.get('network_stream')
+        metadata: dict[str, Any] = {'HTTPVersion': response.http_version}
+        if network_stream is None:
+            return metadata
+
+        open_responses = self._open_responses
+        reused = network_stream in open_responses
+        in_flight = open_responses.get(network_stream, 0) + 1
+        open_responses[network_stream] = in_flight
+
+        def on_close():
+            if network_stream in open_responses:
+                open_responses[network_stream] -= 1
+
+        response.stream = _ClosingStream(response.stream, on_close)
+        metadata['ConnectionReused'] = reused
+        metadata['StreamsInFlight'] = in_flight
+        return metadata
+
     async def close(self) -> None:
         await self.__aexit__(None, None, None)
 
+    async def prefetch_dns(self, hosts: list[tuple[str, int]]) -> None:
+        """Resolve ``(host, port)`` pairs into the DNS cache, if enabled."""
+        if self._dns_cache is not None:
+            await self._dns_cache.prefetch(hosts)
+
+    async def warm_connections(self, url: str, n: int) -> None:
+        """Open up to ``n`` pooled connections to ``url`` ahead of time.
+
+        httpx cannot connect without sending a request, so each connection
+        is opened by a HEAD request whose response is discarded. Over HTTP/2
+        the requests share a single connection.
+        """
+        errors: list[Exception] = []
+
+        async def warm() -> None:
+            try:
+                await self.send(AWSRequest(method='HEAD', url=url).prepare())
+            except Exception as e:
+                errors.append(e)
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(min(n, self._max_pool_connections)):
+                tg.start_soon(warm)
+        if errors:
+            raise errors[0]
+
     async def send(
         self, request: AWSPreparedRequest
     ) -> aiobotocore.awsrequest.HttpxAWSResponse:
@@ -413,18 +590,11 @@ class HttpxSession:
         # endpoint. httpx surfaces a forward (http) proxy failure as a plain
         # ConnectError, so we key off the configured proxy instead. None when
         # no proxy applies.
-        proxy_url = self._proxy_config.proxy_url_for(request.url)
+        proxy_url = self._proxy_decisions.proxy_url_for(request.url)
         try:
             url = request.url
             headers = request.headers
 
-            headers_ = CIMultiDict(
-                (z[0], _text(z[1], encoding='utf-8')) for z in headers.items()
-            )
-
-            # https://github.com/boto/botocore/issues/1255
-            headers_['Accept-Encoding'] = 'identity'
-
             # content can also be https://github.com/ymyzk/tox-gh-actions
             content: AsyncIterable | bytes | bytearray | str | None = None
 
@@ -455,6 +625,9 @@ class HttpxSession:
             extensions = {
                 (_RAW_PROXY_TARGET if proxy_url else 'target'): target
             }
+            connect_tracer = None
+            if (timings := current_timings()) is not None:
+                connect_tracer = extensions['trace'] = _ConnectTracer(timings)
 
             session = await self._get_session(url)
 
@@ -467,8 +640,12 @@ class HttpxSession:
             )
             assert isinstance(httpx_request.stream, httpx.AsyncByteStream)
             # auth, follow_redirects
-            response = await session.send(httpx_request, stream=True)
-            response_headers = botocore.compat.HTTPHeaders.from_pairs(
+            with timed_phase('send'):
+                response = await session.send(httpx_request, stream=True)
+                if connect_tracer is not None:
+                    connect_tracer.record()
+            # httpx already joins repeated headers and lowercases the names.
+            response_headers = aiobotocore.awsrequest._LowercaseHeadersDict(
                 response.headers.items()
             )
 
@@ -478,6 +655,10 @@ class HttpxSession:
                 response_headers,
                 response,
             )
+            if self._http2:
+                http_response.connection_metadata = self._track_connection(
+                    response
+                )
 
             if not request.stream_output:
                 # Cause the raw stream to be exhausted immediately. We do it
@@ -507,6 +688,8 @@ class HttpxSession:
             raise ReadTimeoutError(endpoint_url=request.url, error=e)
         except httpx.ReadTimeout as e:
             raise ReadTimeoutError(endpoint_url=request.url, error=e)
+        except httpx.PoolTimeout as e:
+            raise PoolTimeoutError(endpoint_url=request.url, error=e)
         except httpx.TimeoutException as e:
             raise ConnectTimeoutError(endpoint_url=request.url, error=e)
         except httpx.ProxyError as e:
@@ -23,6 +23,7 @@ from botocore.parsers import (
 )
 
 from ._helpers import resolve_awaitable
+from .awsrequest import _LowercaseHeadersDict
 from .eventstream import AioEventStream
 
 
@@ -65,7 +66,9 @@ class AioResponseParser(ResponseParser):
             # versions of urllib3 (< 1.11) would unintentionally do this for us
             # (see urllib3#633). We need to do this conversion manually now.
             headers = response['headers']
-            response_metadata['HTTPHeaders'] = lowercase_dict(headers)
+            if not isinstance(headers, _LowercaseHeadersDict):
+                headers = lowercase_dict(headers)
+            response_metadata['HTTPHeaders'] = headers
             parsed['ResponseMetadata'] = response_metadata
             self._add_checksum_response_metadata(response, response_metadata)
         return parsed
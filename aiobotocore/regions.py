@@ -1,15 +1,120 @@
 import copy
 import logging
+from collections import OrderedDict
+from typing import NamedTuple
 
 from botocore.exceptions import EndpointProviderError
-from botocore.regions import EndpointRulesetResolver
+from botocore.regions import (
+    S3_UNREFERENCED_PARAMS,
+    EndpointRulesetResolver,
+)
 
 from aiobotocore._helpers import resolve_awaitable
+from aiobotocore.endpoint_provider import CompiledEndpointProvider
 
 LOG = logging.getLogger(__name__)
 
+# Per resolver, i.e. per client. Most clients only ever see a handful of
+# distinct parameter sets, e.g. one per S3 bucket.
+ENDPOINT_CACHE_SIZE = 256
+
+
+class EndpointCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def _freeze_param(value):
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
 
 class AioEndpointRulesetResolver(EndpointRulesetResolver):
+    def __init__(
+        self,
+        endpoint_ruleset_data,
+        partition_data,
+        service_model,
+        builtins,
+        client_context,
+        event_emitter,
+        use_ssl=True,
+        requested_auth_scheme=None,
+        auth_scheme_preference=None,
+        endpoint_cache_size=ENDPOINT_CACHE_SIZE,
+        compile_ruleset=False,
+        ruleset_cache_key=None,
+    ):
+        if compile_ruleset:
+            # Like EndpointRulesetResolver.__init__, without first building
+            # the interpreted rules.
+            self._provider = CompiledEndpointProvider(
+                ruleset_data=endpoint_ruleset_data,
+                partition_data=partition_data,
+                excluded_params=(
+                    S3_UNREFERENCED_PARAMS
+                    if service_model.service_name == 's3'
+                    else None
+                ),
+                cache_key=ruleset_cache_key,
+            )
+            self._param_definitions = self._provider.ruleset.parameters
+            self._service_model = service_model
+            self._builtins = builtins
+            self._client_context = client_context
+            self._event_emitter = event_emitter
+            self._use_ssl = use_ssl
+            self._requested_auth_scheme = requested_auth_scheme
+            self._auth_scheme_preference = auth_scheme_preference
+            self._instance_cache = {}
+        else:
+            super().__init__(
+                endpoint_ruleset_data,
+                partition_data,
+                service_model,
+                builtins,
+                client_context,
+                event_emitter,
+                use_ssl=use_ssl,
+                requested_auth_scheme=requested_auth_scheme,
+                auth_scheme_preference=auth_scheme_preference,
+            )
+        # Final endpoints keyed by the provider parameters they were resolved
+        # from. Builtins customized by before-endpoint-resolution handlers
+        # are part of those parameters, so they are still applied.
+        self._endpoint_cache = OrderedDict()
+        self._endpoint_cache_size = endpoint_cache_size
+        self._endpoint_cache_hits = 0
+        self._endpoint_cache_misses = 0
+
+    def endpoint_cache_info(self):
+        """Return the hits, misses and size of the resolved endpoint cache."""
+        return EndpointCacheInfo(
+            self._endpoint_cache_hits,
+            self._endpoint_cache_misses,
+            self._endpoint_cache_size,
+            len(self._endpoint_cache),
+        )
+
+    def clear_endpoint_cache(self):
+        self._endpoint_cache.clear()
+        self._endpoint_cache_hits = self._endpoint_cache_misses = 0
+
+    def _endpoint_cache_key(self, provider_params):
+        # Parameters the ruleset never reads, like the S3 object key, would
+        # only fragment the cache.
+        excluded = self._provider._excluded_params
+        return tuple(
+            sorted(
+                (name, _freeze_param(value))
+                for name, value in provider_params.items()
+                if name not in excluded
+            )
+        )
+
     async def construct_endpoint(
         self,
         operation_model,
@@ -26,6 +131,14 @@ class AioEndpointRulesetResolver(EndpointRulesetResolver):
         provider_params = await self._get_provider_params(
             operation_model, call_args, request_context
         )
+        cache_key = self._endpoint_cache_key(provider_params)
+        provider_result = self._endpoint_cache.get(cache_key)
+        if provider_result is not None:
+            self._endpoint_cache_hits += 1
+            self._endpoint_cache.move_to_end(cache_key)
+            return provider_result
+        self._endpoint_cache_misses += 1
+
         LOG.debug(
             'Calling endpoint provider with parameters: %s', provider_params
         )
@@ -62,6 +175,10 @@ class AioEndpointRulesetResolver(EndpointRulesetResolver):
             }
         )
 
+        if self._endpoint_cache_size:
+            self._endpoint_cache[cache_key] = provider_result
+            if len(self._endpoint_cache) > self._endpoint_cache_size:
+                self._endpoint_cache.popitem(last=False)
         return provider_result
 
     async def _get_provider_params(
@@ -1,5 +1,7 @@
 import asyncio
 import contextlib
+import os
+from collections import deque
 
 import aiohttp
 import aiohttp.client_exceptions
@@ -11,6 +13,7 @@ from botocore.response import (
 
 from aiobotocore import parsers
 from aiobotocore._httpx import httpx
+from aiobotocore.deadline import current_deadline
 
 if httpx is not None:
     _HTTPX_READ_TIMEOUTS: tuple[type[BaseException], ...] = (
@@ -50,6 +53,12 @@ class AioStreamingBodyBase(
     """
 
     _DEFAULT_CHUNK_SIZE = 1024
+    _MAX_CHUNK_SIZE = 256 * 1024
+
+    def __init__(self, raw_stream, content_length=None):
+        super().__init__(raw_stream, content_length)
+        # Reads are bound by the deadline of the call that made the body.
+        self._deadline = current_deadline()
 
     @property
     def raw_stream(self):
@@ -78,16 +87,54 @@ class AioStreamingBodyBase(
 
     anext = __anext__
 
-    async def iter_lines(self, chunk_size=_DEFAULT_CHUNK_SIZE, keepends=False):
-        """Return an async iterator to yield lines from the raw stream."""
-        pending = b''
-        async for chunk in self.iter_chunks(chunk_size):
-            lines = (pending + chunk).splitlines(True)
-            for line in lines[:-1]:
-                yield line.splitlines(keepends)[0]
-            pending = lines[-1]
+    async def iter_lines(self, chunk_size=None, keepends=False):
+        """Return an async iterator to yield lines from the raw stream.
+
+        The stream is read with :meth:`iter_any`, or in chunks of
+        chunk_size bytes if it is given.
+        """
+        if chunk_size is None:
+            chunks = self.iter_any()
+        else:
+            chunks = self.iter_chunks(chunk_size)
+        # The parts of a line that continues in the next chunk, joined once
+        # it ends, so a line is not copied again for each chunk it spans.
+        pending = []
+        # Whether the last chunk ended with b'\r', which a b'\n' starting
+        # the next chunk belongs to.
+        after_cr = False
+        async for chunk in chunks:
+            if after_cr:
+                after_cr = False
+                if chunk[:1] == b'\n':
+                    chunk = chunk[1:]
+                    if keepends:
+                        pending.append(b'\n')
+                if keepends:
+                    yield b''.join(pending)
+                    pending = []
+                if not chunk:
+                    continue
+
+            lines = chunk.splitlines(keepends)
+            last_byte = chunk[-1:]
+            if last_byte == b'\r':
+                after_cr = True
+            # Without keepends, a line ended by b'\r' is complete already.
+            if last_byte not in (b'\n', b'\r') or (after_cr and keepends):
+                unended = lines.pop()
+            else:
+                unended = None
+            if pending and lines:
+                pending.append(lines[0])
+                lines[0] = b''.join(pending)
+                pending = []
+            if unended is not None:
+                pending.append(unended)
+            for line in lines:
+                yield line
         if pending:
-            yield pending.splitlines(keepends)[0]
+            yield b''.join(pending)
 
     async def iter_chunks(self, chunk_size=_DEFAULT_CHUNK_SIZE):
         """Return an async iterator to yield chunks of chunk_size bytes
@@ -99,6 +146,148 @@ class AioStreamingBodyBase(
                 break
             yield current_chunk
 
+    async def download_into(self, buffer):
+        """Read the body into the writable bytes-like object buffer, e.g. a
+        bytearray, mmap or numpy array, and return the number of bytes read.
+
+        Reads until buffer is full or the body ends, copying the bytes
+        into buffer with :meth:`readinto`. If the body is longer than
+        buffer, the rest is left to read.
+        """
+        target = memoryview(buffer).cast('B')
+        amount_read = 0
+        while amount_read < len(target):
+            n = await self.readinto(target[amount_read:])
+            if not n:
+                return amount_read
+            amount_read += n
+        if self._content_length is not None and self._amount_read == int(
+            self._content_length
+        ):
+            # Read the end of the body too, which verifies it, e.g. its
+            # checksum, as for a buffer larger than the body.
+            await self.readinto(bytearray(1))
+        return amount_read
+
+    async def _read_any(self, amt):
+        """Read at most amt bytes of those already buffered, waiting for
+        some only if none are.
+
+        Subclasses that check the data read, e.g. its checksum, extend this
+        as well as :meth:`read`.
+        """
+        raise NotImplementedError('_read_any')
+
+    async def iter_any(self, max_chunk_size=_MAX_CHUNK_SIZE):
+        """Return an async iterator to yield the data of the raw stream
+        as it is received, in chunks of at most max_chunk_size bytes.
+
+        Unlike :meth:`iter_chunks`, each chunk is whatever is buffered
+        already, so a fast stream takes one iteration per read from the
+        socket rather than one per chunk_size bytes. The chunk size starts
+        at 1k and doubles each time a chunk fills it.
+        """
+        chunk_size = min(self._DEFAULT_CHUNK_SIZE, max_chunk_size)
+        while True:
+            current_chunk = await self._read_any(chunk_size)
+            if not current_chunk:
+                break
+            yield current_chunk
+            if len(current_chunk) == chunk_size:
+                chunk_size = min(chunk_size * 2, max_chunk_size)
+
+    async def download_to(
+        self, file, chunk_size=_MAX_CHUNK_SIZE, max_pending=4
+    ):
+        """Write the body to file, a path or a binary file object, and
+        return the number of bytes written.
+
+        The file is written in a worker thread while the body is read on,
+        with at most max_pending chunks of chunk_size bytes read ahead of
+        the writes. The chunks are read with :meth:`download_into`, so the
+        content length and checksum of the body are verified. A path is
+        opened, truncated, and closed again in the worker thread too.
+        """
+        if max_pending < 1:
+            raise ValueError('max_pending must be at least 1')
+        if isinstance(file, (str, os.PathLike)):
+            fileobj = await self._run_in_thread(open, file, 'wb')
+            try:
+                return await self._download_to(
+                    fileobj.write, chunk_size, max_pending
+                )
+            finally:
+                await self._run_in_thread(fileobj.close)
+        return await self._download_to(file.write, chunk_size, max_pending)
+
+    async def _download_to(self, write, chunk_size, max_pending):
+        # Buffers free to read into, and those read but not written yet.
+        free = [bytearray(chunk_size) for _ in range(max_pending)]
+        filled = deque()
+        eof = False
+        written = 0
+        # Set, and replaced, whenever a buffer is read or written.
+        changed = self._create_event()
+
+        def notify():
+            nonlocal changed
+            changed.set()
+            changed = self._create_event()
+
+        async def read():
+            nonlocal eof
+            while not eof:
+                while not free:
+                    await changed.wait()
+                buffer = free.pop()
+                amount = await self.download_into(buffer)
+                eof = amount < len(buffer)
+                if amount:
+                    filled.append(memoryview(buffer)[:amount])
+                notify()
+
+        async def write_filled():
+            nonlocal written
+            while True:
+                while not filled:
+                    if eof:
+                        return
+                    await changed.wait()
+                view = filled[0]
+                await self._run_in_thread(_write_all, write, view)
+                filled.popleft()
+                written += len(view)
+                free.append(view.obj)
+                notify()
+
+        await self._run_concurrently(read, write_filled)
+        return written
+
+    def _create_event(self):
+        return asyncio.Event()
+
+    async def _run_in_thread(self, func, *args):
+        future = asyncio.get_running_loop().run_in_executor(None, func, *args)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # The thread runs on regardless, e.g. writing to a file about to
+            # be closed, so wait for it as anyio does.
+            await asyncio.wait([future])
+            raise
+
+    async def _run_concurrently(self, *funcs):
+        """Run the coroutine functions concurrently, cancelling the others
+        once one fails.
+        """
+        tasks = [asyncio.ensure_future(func()) for func in funcs]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     def tell(self):
         return self._amount_read
 
@@ -134,15 +323,18 @@ class AioStreamingBody(AioStreamingBodyBase):
     def readable(self):
         return not self._raw_stream.content.at_eof()
 
+    async def _read_raw(self, n):
+        if self._deadline is None:
+            return await self._raw_stream.content.read(n)
+        return await self._deadline.wait_for(self._raw_stream.content.read, n)
+
     async def read(self, amt=None):
         """Read at most amt bytes from the stream.
 
         If the amt argument is omitted, read all data.
         """
         try:
-            chunk = await self._raw_stream.content.read(
-                amt if amt is not None else -1
-            )
+            chunk = await self._read_raw(amt if amt is not None else -1)
         except asyncio.TimeoutError as e:
             raise AioReadTimeoutError(
                 endpoint_url=self._raw_stream.url, error=e
@@ -155,14 +347,83 @@ class AioStreamingBody(AioStreamingBodyBase):
             self._verify_content_length()
         return chunk
 
+    async def _wait_buffered(self, content):
+        # As StreamReader.read() waits before taking data from its buffer.
+        while not content._buffer and not content.is_eof():
+            await content._wait('readinto')
+
+    def _take_buffered(self, content, target):
+        """Copy bytes buffered by ``content`` into ``target``, and return
+        how many.
+
+        ``StreamReader.read()`` would return them in a new ``bytes`` object,
+        so this takes them from its buffer directly, keeping its
+        bookkeeping the way ``StreamReader._read_nowait_chunk()`` does.
+        """
+        content._timer.assert_timeout()
+        buffer = content._buffer
+        amount_read = 0
+        while buffer and amount_read < len(target):
+            chunk = buffer[0]
+            offset = content._buffer_offset
+            n = min(len(chunk) - offset, len(target) - amount_read)
+            target[amount_read : amount_read + n] = memoryview(chunk)[
+                offset : offset + n
+            ]
+            amount_read += n
+            if offset + n == len(chunk):
+                buffer.popleft()
+                content._buffer_offset = 0
+            else:
+                content._buffer_offset = offset + n
+
+            content._size -= n
+            content._cursor += n
+            chunk_splits = content._http_chunk_splits
+            while chunk_splits and chunk_splits[0] < content._cursor:
+                chunk_splits.popleft()
+            if content._size < content._low_water and (
+                chunk_splits is None
+                or len(chunk_splits) < content._low_water_chunks
+            ):
+                content._protocol.resume_reading()
+        return amount_read
+
+    async def _readinto_raw(self, b):
+        content = self._raw_stream.content
+        if not isinstance(content, aiohttp.StreamReader) or isinstance(
+            content, aiohttp.streams.EmptyStreamReader
+        ):
+            chunk = await self._read_raw(len(b))
+            b[: len(chunk)] = chunk
+            return len(chunk)
+
+        target = memoryview(b).cast('B')
+        if not target:
+            return 0
+        if (exception := content.exception()) is not None:
+            raise exception
+        content.set_read_chunk_size(len(target))
+        if self._deadline is None:
+            await self._wait_buffered(content)
+        else:
+            await self._deadline.wait_for(self._wait_buffered, content)
+        return self._take_buffered(content, target)
+
+    async def _read_any(self, amt):
+        # StreamReader.read(n) returns what is buffered already. Not
+        # self.read(), as subclasses extend both, so data is checked once.
+        return await AioStreamingBody.read(self, amt)
+
     async def readinto(self, b: bytearray):
         """Read bytes into a pre-allocated, writable bytes-like object b,
         and return the number of bytes read.
+
+        The bytes are copied into b straight from the buffer of the
+        connection, without an intermediate ``bytes`` object.
         """
         try:
-            chunk = await self._raw_stream.content.read(len(b))
-            amount_read = len(chunk)
-            b[:amount_read] = chunk
+            amount_read = await self._readinto_raw(b)
         except asyncio.TimeoutError as e:
             raise AioReadTimeoutError(
                 endpoint_url=self._raw_stream.url, error=e
@@ -197,7 +458,12 @@ class AioHttpxStreamingBody(AioStreamingBodyBase):
 
     def __init__(self, raw_stream, content_length=None):
         super().__init__(raw_stream, content_length)
-        self._buffer = b''
+        # Chunks received but not read yet, the first one from ``_offset``
+        # on, ``_buffered`` bytes in all. Reads take views of the chunks, so
+        # each byte is copied once, into what the caller gets.
+        self._chunks = deque()
+        self._offset = 0
+        self._buffered = 0
         self._stream_iter = None
         self._stream_exhausted = False
 
@@ -206,15 +472,19 @@ class AioHttpxStreamingBody(AioStreamingBodyBase):
             # aiter_bytes decodes; counts must match wire Content-Length/checksums
             self._stream_iter = self._raw_stream.aiter_raw().__aiter__()
 
+    async def _next_chunk(self):
+        if self._deadline is None:
+            return await self._stream_iter.__anext__()
+        return await self._deadline.anyio_wait_for(self._stream_iter.__anext__)
+
     async def _fill_buffer(self, min_bytes):
         """Fill internal buffer until it has at least min_bytes or the
         stream is exhausted.
         """
         self._ensure_stream()
-        while len(self._buffer) < min_bytes and not self._stream_exhausted:
+        while self._buffered < min_bytes and not self._stream_exhausted:
             try:
-                chunk = await self._stream_iter.__anext__()
-                self._buffer += chunk
+                chunk = await self._next_chunk()
             except StopAsyncIteration:
                 self._stream_exhausted = True
             except _HTTPX_READ_TIMEOUTS as e:
@@ -223,6 +493,29 @@ class AioHttpxStreamingBody(AioStreamingBodyBase):
                 )
             except _HTTPX_STREAM_ERRORS as e:
                 raise ResponseStreamingError(error=e)
+            else:
+                if chunk:
+                    self._chunks.append(chunk)
+                    self._buffered += len(chunk)
+
+    def _take(self, amt):
+        """Remove up to amt bytes from the buffer, as views of its chunks."""
+        views = []
+        chunks = self._chunks
+        while amt > 0 and chunks:
+            chunk = chunks[0]
+            end = self._offset + amt
+            if end >= len(chunk):
+                view = memoryview(chunk)[self._offset :]
+                chunks.popleft()
+                self._offset = 0
+            else:
+                view = memoryview(chunk)[self._offset : end]
+                self._offset = end
+            views.append(view)
+            amt -= len(view)
+            self._buffered -= len(view)
+        return views
 
     async def read(self, amt=None):
         """Read at most amt bytes from the stream.
@@ -233,11 +526,12 @@ class AioHttpxStreamingBody(AioStreamingBodyBase):
 
         # a negative amt means read-all to file-like callers, as it does to aiohttp
         if amt is None or amt < 0:
-            chunks = [self._buffer]
-            self._buffer = b''
+            chunks = self._take(self._buffered)
             try:
-                async for chunk in self._stream_iter:
-                    chunks.append(chunk)
+                while True:
+                    chunks.append(await self._next_chunk())
+            except StopAsyncIteration:
+                pass
             except _HTTPX_READ_TIMEOUTS as e:
                 raise AioReadTimeoutError(
                     endpoint_url=self._raw_stream.url, error=e
@@ -250,23 +544,50 @@ class AioHttpxStreamingBody(AioStreamingBodyBase):
             return b''
         else:
             await self._fill_buffer(amt)
-            result = self._buffer[:amt]
-            self._buffer = self._buffer[amt:]
+            result = self._read_buffered(amt)
 
         self._amount_read += len(result)
         if amt is None or (not result and amt > 0):
             self._verify_content_length()
         return result
 
+    def _read_buffered(self, amt):
+        amt = min(amt, self._buffered)
+        if not amt:
+            return b''
+        chunk = self._chunks[0]
+        end = self._offset + amt
+        if end < len(chunk):
+            # Within the first chunk, by far the most common case.
+            result = chunk[self._offset : end]
+            self._offset = end
+            self._buffered -= amt
+        elif not self._offset and end == len(chunk):
+            # A whole chunk, which needs no copy.
+            result = self._chunks.popleft()
+            self._buffered -= amt
+        else:
+            result = b''.join(self._take(amt))
+        return result
+
+    async def _read_any(self, amt):
+        await self._fill_buffer(1)
+        result = self._read_buffered(amt)
+        self._amount_read += len(result)
+        if not result:
+            self._verify_content_length()
+        return result
+
     async def readinto(self, b: bytearray):
         if len(b) == 0:
             return 0
 
-        await self._fill_buffer(len(b))
-        chunk = self._buffer[: len(b)]
-        amount_read = len(chunk)
-        b[:amount_read] = chunk
-        self._buffer = self._buffer[amount_read:]
+        target = memoryview(b).cast('B')
+        await self._fill_buffer(len(target))
+        amount_read = 0
+        for view in self._take(len(target)):
+            target[amount_read : amount_read + len(view)] = view
+            amount_read += len(view)
 
         self._amount_read += amount_read
         if amount_read == 0 and len(b) > 0:
@@ -274,7 +595,7 @@ class AioHttpxStreamingBody(AioStreamingBodyBase):
         return amount_read
 
     def readable(self):
-        return bool(self._buffer) or not self._stream_exhausted
+        return bool(self._buffered) or not self._stream_exhausted
 
     async def close(self):
         """Close the underlying httpx response (async-only — httpx has no
@@ -284,6 +605,45 @@ class AioHttpxStreamingBody(AioStreamingBodyBase):
 
     aclose = close
 
+    def _create_event(self):
+        import anyio
+
+        return anyio.Event()
+
+    async def _run_in_thread(self, func, *args):
+        import anyio.to_thread
+
+        return await anyio.to_thread.run_sync(func, *args)
+
+    async def _run_concurrently(self, *funcs):
+        import anyio
+
+        errors = []
+
+        async def run(func):
+            try:
+                await func()
+            except Exception as e:
+                # Raised as is below, not in an exception group.
+                errors.append(e)
+                tg.cancel_scope.cancel()
+
+        async with anyio.create_task_group() as tg:
+            for func in funcs:
+                tg.start_soon(run, func)
+        if errors:
+            raise errors[0]
+
+
+def _write_all(write, data):
+    """Write all of data with write, which may write only part of it."""
+    while data:
+        written = write(data)
+        if written is None:
+            # Buffered and text-like writers write everything.
+            return
+        data = data[written:]
+
 
 # Backwards-compatibility aliases. External code imports these names from
 # aiobotocore.response; keeping them here avoids a breaking rename.
@@ -0,0 +1,185 @@
+"""Opt-in cache of API responses for read-only operations.
+
+Control-plane reads like ``DescribeTable`` or ``GetQueueUrl`` are often
+repeated far more often than their results change. A :class:`ResponseCache`
+passed as ``AioConfig(response_cache=...)`` answers them from memory for a
+per-operation TTL::
+
+    cache = ResponseCache({'DescribeTable': 60, 'GetQueueUrl': 300})
+    config = AioConfig(response_cache=cache)
+
+The cache hooks into the client's events: a hit is returned by a
+``before-call`` handler, which skips signing and sending the request like
+the stubber does, and responses are stored by an ``after-call`` handler.
+Entries are keyed by the operation, its parameters and the request URL, so
+one cache can be shared by clients of different services and regions. It
+does not tell credentials apart, so do not share it between clients whose
+credentials may see different results.
+
+Callers get deep copies of the cached responses, so they cannot change the
+cache. Operations with streaming or event stream output are never cached.
+"""
+
+import copy
+import re
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+from ._coalesce import _freeze
+from .awsrequest import AioAWSResponse
+
+DEFAULT_MAXSIZE = 1024
+
+# Error codes of the "not found" errors cached with ``negative_ttl``, in
+# addition to any HTTP 404.
+_NOT_FOUND_CODE_RE = re.compile(
+    r'NotFound|NoSuch|DoesNotExist|NonExistent|NotExist'
+)
+
+# Added to the request context between parameter build and ``before-call``.
+_PARAMS_KEY = 'response_cache_params'
+# Added to the request context on a miss, for ``after-call``.
+_ENTRY_KEY = 'response_cache_key'
+
+
+class ResponseCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _Entry(NamedTuple):
+    expires_at: float
+    status_code: int
+    headers: dict
+    parsed: dict
+    operation_name: str
+    params: dict
+
+
+def _is_not_found(status_code, parsed):
+    if status_code == 404:
+        return True
+    code = parsed.get('Error', {}).get('Code')
+    return bool(code) and _NOT_FOUND_CODE_RE.search(code) is not None
+
+
+class ResponseCache:
+    """A size-bounded LRU cache of responses with per-operation TTLs.
+
+    :param ttls: Operation names, e.g. ``'DescribeTable'``, mapped to the
+        number of seconds their responses are cached for. Other operations
+        are not cached.
+    :param maxsize: The number of responses kept, least recently used ones
+        are dropped first.
+    :param negative_ttl: If set, "not found" errors of the cached operations
+        are cached for this many seconds, or their operation's TTL if lower.
+    """
+
+    def __init__(self, ttls, maxsize=DEFAULT_MAXSIZE, negative_ttl=None):
+        self._ttls = dict(ttls)
+        self._maxsize = maxsize
+        self._negative_ttl = negative_ttl
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def info(self):
+        return ResponseCacheInfo(
+            self._hits, self._misses, self._maxsize, len(self._entries)
+        )
+
+    def invalidate(self, operation_name=None, **params):
+        """Drop cached responses.
+
+        Without arguments, drops everything. Otherwise only drops responses
+        of ``operation_name``, if given, to calls made with all of
+        ``params``, e.g. ``invalidate('DescribeTable', TableName='foo')``.
+        """
+        for key, entry in list(self._entries.items()):
+            if (
+                operation_name is None
+                or entry.operation_name == operation_name
+            ) and all(
+                name in entry.params and entry.params[name] == value
+                for name, value in params.items()
+            ):
+                del self._entries[key]
+
+    def clear(self):
+        self._entries.clear()
+        self._hits = self._misses = 0
+
+    def register(self, event_emitter, service_id):
+        """Register the cache's handlers for a client's events."""
+        event_emitter.register(
+            f'before-parameter-build.{service_id}', self._record_params
+        )
+        event_emitter.register(f'before-call.{service_id}', self._lookup)
+        event_emitter.register(f'after-call.{service_id}', self._store)
+
+    def _is_cached(self, model):
+        return (
+            model.name in self._ttls
+            and not model.has_streaming_output
+            and not model.has_event_stream_output
+        )
+
+    def _record_params(self, params, model, context, **kwargs):
+        if self._is_cached(model):
+            context[_PARAMS_KEY] = copy.deepcopy(params)
+
+    def _lookup(self, model, params, context, **kwargs):
+        api_params = context.get(_PARAMS_KEY)
+        if api_params is None:
+            return None
+        try:
+            key = (model.name, params['url'], _freeze(api_params))
+        except TypeError:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > time.monotonic():
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return (
+                    AioAWSResponse(
+                        params['url'], entry.status_code, entry.headers, None
+                    ),
+                    copy.deepcopy(entry.parsed),
+                )
+            del self._entries[key]
+        self._misses += 1
+        context[_ENTRY_KEY] = key
+        return None
+
+    def _store(self, http_response, parsed, model, context, **kwargs):
+        key = context.pop(_ENTRY_KEY, None)
+        if key is None:
+            return
+        ttl = self._ttls[model.name]
+        status_code = http_response.status_code
+        if status_code >= 300:
+            if self._negative_ttl is None or not _is_not_found(
+                status_code, parsed
+            ):
+                return
+            ttl = min(ttl, self._negative_ttl)
+
+        parsed = copy.deepcopy(parsed)
+        # Timings belong to the call that made the request.
+        parsed.get('ResponseMetadata', {}).pop('PhaseTimings', None)
+        self._entries[key] = _Entry(
+            time.monotonic() + ttl,
+            status_code,
+            dict(http_response.headers),
+            parsed,
+            model.name,
+            context[_PARAMS_KEY],
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
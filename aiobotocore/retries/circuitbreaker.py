@@ -0,0 +1,214 @@
+"""Opt-in client-side circuit breaking per endpoint host.
+
+When an endpoint browns out, retrying against it only piles up requests
+waiting for connections. A :class:`CircuitBreaker` passed as
+``AioConfig(circuit_breaker=...)`` tracks the outcome of every attempt per
+endpoint host, and opens the host's circuit when too many fail::
+
+    config = AioConfig(circuit_breaker=CircuitBreaker(reset_timeout=10))
+
+Attempts fail when they get a connection error, a timeout or a 5xx
+response. The circuit opens when ``consecutive_failures`` attempts in a
+row got a connection error or timeout, or when at least ``failure_rate`` of
+the last ``window_size`` attempts failed, once there were ``min_calls``.
+
+While it is open, requests to the host raise :class:`CircuitOpenError`
+instead of being sent, which is not retried. After ``reset_timeout``
+seconds it is half-open: ``half_open_probes`` requests are let through, and
+it closes once they all succeed or opens again as soon as one fails.
+
+Each change of state is emitted as the
+``circuit-breaker-state-change.<service>`` event, with the ``host``, its
+``state`` and its ``previous_state``. One breaker can be shared by several
+clients, which then share the state of the hosts they call.
+"""
+
+import logging
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+from botocore.exceptions import BotoCoreError, ConnectionError, HTTPClientError
+
+from ..deadline import DeadlineExceededError
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+# Errors of attempts that could not reach the host, or timed out.
+_CONNECTION_ERRORS = (ConnectionError, HTTPClientError, DeadlineExceededError)
+
+
+class CircuitOpenError(BotoCoreError):
+    fmt = 'The circuit breaker for {host} is open, the request was not sent'
+
+
+class _Circuit:
+    __slots__ = (
+        'state',
+        'outcomes',
+        'consecutive_failures',
+        'changed_at',
+        'probes',
+        'probe_successes',
+    )
+
+    def __init__(self, window_size):
+        self.state = CLOSED
+        # True for each failed attempt of the window.
+        self.outcomes = deque(maxlen=window_size)
+        self.consecutive_failures = 0
+        self.changed_at = 0.0
+        self.probes = 0
+        self.probe_successes = 0
+
+
+class CircuitBreaker:
+    """Circuit breakers for the endpoint hosts called by clients.
+
+    :param failure_rate: The fraction of failed attempts in the window that
+        opens the circuit.
+    :param window_size: The number of recent attempts the failure rate is
+        computed over.
+    :param min_calls: The number of attempts in the window before the
+        failure rate is used.
+    :param consecutive_failures: The number of connection errors or timeouts
+        in a row that opens the circuit.
+    :param reset_timeout: Seconds the circuit stays open before probing the
+        host.
+    :param half_open_probes: The number of requests let through while half
+        open, which must all succeed for the circuit to close.
+    """
+
+    def __init__(
+        self,
+        failure_rate=0.5,
+        window_size=20,
+        min_calls=10,
+        consecutive_failures=5,
+        reset_timeout=30,
+        half_open_probes=1,
+    ):
+        self._failure_rate = failure_rate
+        self._window_size = window_size
+        self._min_calls = min_calls
+        self._consecutive_failures = consecutive_failures
+        self._reset_timeout = reset_timeout
+        self._half_open_probes = half_open_probes
+        self._circuits = {}
+
+    def state(self, host):
+        """Return the state of the circuit of ``host``, e.g. ``'open'``.
+
+        ``host`` includes the port if the endpoint URL has one.
+        """
+        circuit = self._circuits.get(host)
+        return circuit.state if circuit is not None else CLOSED
+
+    def register(self, event_emitter, service_id):
+        """Register the breaker's handlers for a client's events."""
+        event_name = f'circuit-breaker-state-change.{service_id}'
+
+        async def emit_change(host, state, previous_state):
+            logger.debug(
+                'Circuit breaker for %s changed from %s to %s',
+                host,
+                previous_state,
+                state,
+            )
+            await event_emitter.emit(
+                event_name,
+                host=host,
+                state=state,
+                previous_state=previous_state,
+            )
+
+        async def before_send(request, **kwargs):
+            host = urlsplit(request.url).netloc
+            previous_state = self.state(host)
+            allowed = self._allow(host)
+            if (state := self.state(host)) != previous_state:
+                await emit_change(host, state, previous_state)
+            if not allowed:
+                raise CircuitOpenError(host=host)
+
+        async def needs_retry(
+            request_dict, response=None, caught_exception=None, **kwargs
+        ):
+            host = urlsplit(request_dict['url']).netloc
+            previous_state = self.state(host)
+            self._record(host, response, caught_exception)
+            if (state := self.state(host)) != previous_state:
+                await emit_change(host, state, previous_state)
+
+        event_emitter.register(f'before-send.{service_id}', before_send)
+        event_emitter.register(f'needs-retry.{service_id}', needs_retry)
+
+    def _allow(self, host):
+        circuit = self._circuits.get(host)
+        if circuit is None or circuit.state == CLOSED:
+            return True
+        now = time.monotonic()
+        if circuit.state == OPEN:
+            if now - circuit.changed_at < self._reset_timeout:
+                return False
+            self._change(circuit, HALF_OPEN, now)
+        elif circuit.probes >= self._half_open_probes:
+            if now - circuit.changed_at < self._reset_timeout:
+                return False
+            # The probes never reported back, e.g. as they were cancelled.
+            self._change(circuit, HALF_OPEN, now)
+        circuit.probes += 1
+        return True
+
+    def _record(self, host, response, caught_exception):
+        if caught_exception is not None:
+            if not isinstance(caught_exception, _CONNECTION_ERRORS):
+                # Not an outcome of the host, e.g. CircuitOpenError.
+                return
+            failed = connection_failed = True
+        elif response is not None:
+            failed = response[0].status_code >= 500
+            connection_failed = False
+        else:
+            return
+
+        circuit = self._circuits.get(host)
+        if circuit is None:
+            circuit = self._circuits[host] = _Circuit(self._window_size)
+
+        if circuit.state == HALF_OPEN:
+            if failed:
+                self._change(circuit, OPEN, time.monotonic())
+            else:
+                circuit.probe_successes += 1
+                if circuit.probe_successes >= self._half_open_probes:
+                    self._change(circuit, CLOSED, time.monotonic())
+            return
+        if circuit.state == OPEN:
+            # Sent before the circuit opened.
+            return
+
+        circuit.outcomes.append(failed)
+        if connection_failed:
+            circuit.consecutive_failures += 1
+        else:
+            circuit.consecutive_failures = 0
+        if circuit.consecutive_failures >= self._consecutive_failures or (
+            len(circuit.outcomes) >= self._min_calls
+            and sum(circuit.outcomes) / len(circuit.outcomes)
+            >= self._failure_rate
+        ):
+            self._change(circuit, OPEN, time.monotonic())
+
+    @staticmethod
+    def _change(circuit, state, now):
+        circuit.state = state
+        circuit.changed_at = now
+        circuit.probes = circuit.probe_successes = 0
+        if state == CLOSED:
+            circuit.outcomes.clear()
+            circuit.consecutive_failures = 0
@@ -25,7 +25,11 @@ from .hooks import AioHierarchicalEmitter
 from .httpsession import AIOHTTPSession
 from .parsers import AioResponseParserFactory
 from .tokens import create_token_resolver
-from .utils import AioIMDSRegionProvider, AnyioIMDSRegionProvider
+from .utils import (
+    AioIMDSRegionProvider,
+    AnyioIMDSRegionProvider,
+    _SharedHttpSessions,
+)
 
 
 class ClientCreatorContext:
@@ -57,6 +61,8 @@ class AioSession(_SyncSession):
             session_vars, event_hooks, include_builtin_handlers, profile
         )
         self._set_user_agent_for_session()
+        # Connection pools for clients created with share_http_session=True.
+        self._shared_http_sessions = _SharedHttpSessions()
 
     @property
     def _async_primitives(self):
@@ -316,6 +322,7 @@ class AioSession(_SyncSession):
             config_store,
             user_agent_creator=user_agent_creator,
             auth_token_resolver=self.get_auth_token,
+            http_session_registry=self._shared_http_sessions,
         )
         client = await client_creator.create_client(
             service_name=service_name,
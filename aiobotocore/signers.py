@@ -16,6 +16,8 @@ from botocore.signers import (
 from botocore.tokens import FrozenAuthToken
 from botocore.utils import ArnParser
 
+from ._timing import timed_phase
+
 
 class AioRequestSigner(RequestSigner):
     async def handler(self, operation_name=None, request=None, **kwargs):
@@ -23,7 +25,8 @@ class AioRequestSigner(RequestSigner):
         # from a client's event emitter.  When a new request is created
         # this method is invoked to sign the request.
         # Don't call this method directly.
-        return await self.sign(operation_name, request)
+        with timed_phase('sign'):
+            return await self.sign(operation_name, request)
 
     async def sign(
         self,
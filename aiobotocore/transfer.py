@@ -0,0 +1,291 @@
+"""Parallel downloads of large S3 objects.
+
+A single ``GetObject`` stream is limited by the throughput of one
+connection. :func:`download` splits an object into parts and fetches them
+with ``GetObject`` calls, ``concurrency`` at a time, writing each part at its
+offset in a file or a writable buffer::
+
+    state = DownloadState()
+    try:
+        await download(s3_client, bucket, key, path, state=state)
+    except (BotoCoreError, ClientError):
+        # Fetches only the parts that are missing.
+        await download(s3_client, bucket, key, path, state=state)
+
+Every part is fetched with ``IfMatch`` set to the ETag the object had when
+the download started, so parts of different versions of the object are
+never mixed: if it changed, the download fails with a ``PreconditionFailed``
+error and must be started over with a new :class:`DownloadState`.
+
+An object uploaded in parts with checksums is fetched by ``PartNumber``,
+one GET for each part it was uploaded in, with ``ChecksumMode`` enabled, so
+S3 returns the checksum of each part and it is validated as the part is
+read. Other objects, for which S3 has no checksums of ranges, are fetched
+with ranged GETs of ``part_size`` bytes, and only have the length of each
+part verified. An object of a single part is fetched without a range, so its
+checksum is still validated if the client's ``response_checksum_validation``
+enables it.
+
+A response must have exactly the bytes of its part, or the download fails
+with :class:`PartMismatchError`, e.g. for an endpoint that ignores
+``Range``.
+"""
+
+import asyncio
+import os
+
+from botocore.exceptions import BotoCoreError, IncompleteReadError
+
+from ._async_primitives import AsyncPrimitives, infer_async_primitives
+from ._helpers import resolve_awaitable
+
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_CONCURRENCY = 8
+
+
+class PartMismatchError(BotoCoreError):
+    fmt = (
+        'Expected {expected} of s3://{bucket}/{key}, the response has '
+        '{content_length} bytes and Content-Range {content_range}'
+    )
+
+
+class DownloadState:
+    """The progress of a download, which resumes it when passed again.
+
+    Use :meth:`to_dict` and :meth:`from_dict` to resume it in another
+    process.
+    """
+
+    def __init__(self):
+        self.bucket = None
+        self.key = None
+        self.etag = None
+        self.size = None
+        self.part_size = None
+        # Set instead of part_size for an object fetched by part number.
+        self.part_count = None
+        # The indexes of the parts written already.
+        self.completed = set()
+
+    @property
+    def started(self):
+        return self.etag is not None
+
+    def to_dict(self):
+        return {
+            'bucket': self.bucket,
+            'key': self.key,
+            'etag': self.etag,
+            'size': self.size,
+            'part_size': self.part_size,
+            'part_count': self.part_count,
+            'completed': sorted(self.completed),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        state = cls()
+        state.bucket = data['bucket']
+        state.key = data['key']
+        state.etag = data['etag']
+        state.size = data['size']
+        state.part_size = data['part_size']
+        state.part_count = data.get('part_count')
+        state.completed = set(data['completed'])
+        return state
+
+
+async def download(
+    client,
+    bucket,
+    key,
+    dest,
+    part_size=DEFAULT_PART_SIZE,
+    concurrency=DEFAULT_CONCURRENCY,
+    state=None,
+    progress=None,
+    extra_args=None,
+):
+    """Download an S3 object into dest with parallel ranged GETs, and return
+    its size.
+
+    :param client: An S3 client.
+    :param dest: A path, or a writable bytes-like object at least as large
+        as the object, e.g. a bytearray, mmap or numpy array. A path is
+        created, or truncated, unless the download is resumed.
+    :param part_size: The number of bytes fetched by each GET, unless the
+        object is fetched by part number.
+    :param concurrency: The number of GETs in flight at a time.
+    :param state: A :class:`DownloadState` to record the progress in, or to
+        resume a download that failed from.
+    :param progress: A function, or coroutine function, called with the
+        number of bytes of each part once it is written.
+    :param extra_args: Further ``GetObject`` parameters, e.g. ``VersionId``
+        or ``SSECustomerKey``, which are also passed to the ``HeadObject``
+        call that gets the object's size and ETag if it takes them.
+    """
+    if state is None:
+        state = DownloadState()
+    extra_args = dict(extra_args or {})
+
+    if not state.started:
+        head_args = client.meta.service_model.operation_model(
+            'HeadObject'
+        ).input_shape.members
+        head_params = {
+            'Bucket': bucket,
+            'Key': key,
+            'ChecksumMode': 'ENABLED',
+            **{k: v for k, v in extra_args.items() if k in head_args},
+        }
+        head = await client.head_object(**head_params)
+        state.bucket = bucket
+        state.key = key
+        state.etag = head['ETag']
+        state.size = head['ContentLength']
+        if _has_part_checksums(head):
+            # If the object changes in between, the GETs of its parts fail.
+            part_head = await client.head_object(**head_params, PartNumber=1)
+            if part_head.get('PartsCount', 1) > 1:
+                state.part_count = part_head['PartsCount']
+        if state.part_count is None:
+            state.part_size = part_size
+        resuming = False
+    elif (state.bucket, state.key) != (bucket, key):
+        raise ValueError(
+            f'The download state is of s3://{state.bucket}/{state.key}'
+        )
+    else:
+        resuming = True
+
+    size = state.size
+    part_size = state.part_size
+    if state.part_count is not None:
+        part_count = state.part_count
+    else:
+        part_count = (size + part_size - 1) // part_size
+
+    if isinstance(dest, (str, os.PathLike)):
+        if not resuming:
+            await _run_in_thread(client, _create_file, dest, size)
+        target = None
+    else:
+        target = memoryview(dest).cast('B')
+        if len(target) < size:
+            raise ValueError(
+                f'The buffer of {len(target)} bytes is smaller than the '
+                f'object of {size} bytes'
+            )
+
+    async def fetch(index):
+        params = {
+            **extra_args,
+            'Bucket': bucket,
+            'Key': key,
+            'IfMatch': state.etag,
+        }
+        if state.part_count is not None:
+            params['PartNumber'] = index + 1
+            params['ChecksumMode'] = 'ENABLED'
+            expected = f'part {index + 1}'
+        else:
+            start = index * part_size
+            end = min(start + part_size, size)
+            if part_count > 1:
+                params['Range'] = f'bytes={start}-{end - 1}'
+            expected = f'bytes {start}-{end - 1}'
+        response = await client.get_object(**params)
+        async with response['Body'] as body:
+            content_range = response.get('ContentRange')
+            if state.part_count is not None:
+                # The offsets of the parts are only known from the responses.
+                start, end = _parse_content_range(content_range, size)
+            if response['ContentLength'] != end - start or (
+                part_count > 1
+                and content_range != f'bytes {start}-{end - 1}/{size}'
+            ):
+                # E.g. an endpoint that ignores Range sends the whole object.
+                raise PartMismatchError(
+                    expected=expected,
+                    bucket=bucket,
+                    key=key,
+                    content_length=response['ContentLength'],
+                    content_range=content_range,
+                )
+            if target is not None:
+                amount = await body.download_into(target[start:end])
+            else:
+                fileobj = await _run_in_thread(client, _open_at, dest, start)
+                try:
+                    amount = await body.download_to(fileobj)
+                finally:
+                    await _run_in_thread(client, fileobj.close)
+            if amount != end - start:
+                raise IncompleteReadError(
+                    actual_bytes=amount, expected_bytes=end - start
+                )
+        state.completed.add(index)
+        if progress is not None:
+            await resolve_awaitable(progress(end - start))
+
+    params = (
+        {'index': index}
+        for index in range(part_count)
+        if index not in state.completed
+    )
+    async with client.map(
+        fetch, params, concurrency, ordered=False
+    ) as results:
+        async for _ in results:
+            pass
+    return size
+
+
+def _has_part_checksums(head):
+    """Whether S3 has checksums of the parts of an object, i.e. it was
+    uploaded in parts with checksums that are not of the full object.
+    """
+    return (
+        '-' in head['ETag']
+        and head.get('ChecksumType') != 'FULL_OBJECT'
+        and any(
+            name.startswith('Checksum') and name != 'ChecksumType'
+            for name in head
+        )
+    )
+
+
+def _parse_content_range(content_range, size):
+    """Return the start and end of a ``bytes start-last/size`` range within
+    an object of size bytes, or (0, 0) if it is not one.
+    """
+    unit, _, byte_range = (content_range or '').partition(' ')
+    first, _, rest = byte_range.partition('-')
+    last, _, total = rest.partition('/')
+    if not (unit == 'bytes' and first.isdigit() and last.isdigit()):
+        return 0, 0
+    start, end = int(first), int(last) + 1
+    if total != str(size) or not start < end <= size:
+        return 0, 0
+    return start, end
+
+
+def _create_file(path, size):
+    with open(path, 'wb') as f:
+        f.truncate(size)
+
+
+def _open_at(path, offset):
+    f = open(path, 'r+b')
+    f.seek(offset)
+    return f
+
+
+async def _run_in_thread(client, func, *args):
+    http_session_cls = client.meta.config.http_session_cls
+    if infer_async_primitives(http_session_cls) is AsyncPrimitives.ANYIO:
+        import anyio.to_thread
+
+        return await anyio.to_thread.run_sync(func, *args)
+    return await asyncio.to_thread(func, *args)
@@ -96,6 +96,55 @@ class _RefCountedHttpxSession(
         return anyio.Lock()
 
 
+def _freeze_session_arg(value):
+    if isinstance(value, dict):
+        return tuple(
+            sorted((k, _freeze_session_arg(v)) for k, v in value.items())
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_session_arg(v) for v in value)
+    return value
+
+
+def _ref_counted_session_cls(http_session_cls):
+    if http_session_cls is aiobotocore.httpsession.AIOHTTPSession:
+        return _RefCountedSession
+    if http_session_cls is aiobotocore.httpxsession.HttpxSession:
+        return _RefCountedHttpxSession
+    # A user-provided backend: keep its behaviour, borrow the matching lock.
+    if aiobotocore.httpxsession.is_httpx_session_cls(http_session_cls):
+        create_lock = _RefCountedHttpxSession._create_lock
+    else:
+        create_lock = _RefCountedSessionMixin._create_lock
+    return type(
+        f'_RefCounted{http_session_cls.__name__}',
+        (_RefCountedSessionMixin, http_session_cls),
+        {'_create_lock': create_lock},
+    )
+
+
+class _SharedHttpSessions:
+    """The HTTP sessions an ``AioSession`` shares between its clients.
+
+    Clients created with ``AioConfig(share_http_session=True)`` take their
+    HTTP session from here rather than building their own, so every client
+    with the same transport settings (proxies, TLS, timeouts, pool limits)
+    draws from one connection pool. Each client holds a reference through
+    ``acquire()``; the pool is closed when the last reference is released and
+    reopened by the next client to acquire it.
+    """
+
+    def __init__(self):
+        self._sessions = {}
+
+    def get_session(self, http_session_cls, **session_kwargs):
+        key = (http_session_cls, _freeze_session_arg(session_kwargs))
+        if (session := self._sessions.get(key)) is None:
+            session_cls = _ref_counted_session_cls(http_session_cls)
+            session = self._sessions[key] = session_cls(**session_kwargs)
+        return session
+
+
 class AioIMDSFetcher(IMDSFetcher):
     # aiohttp is asyncio-only; the httpx backend also runs on trio.
     _ref_counted_session_cls = _RefCountedSession
@@ -0,0 +1,122 @@
+"""Measure iterating over a large response body, in chunks and in lines.
+
+Serves a body from a local aiohttp server and iterates over it through
+``AioStreamingBody`` and, if httpx is installed, ``AioHttpxStreamingBody``,
+comparing ``iter_chunks()`` in 1k chunks with ``iter_any()``, and the
+previous ``iter_lines()``, which re-joined the unended line with each chunk
+and split every line twice, with the current one, for short lines and for
+lines longer than a chunk.
+
+Usage::
+
+    python scripts/benchmark_body_iteration.py [--size-mb 64]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+import aiohttp
+import aiohttp.web
+
+from aiobotocore._httpx import httpx
+from aiobotocore.response import AioHttpxStreamingBody, AioStreamingBody
+
+_WRITE_SIZE = 64 * 1024
+_LINE_LENGTHS = (100, 64 * 1024)
+
+
+async def previous_iter_lines(body, chunk_size=1024, keepends=False):
+    pending = b''
+    async for chunk in body.iter_chunks(chunk_size):
+        lines = (pending + chunk).splitlines(True)
+        for line in lines[:-1]:
+            yield line.splitlines(keepends)[0]
+        pending = lines[-1]
+    if pending:
+        yield pending.splitlines(keepends)[0]
+
+
+async def iterate(iterator):
+    async for _ in iterator:
+        pass
+
+
+_CASES = {
+    'iter_chunks(1024)': lambda body: body.iter_chunks(1024),
+    'iter_any()': lambda body: body.iter_any(),
+    'previous iter_lines': previous_iter_lines,
+    'iter_lines()': lambda body: body.iter_lines(),
+}
+
+
+async def serve(size, line_length):
+    line = b'x' * (line_length - 1) + b'\n'
+    block = line * (_WRITE_SIZE // line_length) or line
+    count = max(size // len(block), 1)
+
+    async def handler(request):
+        response = aiohttp.web.StreamResponse(
+            headers={'Content-Length': str(len(block) * count)}
+        )
+        await response.prepare(request)
+        for _ in range(count):
+            await response.write(block)
+        return response
+
+    app = aiohttp.web.Application()
+    app.router.add_get('/', handler)
+    runner = aiohttp.web.AppRunner(app)
+    await runner.setup()
+    site = aiohttp.web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    return runner, site.name, len(block) * count
+
+
+async def time_aiohttp(url, case):
+    async with aiohttp.ClientSession() as session:
+        start = time.perf_counter()
+        async with session.get(url) as response:
+            body = AioStreamingBody(response, response.content_length)
+            await iterate(case(body))
+        return time.perf_counter() - start
+
+
+async def time_httpx(url, case):
+    async with httpx.AsyncClient() as client:
+        start = time.perf_counter()
+        async with client.stream('GET', url) as response:
+            body = AioHttpxStreamingBody(
+                response, response.headers['content-length']
+            )
+            await iterate(case(body))
+        return time.perf_counter() - start
+
+
+async def main(size_mb):
+    backends = {'aiohttp': time_aiohttp}
+    if httpx is not None:
+        backends['httpx'] = time_httpx
+    print(f'{"line length":>11} {"case":>20}', end='')
+    print(''.join(f'{name:>14}' for name in backends))
+    for line_length in _LINE_LENGTHS:
+        runner, url, size = await serve(size_mb * 1024 * 1024, line_length)
+        try:
+            for name, case in _CASES.items():
+                print(f'{line_length:>11} {name:>20}', end='')
+                for time_backend in backends.values():
+                    seconds = min(
+                        [await time_backend(url, case) for _ in range(3)]
+                    )
+                    print(f'{size / seconds / 1e6:9.0f} MB/s', end='')
+                print()
+        finally:
+            await runner.cleanup()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size-mb', type=int, default=64)
+    asyncio.run(main(parser.parse_args().size_mb))
@@ -0,0 +1,94 @@
+"""Measure the per-call overhead of ``with_current_context``.
+
+Every API call, paginator page and waiter runs in a new ``ClientContext``.
+This compares the previous implementation, which deep-copied the current
+context in an ``asynccontextmanager`` like botocore does, with the current
+one, which copies only the feature set. Each call reads the features, as
+building the User-Agent header does, inside a scope that registered a
+feature, as waiters do.
+
+Usage::
+
+    python scripts/benchmark_context.py [--calls 50000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from copy import deepcopy
+from functools import wraps
+
+from botocore.context import (
+    ClientContext,
+    get_context,
+    reset_context,
+    set_context,
+)
+from botocore.useragent import register_feature_id
+
+from aiobotocore._helpers import resolve_awaitable
+from aiobotocore.context import with_current_context
+
+
+@asynccontextmanager
+async def _deepcopy_context(ctx=None):
+    current = ctx or get_context()
+    new = ClientContext() if current is None else deepcopy(current)
+    token = set_context(new)
+    try:
+        yield
+    finally:
+        reset_context(token)
+
+
+def deepcopy_with_current_context(hook=None):
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            async with _deepcopy_context():
+                if hook:
+                    await resolve_awaitable(hook())
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+async def run(decorator, calls):
+    @decorator()
+    async def api_call():
+        return get_context().features
+
+    @decorator(lambda: register_feature_id('WAITER'))
+    async def waiter():
+        start = time.perf_counter()
+        for _ in range(calls):
+            await api_call()
+        return (time.perf_counter() - start) / calls
+
+    return await waiter()
+
+
+async def main(calls):
+    results = {}
+    for name, decorator in (
+        ('deepcopy', deepcopy_with_current_context),
+        ('feature copy', with_current_context),
+    ):
+        # Warm up, then keep the best of a few runs.
+        await run(decorator, calls // 10)
+        results[name] = min([await run(decorator, calls) for _ in range(3)])
+    for name, seconds in results.items():
+        print(f'{name:>14}: {seconds * 1e6:.2f} us per call')
+    speedup = results['deepcopy'] / results['feature copy']
+    print(f'{"speedup":>14}: {speedup:.1f}x')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=50_000)
+    asyncio.run(main(parser.parse_args().calls))
@@ -0,0 +1,106 @@
+"""Measure reading a large httpx response body at several read sizes.
+
+Serves a body from a local aiohttp server and reads it through
+``AioHttpxStreamingBody`` with ``read(amt)``, comparing the previous
+implementation, which kept unread bytes in a ``bytes`` buffer it appended
+chunks to and sliced on every read, with the current one, which keeps the
+received chunks and copies each byte once.
+
+Usage::
+
+    python scripts/benchmark_httpx_body.py [--size-mb 256]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+import aiohttp.web
+
+from aiobotocore._httpx import httpx
+from aiobotocore.response import AioHttpxStreamingBody
+
+_WRITE_SIZE = 64 * 1024
+_READ_SIZES = (1024, 64 * 1024, 1024 * 1024, 8 * 1024 * 1024)
+
+
+class BytesBufferBody(AioHttpxStreamingBody):
+    """The previous buffering, for comparison."""
+
+    def __init__(self, raw_stream, content_length=None):
+        super().__init__(raw_stream, content_length)
+        self._buffer = b''
+
+    async def _fill_buffer(self, min_bytes):
+        self._ensure_stream()
+        while len(self._buffer) < min_bytes and not self._stream_exhausted:
+            try:
+                self._buffer += await self._next_chunk()
+            except StopAsyncIteration:
+                self._stream_exhausted = True
+
+    async def read(self, amt=None):
+        await self._fill_buffer(amt)
+        result = self._buffer[:amt]
+        self._buffer = self._buffer[amt:]
+        self._amount_read += len(result)
+        return result
+
+
+async def serve(size):
+    block = b'x' * _WRITE_SIZE
+
+    async def handler(request):
+        response = aiohttp.web.StreamResponse(
+            headers={'Content-Length': str(size)}
+        )
+        await response.prepare(request)
+        for _ in range(size // _WRITE_SIZE):
+            await response.write(block)
+        return response
+
+    app = aiohttp.web.Application()
+    app.router.add_get('/', handler)
+    runner = aiohttp.web.AppRunner(app)
+    await runner.setup()
+    site = aiohttp.web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    return runner, site.name
+
+
+async def read_body(client, url, body_cls, read_size):
+    start = time.perf_counter()
+    async with client.stream('GET', url) as response:
+        body = body_cls(response)
+        while await body.read(read_size):
+            pass
+    return time.perf_counter() - start
+
+
+async def main(size_mb):
+    size = size_mb * 1024 * 1024 // _WRITE_SIZE * _WRITE_SIZE
+    runner, url = await serve(size)
+    try:
+        async with httpx.AsyncClient() as client:
+            print(f'{"read size":>10} {"bytes buffer":>14} {"chunks":>14}')
+            for read_size in _READ_SIZES:
+                results = []
+                for body_cls in (BytesBufferBody, AioHttpxStreamingBody):
+                    seconds = min(
+                        [
+                            await read_body(client, url, body_cls, read_size)
+                            for _ in range(3)
+                        ]
+                    )
+                    results.append(f'{size / seconds / 1e6:9.0f} MB/s')
+                print(f'{read_size:>10} {results[0]:>14} {results[1]:>14}')
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size-mb', type=int, default=256)
+    asyncio.run(main(parser.parse_args().size_mb))
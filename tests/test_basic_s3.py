@@ -320,6 +320,29 @@ async def test_get_object_stream_context(
     assert data == b'body contents'
 
 
+async def test_get_object_download_into(s3_client, create_object, bucket_name):
+    body = bytes(range(256)) * 1024
+    await create_object('foobarbaz', body=body)
+    response = await s3_client.get_object(Bucket=bucket_name, Key='foobarbaz')
+    buffer = bytearray(len(body) + 10)
+    async with response['Body'] as stream:
+        assert await stream.download_into(buffer) == len(body)
+    assert buffer[: len(body)] == body
+
+
+async def test_get_object_download_to(
+    s3_client, create_object, bucket_name, tmp_path
+):
+    body = bytes(range(256)) * 1024
+    await create_object('foobarbaz', body=body)
+    response = await s3_client.get_object(Bucket=bucket_name, Key='foobarbaz')
+    path = tmp_path / 'foobarbaz'
+    async with response['Body'] as stream:
+        written = await stream.download_to(path, chunk_size=64 * 1024)
+    assert written == len(body)
+    assert path.read_bytes() == body
+
+
 async def test_paginate_max_items(
     s3_client, create_multipart_upload, bucket_name
 ):
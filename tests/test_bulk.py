@@ -0,0 +1,144 @@
+import anyio
+import pytest
+from botocore.exceptions import ClientError
+
+
+async def test_map(s3_client, bucket_name, create_object):
+    for i in range(5):
+        await create_object(f'key{i}', body='x' * i)
+
+    keys = ('key0', 'key1', 'missing', 'key3', 'key4')
+
+    async def params():
+        for key in keys:
+            yield {'Bucket': bucket_name, 'Key': key}
+
+    async with s3_client.map(
+        'HeadObject', params(), concurrency=2, return_exceptions=True
+    ) as results:
+        results = [result async for result in results]
+    assert [r['ContentLength'] for r in results[:2] + results[3:]] == [
+        0,
+        1,
+        3,
+        4,
+    ]
+    assert isinstance(results[2], ClientError)
+
+    lengths = []
+    with pytest.raises(ClientError):
+        async with s3_client.map(
+            'head_object',
+            [{'Bucket': bucket_name, 'Key': key} for key in keys],
+            concurrency=1,
+            ordered=False,
+        ) as results:
+            async for result in results:
+                lengths.append(result['ContentLength'])
+    assert lengths == [0, 1]
+
+    # Or with a function making the calls.
+    async def get_length(Key):
+        response = await s3_client.head_object(Bucket=bucket_name, Key=Key)
+        return response['ContentLength']
+
+    async with s3_client.map(
+        get_length, [{'Key': 'key3'}, {'Key': 'key4'}]
+    ) as results:
+        assert [result async for result in results] == [3, 4]
+
+
+async def test_map_backpressure(s3_client):
+    in_flight = 0
+    max_in_flight = 0
+    pulled = 0
+
+    async def call(value):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await anyio.sleep(0.01 * (value % 3))
+        in_flight -= 1
+        return value
+
+    def params():
+        nonlocal pulled
+        for value in range(20):
+            pulled += 1
+            yield {'value': value}
+
+    results = []
+    async with s3_client._bulk_call_cls(call, params(), 3, True, False) as it:
+        async for result in it:
+            # Results not consumed yet take up a slot too.
+            assert pulled - len(results) <= 3
+            results.append(result)
+            await anyio.sleep(0.01)
+    assert results == list(range(20))
+    assert max_in_flight == 3
+
+    results = []
+    async with s3_client._bulk_call_cls(call, params(), 3, False, False) as it:
+        results = [result async for result in it]
+    assert sorted(results) == list(range(20))
+
+
+async def test_map_cancels_calls(s3_client):
+    started = []
+    cancelled = []
+
+    async def call(value):
+        started.append(value)
+        if value == 'fail':
+            raise ValueError(value)
+        try:
+            await anyio.sleep(10)
+        except anyio.get_cancelled_exc_class():
+            cancelled.append(value)
+            raise
+
+    params = [{'value': value} for value in ('a', 'b', 'fail', 'c')]
+    with anyio.fail_after(5):
+        with pytest.raises(ValueError):
+            async with s3_client._bulk_call_cls(
+                call, params, 3, False, False
+            ) as it:
+                async for _ in it:
+                    pass
+    # The last call was never started.
+    assert sorted(started) == ['a', 'b', 'fail']
+    assert sorted(cancelled) == ['a', 'b']
+
+    # Leaving the block cancels the calls in flight.
+    started.clear()
+    cancelled.clear()
+    params = [{'value': value} for value in ('a', 'b')]
+    with anyio.fail_after(5):
+        async with s3_client._bulk_call_cls(call, params, 2, True, True):
+            pass
+        assert sorted(cancelled) == sorted(started)
+
+
+async def test_map_ordered_raises_first_failure(s3_client):
+    cancelled = []
+
+    async def call(value):
+        if value == 'fail':
+            raise ValueError(value)
+        try:
+            await anyio.sleep(10)
+        except anyio.get_cancelled_exc_class():
+            cancelled.append(value)
+            raise
+
+    # The failure is raised, and the slow call before it cancelled, without
+    # waiting for that call.
+    params = [{'value': value} for value in ('slow', 'fail')]
+    with anyio.fail_after(5):
+        with pytest.raises(ValueError):
+            async with s3_client._bulk_call_cls(
+                call, params, 2, True, False
+            ) as it:
+                async for _ in it:
+                    pass
+    assert cancelled == ['slow']
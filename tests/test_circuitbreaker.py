@@ -0,0 +1,117 @@
+from urllib.parse import urlsplit
+
+import anyio
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+from aiobotocore.awsrequest import AioAWSResponse
+from aiobotocore.config import AioConfig
+from aiobotocore.retries.circuitbreaker import CircuitBreaker, CircuitOpenError
+
+
+def _client(session, region, config, endpoint_url, aws_auth, breaker):
+    config = config.merge(
+        AioConfig(
+            circuit_breaker=breaker,
+            retries={'mode': 'standard', 'total_max_attempts': 1},
+        )
+    )
+    return session.create_client(
+        's3',
+        region_name=region,
+        config=config,
+        endpoint_url=endpoint_url,
+        **aws_auth,
+    )
+
+
+def _record_changes(client):
+    changes = []
+    client.meta.events.register(
+        'circuit-breaker-state-change.s3',
+        lambda host, state, previous_state, **kwargs: changes.append(
+            (previous_state, state)
+        ),
+    )
+    return changes
+
+
+async def test_failure_rate(
+    session, region, config, moto_server, aws_auth, bucket_name
+):
+    breaker = CircuitBreaker(
+        window_size=4, min_calls=4, reset_timeout=0.1, half_open_probes=2
+    )
+    host = urlsplit(moto_server).netloc
+    failing = []
+    sent = []
+
+    def before_send(request, **kwargs):
+        sent.append(1)
+        if failing:
+            response = AioAWSResponse(request.url, 503, {}, None)
+            response._content = b''
+            return response
+
+    async with _client(
+        session, region, config, moto_server, aws_auth, breaker
+    ) as client:
+        client.meta.events.register('before-send.s3', before_send)
+        changes = _record_changes(client)
+
+        for fail in (False, True, False, True):
+            failing[:] = [1] if fail else []
+            try:
+                await client.head_bucket(Bucket=bucket_name)
+            except ClientError:
+                assert fail
+        assert breaker.state(host) == 'open'
+        assert changes == [('closed', 'open')]
+
+        with pytest.raises(CircuitOpenError):
+            await client.head_bucket(Bucket=bucket_name)
+        assert len(sent) == 4
+
+        # Half open after the reset timeout, and closed once both probes
+        # succeed.
+        await anyio.sleep(0.15)
+        failing.clear()
+        await client.head_bucket(Bucket=bucket_name)
+        assert breaker.state(host) == 'half-open'
+        await client.head_bucket(Bucket=bucket_name)
+        assert breaker.state(host) == 'closed'
+        assert changes == [
+            ('closed', 'open'),
+            ('open', 'half-open'),
+            ('half-open', 'closed'),
+        ]
+
+
+async def test_consecutive_connection_errors(
+    session, region, config, aws_auth
+):
+    breaker = CircuitBreaker(consecutive_failures=2, reset_timeout=0.1)
+    # Nothing listens there.
+    endpoint_url = 'http://127.0.0.1:1'
+
+    async with _client(
+        session, region, config, endpoint_url, aws_auth, breaker
+    ) as client:
+        changes = _record_changes(client)
+        for _ in range(2):
+            with pytest.raises(EndpointConnectionError):
+                await client.list_buckets()
+        with pytest.raises(CircuitOpenError):
+            await client.list_buckets()
+
+        # A failed probe opens the circuit again.
+        await anyio.sleep(0.15)
+        with pytest.raises(EndpointConnectionError):
+            await client.list_buckets()
+        with pytest.raises(CircuitOpenError):
+            await client.list_buckets()
+        assert changes == [
+            ('closed', 'open'),
+            ('open', 'half-open'),
+            ('half-open', 'open'),
+        ]
@@ -1,7 +1,15 @@
+import json
+
 import pytest
-from botocore.exceptions import OperationNotPageableError
+from botocore.exceptions import (
+    EndpointResolutionError,
+    OperationNotPageableError,
+)
 
+from aiobotocore.config import AioConfig
+from aiobotocore.endpoint_provider import CompiledEndpointProvider
 from aiobotocore.paginate import AioPaginator
+from aiobotocore.session import AioSession
 
 
 async def test_get_paginator_not_supported_by_service(sns_client):
@@ -34,3 +42,178 @@ async def test_get_waiter_invalid_waiter_name(cloudformation_client):
         ValueError, match=f'Waiter does not exist: {waiter_name}'
     ):
         cloudformation_client.get_waiter(waiter_name)
+
+
+async def test_warm_connections_resolves_endpoints(session, mocker):
+    async with session.create_client(
+        's3',
+        region_name='us-east-1',
+        aws_access_key_id='xxx',
+        aws_secret_access_key='xxx',
+    ) as client:
+        warm = mocker.patch.object(
+            client._endpoint.http_session, 'warm_connections'
+        )
+        await client.warm_connections(
+            4,
+            endpoints=[
+                ('HeadBucket', {'Bucket': 'my-bucket'}),
+                ('get_object', {'Bucket': 'my-bucket', 'Key': 'k'}),
+                'https://example.com',
+            ],
+        )
+        assert warm.call_args_list == [
+            mocker.call('https://my-bucket.s3.amazonaws.com', 4),
+            mocker.call('https://example.com', 4),
+        ]
+
+        warm.reset_mock()
+        await client.warm_connections()
+        warm.assert_called_once_with(client.meta.endpoint_url, 1)
+
+
+@pytest.mark.config_kwargs({'collect_phase_timings': True})
+async def test_phase_timings(s3_client, bucket_name, create_bucket):
+    await create_bucket(bucket_name)
+    events = []
+    s3_client.meta.events.register(
+        'phase-timings.s3.PutObject',
+        lambda timings, **kwargs: events.append(timings),
+    )
+    response = await s3_client.put_object(
+        Bucket=bucket_name, Key='key', Body=b'data'
+    )
+
+    timings = response['ResponseMetadata']['PhaseTimings']
+    assert events == [timings]
+    phases = [phase for phase, _, _ in timings]
+    for phase in ('resolve_endpoint', 'serialize', 'sign', 'send', 'parse'):
+        assert phase in phases
+    assert phases.index('sign') < phases.index('send') < phases.index('parse')
+    assert all(start <= end for _, start, end in timings)
+
+
+async def test_phase_timings_off_by_default(s3_client):
+    response = await s3_client.list_buckets()
+    assert 'PhaseTimings' not in response['ResponseMetadata']
+
+
+async def test_endpoint_resolution_is_cached(session):
+    async with session.create_client(
+        's3',
+        region_name='us-east-1',
+        aws_access_key_id='xxx',
+        aws_secret_access_key='xxx',
+    ) as client:
+        resolver = client._ruleset_resolver
+        operation_model = client.meta.service_model.operation_model(
+            'GetObject'
+        )
+
+        async def resolve(**params):
+            url, _, _ = await client._resolve_endpoint_ruleset(
+                operation_model, params, {}
+            )
+            return url
+
+        # The object key is not a ruleset input, so it shares the entry.
+        url = await resolve(Bucket='my-bucket', Key='a')
+        assert url == 'https://my-bucket.s3.amazonaws.com'
+        assert await resolve(Bucket='my-bucket', Key='b') == url
+        info = resolver.endpoint_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+        # Builtins customized by handlers are part of the key.
+        def use_region(builtins, **kwargs):
+            builtins['AWS::Region'] = 'eu-west-1'
+
+        client.meta.events.register(
+            'before-endpoint-resolution.s3', use_region
+        )
+        assert (
+            await resolve(Bucket='my-bucket', Key='a')
+            == 'https://my-bucket.s3.eu-west-1.amazonaws.com'
+        )
+        assert resolver.endpoint_cache_info().misses == 2
+
+
+@pytest.mark.config_kwargs({'compile_endpoint_rulesets': True})
+async def test_compiled_endpoint_ruleset(s3_client):
+    assert isinstance(
+        s3_client._ruleset_resolver._provider, CompiledEndpointProvider
+    )
+    operation_model = s3_client.meta.service_model.operation_model('GetObject')
+    url, _, _ = await s3_client._resolve_endpoint_ruleset(
+        operation_model, {'Bucket': 'my-bucket', 'Key': 'a'}, {}
+    )
+    assert url.startswith('http')
+
+    # Compiled rules are shared between sessions.
+    async with AioSession().create_client(
+        's3',
+        region_name='us-east-1',
+        aws_access_key_id='xxx',
+        aws_secret_access_key='xxx',
+        config=AioConfig(compile_endpoint_rulesets=True),
+    ) as client:
+        assert (
+            client._ruleset_resolver._provider.ruleset.rules
+            is s3_client._ruleset_resolver._provider.ruleset.rules
+        )
+
+
+@pytest.mark.config_kwargs({'compile_endpoint_rulesets': True})
+async def test_compiled_endpoint_ruleset_of_other_data_path(
+    s3_client, tmp_path, monkeypatch
+):
+    rules = s3_client._ruleset_resolver._provider.ruleset.rules
+    service_model = s3_client.meta.service_model
+    ruleset = (
+        AioSession()
+        .get_component('data_loader')
+        .load_service_model(
+            's3', 'endpoint-rule-set-1', service_model.api_version
+        )
+    )
+    ruleset['rules'].insert(
+        0,
+        {
+            'type': 'error',
+            'conditions': [
+                {
+                    'fn': 'stringEquals',
+                    'argv': [{'ref': 'Bucket'}, 'overridden'],
+                }
+            ],
+            'error': 'Overridden rules',
+        },
+    )
+    path = tmp_path / 's3' / service_model.api_version
+    path.mkdir(parents=True)
+    (path / 'endpoint-rule-set-1.json').write_text(json.dumps(ruleset))
+
+    def no_interpreter(*args, **kwargs):
+        raise AssertionError('The interpreted rules were built')
+
+    monkeypatch.setattr('botocore.regions.EndpointProvider', no_interpreter)
+    session = AioSession()
+    session.set_config_variable('data_path', str(tmp_path))
+    async with session.create_client(
+        's3',
+        region_name='us-east-1',
+        aws_access_key_id='xxx',
+        aws_secret_access_key='xxx',
+        config=AioConfig(compile_endpoint_rulesets=True),
+    ) as client:
+        with pytest.raises(EndpointResolutionError, match='Overridden'):
+            await client.head_object(Bucket='overridden', Key='a')
+
+    # The rules of the default data path are still cached.
+    async with AioSession().create_client(
+        's3',
+        region_name='us-east-1',
+        aws_access_key_id='xxx',
+        aws_secret_access_key='xxx',
+        config=AioConfig(compile_endpoint_rulesets=True),
+    ) as client:
+        assert client._ruleset_resolver._provider.ruleset.rules is rules
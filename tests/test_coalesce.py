@@ -0,0 +1,94 @@
+import anyio
+import pytest
+from botocore.exceptions import ClientError
+
+from aiobotocore._coalesce import AnyioRequestCoalescer
+
+
+@pytest.mark.config_kwargs(
+    {'coalesce_operations': ['HeadObject', 'GetObject']}
+)
+async def test_identical_calls_are_coalesced(
+    s3_client, bucket_name, create_object
+):
+    await create_object('key')
+    results = []
+
+    async def head_object(key):
+        try:
+            results.append(
+                await s3_client.head_object(Bucket=bucket_name, Key=key)
+            )
+        except ClientError as e:
+            results.append(e)
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(5):
+            tg.start_soon(head_object, 'key')
+        tg.start_soon(head_object, 'other-key')
+    assert s3_client.coalescing_info() == (2, 4, 0)
+
+    responses = [r for r in results if not isinstance(r, ClientError)]
+    assert len(responses) == 5
+    assert all(response == responses[0] for response in responses)
+    # Each caller gets its own copy.
+    assert len({id(response) for response in responses}) == 5
+
+    # Errors are shared too.
+    results.clear()
+    async with anyio.create_task_group() as tg:
+        for _ in range(3):
+            tg.start_soon(head_object, 'missing-key')
+    assert all(isinstance(r, ClientError) for r in results)
+    assert s3_client.coalescing_info() == (3, 6, 0)
+    # Each caller gets its own copy of the error and of its response.
+    assert len({id(r) for r in results}) == 3
+    assert len({id(r.response) for r in results}) == 3
+    assert all(r.response == results[0].response for r in results)
+    # Each traceback only has the frames of its own raise.
+    depths = set()
+    for r in results:
+        tb, depth = r.__traceback__, 0
+        while tb is not None:
+            tb, depth = tb.tb_next, depth + 1
+        depths.add(depth)
+    assert max(depths) < 20
+
+    # Streaming output is never shared.
+    async def get_object():
+        response = await s3_client.get_object(Bucket=bucket_name, Key='key')
+        async with response['Body'] as stream:
+            assert await stream.read() == b'foo'
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(2):
+            tg.start_soon(get_object)
+    assert s3_client.coalescing_info() == (3, 6, 0)
+
+
+async def test_cancelled_call_is_not_shared():
+    coalescer = AnyioRequestCoalescer(['Op'])
+    calls = []
+    results = []
+
+    async def call(value):
+        calls.append(value)
+        await anyio.sleep(0.05)
+        return {'value': value}
+
+    async def coalesced_call(value):
+        results.append(await coalescer.call('key', call, value))
+
+    async with anyio.create_task_group() as tg:
+        async with anyio.create_task_group() as leader:
+            leader.start_soon(coalesced_call, 1)
+            await anyio.sleep(0)
+            tg.start_soon(coalesced_call, 2)
+            await anyio.sleep(0)
+            assert coalescer.info().in_flight == 1
+            leader.cancel_scope.cancel()
+
+    # The waiting call made its own request instead of being cancelled.
+    assert calls == [1, 2]
+    assert results == [{'value': 2}]
+    assert coalescer.info() == (2, 0, 0)
@@ -6,7 +6,10 @@ import pytest
 from botocore.exceptions import ParamValidationError, ReadTimeoutError
 
 from aiobotocore.config import AioConfig
+from aiobotocore.httpxresolver import ThreadedResolver
 from aiobotocore.httpxsession import HttpxSession
+from aiobotocore.response_cache import ResponseCache
+from aiobotocore.retries.circuitbreaker import CircuitBreaker
 from aiobotocore.session import AioSession, get_session
 from tests.mock_server import AIOServer
 
@@ -57,12 +60,6 @@ async def test_connector_args(current_http_backend: str):
         connector_args = dict(foo="1")
         AioConfig(connector_args)
 
-    with pytest.raises(
-        ParamValidationError,
-        match='Httpx does not support dns caching. https://github.com/encode/httpx/discussions/2211',
-    ):
-        AioConfig({'use_dns_cache': True}, http_session_cls=HttpxSession)
-
     with pytest.raises(
         ParamValidationError,
         match='Httpx backend does not currently support force_close.',
@@ -70,7 +67,9 @@ async def test_connector_args(current_http_backend: str):
         AioConfig({'force_close': True}, http_session_cls=HttpxSession)
 
     with pytest.raises(
-        ParamValidationError, match='Httpx backend does not support resolver.'
+        ParamValidationError,
+        match='resolver must be an instance of '
+        'aiobotocore.httpxresolver.AbstractResolver',
     ):
         AioConfig({'resolver': True}, http_session_cls=HttpxSession)
 
@@ -85,9 +84,13 @@ async def test_connector_args(current_http_backend: str):
 
     with pytest.raises(
         ParamValidationError,
-        match='Httpx does not support dns caching',
+        match='resolver must be an instance of '
+        'aiobotocore.httpxresolver.AbstractResolver',
     ):
-        AioConfig({'use_dns_cache': True}, http_session_cls=MyHttpxSession)
+        AioConfig(
+            {'resolver': aiohttp.resolver.ThreadedResolver},
+            http_session_cls=MyHttpxSession,
+        )
 
     # Test valid configs:
     AioConfig({"ttl_dns_cache": None})
@@ -95,6 +98,11 @@ async def test_connector_args(current_http_backend: str):
     if current_http_backend == 'aiohttp':
         # aiohttp's resolver constructor needs a running asyncio loop.
         AioConfig({"resolver": aiohttp.resolver.DefaultResolver()})
+    else:
+        AioConfig(
+            {'use_dns_cache': True, 'resolver': ThreadedResolver()},
+            http_session_cls=HttpxSession,
+        )
     AioConfig({'keepalive_timeout': None})
     AioConfig({'socket_factory': None})
     AioConfig({'socket_factory': socket.socket})
@@ -243,3 +251,135 @@ def test_config_warm_up_loader_caches(warm_up_loader_caches, expected):
         config = AioConfig(warm_up_loader_caches=warm_up_loader_caches)
 
     assert config.warm_up_loader_caches is expected
+
+
+def test_collect_phase_timings_config():
+    assert AioConfig().collect_phase_timings is False
+    config = AioConfig(collect_phase_timings=True)
+    assert config.merge(AioConfig(read_timeout=5)).collect_phase_timings
+
+    with pytest.raises(ParamValidationError):
+        AioConfig(collect_phase_timings=1)
+
+
+def test_compile_endpoint_rulesets_config():
+    assert AioConfig().compile_endpoint_rulesets is False
+    config = AioConfig(compile_endpoint_rulesets=True)
+    assert config.merge(AioConfig(read_timeout=5)).compile_endpoint_rulesets
+
+    with pytest.raises(ParamValidationError):
+        AioConfig(compile_endpoint_rulesets='yes')
+
+
+def test_coalesce_operations_config():
+    assert AioConfig().coalesce_operations == frozenset()
+    config = AioConfig(coalesce_operations=['HeadObject', 'GetItem'])
+    assert config.coalesce_operations == {'HeadObject', 'GetItem'}
+    assert config.merge(AioConfig(read_timeout=5)).coalesce_operations == {
+        'HeadObject',
+        'GetItem',
+    }
+
+    for value in ('HeadObject', None, [1]):
+        with pytest.raises(ParamValidationError):
+            AioConfig(coalesce_operations=value)
+
+
+def test_response_cache_config():
+    cache = ResponseCache({'DescribeTable': 60})
+    assert AioConfig().response_cache is None
+    config = AioConfig(response_cache=cache)
+    assert config.merge(AioConfig(read_timeout=5)).response_cache is cache
+
+    with pytest.raises(ParamValidationError):
+        AioConfig(response_cache={'DescribeTable': 60})
+
+
+def test_hedging_config():
+    assert AioConfig().hedging is None
+    config = AioConfig(hedging={'operations': ['GetItem'], 'percentile': 95})
+    assert config.merge(AioConfig(read_timeout=5)).hedging == {
+        'operations': ['GetItem'],
+        'percentile': 95,
+    }
+
+    for value in (
+        ['GetItem'],
+        {'delay': 0.1},
+        {'operations': 'GetItem'},
+        {'operations': ['GetItem'], 'delay': -1},
+        {'operations': ['GetItem'], 'percentile': 100},
+        {'operations': ['GetItem'], 'budget': 0},
+        {'operations': ['GetItem'], 'budget': True},
+        {'operations': ['GetItem'], 'jitter': 0.1},
+    ):
+        with pytest.raises(ParamValidationError):
+            AioConfig(hedging=value)
+
+
+def test_circuit_breaker_config():
+    breaker = CircuitBreaker()
+    assert AioConfig().circuit_breaker is None
+    config = AioConfig(circuit_breaker=breaker)
+    assert config.merge(AioConfig(read_timeout=5)).circuit_breaker is breaker
+
+    with pytest.raises(ParamValidationError):
+        AioConfig(circuit_breaker={'reset_timeout': 10})
+
+
+def test_share_http_session_config():
+    assert AioConfig().share_http_session is False
+    config = AioConfig(share_http_session=True)
+    assert config.share_http_session is True
+    assert config.merge(AioConfig(read_timeout=5)).share_http_session is True
+
+    with pytest.raises(ParamValidationError):
+        AioConfig(share_http_session='yes')
+
+    AioConfig({'limit_per_host': 10})
+    with pytest.raises(ParamValidationError):
+        AioConfig({'limit_per_host': -1})
+    with pytest.raises(
+        ParamValidationError,
+        match='Httpx backend does not support limit_per_host.',
+    ):
+        AioConfig({'limit_per_host': 10}, http_session_cls=HttpxSession)
+
+
+def test_http2_connector_arg():
+    pytest.importorskip("httpx")
+    AioConfig({'http2': True}, http_session_cls=HttpxSession)
+    with pytest.raises(ParamValidationError, match='must be a boolean'):
+        AioConfig({'http2': 1}, http_session_cls=HttpxSession)
+    with pytest.raises(
+        ParamValidationError, match='Aiohttp backend does not support http2.'
+    ):
+        AioConfig({'http2': True})
+
+
+async def test_socket_options_config():
+    config = AioConfig(socket_options='low_latency')
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in config.socket_options
+    assert AioConfig().socket_options == []
+
+    custom = [(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)]
+    assert AioConfig(socket_options=custom).socket_options == custom
+    # The profile name survives a merge and is resolved again.
+    merged = config.merge(AioConfig(connect_timeout=5))
+    assert merged.socket_options == config.socket_options
+
+    with pytest.raises(ParamValidationError, match='unknown socket_options'):
+        AioConfig(socket_options='fastest')
+    with pytest.raises(ParamValidationError, match='invalid socket option'):
+        AioConfig(socket_options=[(socket.SOL_SOCKET, socket.SO_KEEPALIVE)])
+
+    session = AioSession()
+    async with session.create_client(
+        's3', region_name='us-east-1', config=config
+    ) as client:
+        http_session = client._endpoint.http_session
+        # botocore's defaults come first so the profile can override them.
+        assert http_session._socket_options == [
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+            *config.socket_options,
+        ]
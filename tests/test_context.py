@@ -0,0 +1,69 @@
+import anyio
+from botocore.context import ClientContext, get_context
+from botocore.useragent import register_feature_id
+
+from aiobotocore.context import start_as_current_context, with_current_context
+
+
+async def test_nested_contexts_copy_features():
+    async with start_as_current_context():
+        outer = get_context()
+        register_feature_id('WAITER')
+
+        async with start_as_current_context():
+            async with start_as_current_context():
+                inner = get_context()
+                assert inner.features == {'B'}
+                register_feature_id('PAGINATOR')
+                assert inner.features == {'B', 'C'}
+
+            # Features registered in a nested context do not leak out.
+            assert outer.features == {'B'}
+            assert get_context().features == {'B'}
+
+        assert get_context() is outer
+
+
+async def test_context_snapshot_ignores_later_parent_changes():
+    parent = ClientContext({'A'})
+    async with start_as_current_context(parent):
+        child = get_context()
+        assert child is not parent
+        assert child.features == {'A'}
+        parent.features.add('B')
+        assert child.features == {'A'}
+
+
+async def test_context_in_task_ignores_later_parent_changes():
+    started = anyio.Event()
+    registered = anyio.Event()
+    features = []
+
+    async def child():
+        async with start_as_current_context():
+            started.set()
+            await registered.wait()
+            features.append(set(get_context().features))
+
+    async with start_as_current_context():
+        register_feature_id('WAITER')
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(child)
+            await started.wait()
+            # The parent runs on while the child's context is current.
+            register_feature_id('PAGINATOR')
+            registered.set()
+    assert features == [{'B'}]
+
+
+async def test_with_current_context_runs_hook_in_new_context():
+    async def hook():
+        register_feature_id('WAITER')
+
+    @with_current_context(hook)
+    async def func():
+        return set(get_context().features)
+
+    async with start_as_current_context():
+        assert await func() == {'B'}
+        assert get_context().features == set()
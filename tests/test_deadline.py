@@ -0,0 +1,109 @@
+import time
+
+import anyio
+import pytest
+from botocore.exceptions import ClientError
+
+from aiobotocore.awsrequest import AioAWSResponse
+from aiobotocore.config import AioConfig
+from aiobotocore.deadline import (
+    DeadlineExceededError,
+    current_deadline,
+    deadline,
+)
+from tests.mock_server import AIOServer
+
+
+def test_nested_deadlines():
+    assert current_deadline() is None
+    with deadline(10) as outer:
+        assert current_deadline() is outer
+        with deadline(20) as inner:
+            # An inner scope cannot extend the deadline.
+            assert inner is outer
+        with deadline(1) as inner:
+            assert current_deadline() is inner
+            assert 0 < inner.remaining() <= 1
+        assert current_deadline() is outer
+    assert current_deadline() is None
+
+
+async def test_deadline_bounds_request_and_body(session, config):
+    # The mock server takes 5s to send the response body, which the read
+    # timeout and retries would allow.
+    config = config.merge(
+        AioConfig(read_timeout=30, retries={'max_attempts': 5})
+    )
+    async with (
+        AIOServer() as server,
+        session.create_client(
+            's3',
+            config=config,
+            endpoint_url=server.endpoint_url,
+            aws_secret_access_key='xxx',
+            aws_access_key_id='xxx',
+        ) as s3_client,
+    ):
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceededError):
+            with deadline(0.5):
+                await s3_client.list_objects_v2(Bucket='foo')
+        assert time.monotonic() - start < 4
+
+        with deadline(1):
+            response = await s3_client.get_object(Bucket='foo', Key='bar')
+        # Reads are bound by the deadline of the call, even out of scope.
+        start = time.monotonic()
+        async with response['Body'] as stream:
+            with pytest.raises(DeadlineExceededError):
+                await stream.read()
+        assert time.monotonic() - start < 4
+
+
+async def test_no_retry_past_deadline(s3_client, bucket_name):
+    attempts = []
+    backoff = 0.01
+
+    def before_send(request, **kwargs):
+        attempts.append(time.monotonic())
+        response = AioAWSResponse(request.url, 503, {}, None)
+        response._content = b''
+        return response
+
+    def needs_retry(**kwargs):
+        return backoff
+
+    events = s3_client.meta.events
+    events.register('before-send.s3', before_send)
+    events.register_first('needs-retry.s3', needs_retry)
+    try:
+        # Retries go on, but stop before the deadline.
+        start = time.monotonic()
+        with pytest.raises(ClientError):
+            with deadline(0.5):
+                await s3_client.head_bucket(Bucket=bucket_name)
+        assert len(attempts) > 2
+        assert time.monotonic() - start < 1
+
+        # Or are not made at all if the backoff would pass the deadline.
+        attempts.clear()
+        backoff = 5
+        with pytest.raises(ClientError):
+            with deadline(1):
+                await s3_client.head_bucket(Bucket=bucket_name)
+        assert len(attempts) == 1
+    finally:
+        events.unregister('before-send.s3', before_send)
+        events.unregister('needs-retry.s3', needs_retry)
+
+
+async def test_deadline_is_inherited_by_tasks():
+    results = []
+
+    async def task():
+        results.append(current_deadline())
+
+    with deadline(5) as scope:
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(task)
+    assert results == [scope]
@@ -0,0 +1,214 @@
+import random
+
+import pytest
+from botocore.endpoint_provider import EndpointProvider
+from botocore.exceptions import EndpointResolutionError
+from botocore.loaders import Loader
+
+from aiobotocore.endpoint_provider import (
+    CompiledEndpointProvider,
+    compile_rules,
+)
+
+CASES_PER_SERVICE = 50
+# The widest rule sets get more coverage.
+CASES_FOR_SERVICE = {'s3': 2000, 's3control': 1000}
+
+REGIONS = [
+    'us-east-1',
+    'us-west-2',
+    'eu-central-1',
+    'aws-global',
+    'fips-us-east-1',
+    'us-east-1-fips',
+    'cn-north-1',
+    'us-gov-west-1',
+    'us-iso-east-1',
+    'us-isob-east-1',
+    'eu-isoe-west-1',
+    'us-isof-south-1',
+    'snow',
+    'invalid_region!',
+]
+ENDPOINTS = [
+    'https://example.com',
+    'http://127.0.0.1:8080',
+    'https://[::1]/path/',
+    'https://example.com/with%20path?query=1',
+    'not a url',
+]
+STRINGS = [
+    'bucket',
+    'bucket.with.dots',
+    'Bucket_Invalid',
+    'ab',
+    'mybucket--usw2-az1--x-s3',
+    'mybucket--use1-az4--xa-s3',
+    'arn:aws:s3:us-west-2:123456789012:accesspoint:myendpoint',
+    'arn:aws:s3:us-east-1:123456789012:accesspoint/myendpoint',
+    'arn:aws:s3-outposts:us-west-2:123456789012:outpost/op-01234567890123456'
+    '/accesspoint/reports',
+    'arn:aws:s3-object-lambda:us-east-1:123456789012:accesspoint/mybanner',
+    'arn:aws-cn:s3:cn-north-1:123456789012:accesspoint:myendpoint',
+    'arn:aws:s3::123456789012:accesspoint:mfzwi23gnjvgw.mrap',
+    'arn:aws:iam::123456789012:user/name',
+    'arn:invalid',
+    '123456789012',
+    'us-west-2',
+    'preferred',
+    'required',
+    'disabled',
+    'op-01234567890123456',
+    'https://example.com',
+    '',
+]
+
+
+SERVICES = Loader().list_available_services('endpoint-rule-set-1')
+
+
+def _random_params(parameters, rng):
+    params = {}
+    for name, spec in parameters.items():
+        if rng.random() < 0.3:
+            continue
+        builtin = spec.get('builtIn')
+        param_type = spec['type'].lower()
+        if param_type == 'boolean':
+            value = rng.choice([True, False])
+        elif param_type == 'stringarray':
+            value = tuple(rng.sample(STRINGS, rng.randint(0, 2)))
+        elif builtin == 'AWS::Region' or name == 'Region':
+            value = rng.choice(REGIONS)
+        elif builtin == 'SDK::Endpoint' or name == 'Endpoint':
+            value = rng.choice(ENDPOINTS)
+        else:
+            value = rng.choice(STRINGS + REGIONS[:2])
+        params[name] = value
+    return params
+
+
+def _resolve(provider, params):
+    try:
+        return provider.resolve_endpoint(**params)
+    except Exception as e:
+        # The interpreter also raises e.g. KeyError for some inputs.
+        return type(e), str(e)
+
+
+@pytest.fixture(scope='module')
+def partitions():
+    return Loader().load_data('partitions')
+
+
+@pytest.mark.parametrize('service_name', SERVICES)
+def test_compiled_rules_match_interpreter(service_name, partitions):
+    ruleset = Loader().load_service_model(service_name, 'endpoint-rule-set-1')
+    interpreter = EndpointProvider(ruleset, partitions)
+    compiled = CompiledEndpointProvider(ruleset, partitions)
+    rng = random.Random(service_name)
+    for _ in range(CASES_FOR_SERVICE.get(service_name, CASES_PER_SERVICE)):
+        params = _random_params(ruleset['parameters'], rng)
+        assert _resolve(compiled, params) == _resolve(interpreter, params), (
+            params
+        )
+
+
+def test_compiled_rules_semantics(partitions):
+    ruleset = {
+        'version': '1.0',
+        'parameters': {
+            'Region': {'type': 'String', 'builtIn': 'AWS::Region'},
+            'UseFIPS': {'type': 'Boolean', 'default': False},
+        },
+        'rules': [
+            {
+                'type': 'tree',
+                'conditions': [
+                    {
+                        'fn': 'aws.partition',
+                        'argv': [{'ref': 'Region'}],
+                        'assign': 'PartitionResult',
+                    }
+                ],
+                'rules': [
+                    {
+                        'type': 'error',
+                        'conditions': [
+                            {
+                                'fn': 'booleanEquals',
+                                'argv': [{'ref': 'UseFIPS'}, True],
+                            },
+                            {
+                                'fn': 'not',
+                                'argv': [
+                                    {
+                                        'fn': 'stringEquals',
+                                        'argv': [
+                                            {
+                                                'fn': 'getAttr',
+                                                'argv': [
+                                                    {'ref': 'PartitionResult'},
+                                                    'name',
+                                                ],
+                                            },
+                                            'aws',
+                                        ],
+                                    }
+                                ],
+                            },
+                        ],
+                        'error': 'FIPS is not supported in {Region}',
+                    },
+                    {
+                        'type': 'endpoint',
+                        'conditions': [
+                            {
+                                'fn': 'isSet',
+                                'argv': [{'ref': 'Region'}],
+                            },
+                        ],
+                        'endpoint': {
+                            'url': 'https://svc.{Region}.'
+                            '{PartitionResult#dnsSuffix}',
+                            'properties': {
+                                'authSchemes': [
+                                    {'name': 'sigv4', 'region': '{Region}'}
+                                ]
+                            },
+                            'headers': {'x-region': ['{Region}', 'static']},
+                        },
+                    },
+                ],
+            },
+            {
+                'type': 'error',
+                'conditions': [],
+                'error': 'Unreachable',
+            },
+        ],
+    }
+    provider = CompiledEndpointProvider(ruleset, partitions)
+
+    endpoint = provider.resolve_endpoint(Region='us-west-2')
+    assert endpoint.url == 'https://svc.us-west-2.amazonaws.com'
+    assert endpoint.properties == {
+        'authSchemes': [{'name': 'sigv4', 'region': 'us-west-2'}]
+    }
+    assert endpoint.headers == {'x-region': ['us-west-2', 'static']}
+
+    with pytest.raises(EndpointResolutionError, match='FIPS is not'):
+        provider.resolve_endpoint(Region='cn-north-1', UseFIPS=True)
+
+    with pytest.raises(EndpointResolutionError, match='Unknown rule type'):
+        compile_rules([{'type': 'bogus', 'conditions': []}])
+
+
+def test_compiled_rules_are_cached():
+    rules = [{'type': 'error', 'conditions': [], 'error': 'error'}]
+    compiled = compile_rules(rules, cache_key='test')
+    assert compile_rules(list(rules), cache_key='test') is compiled
+    assert compile_rules(rules) is not compiled
+
+    changed = [{'type': 'error', 'conditions': [], 'error': 'changed'}]
+    assert compile_rules(changed, cache_key='test') is not compiled
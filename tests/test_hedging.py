@@ -0,0 +1,148 @@
+import time
+
+import anyio
+import pytest
+from botocore.model import OperationModel, ServiceModel
+
+from aiobotocore._hedging import _MIN_SAMPLES, HedgingPolicy
+from aiobotocore.awsrequest import AioAWSResponse
+
+
+@pytest.fixture
+def slow_first_attempts(s3_client):
+    """Make the next ``slow`` requests created hang when they are sent."""
+    state = {'slow': 0, 'sent': 0, 'cancelled': 0}
+
+    def request_created(request, **kwargs):
+        if state['slow'] > 0:
+            state['slow'] -= 1
+            request.headers['x-test-slow'] = 'true'
+
+    async def before_send(request, **kwargs):
+        state['sent'] += 1
+        if 'x-test-slow' in request.headers:
+            try:
+                await anyio.sleep(10)
+            finally:
+                state['cancelled'] += 1
+
+    s3_client.meta.events.register('request-created.s3', request_created)
+    s3_client.meta.events.register('before-send.s3', before_send)
+    return state
+
+
+@pytest.mark.config_kwargs(
+    {'hedging': {'operations': ['HeadBucket'], 'delay': 1, 'budget': 1}}
+)
+async def test_hedged_request(s3_client, bucket_name, slow_first_attempts):
+    slow_first_attempts['slow'] = 1
+    start = time.monotonic()
+    response = await s3_client.head_bucket(Bucket=bucket_name)
+    assert response['ResponseMetadata']['HTTPStatusCode'] == 200
+    assert time.monotonic() - start < 5
+    assert slow_first_attempts == {'slow': 0, 'sent': 2, 'cancelled': 1}
+    assert s3_client.hedging_info() == (1, 1, 1)
+
+    # Fast requests are not hedged.
+    await s3_client.head_bucket(Bucket=bucket_name)
+    assert slow_first_attempts['sent'] == 3
+    assert s3_client.hedging_info() == (2, 1, 1)
+
+    # Nor are other operations.
+    await s3_client.get_bucket_location(Bucket=bucket_name)
+    assert s3_client.hedging_info() == (2, 1, 1)
+
+
+@pytest.mark.config_kwargs(
+    {'hedging': {'operations': ['HeadBucket'], 'delay': 0, 'budget': 0.5}}
+)
+async def test_hedging_budget(s3_client, bucket_name, slow_first_attempts):
+    for _ in range(4):
+        await s3_client.head_bucket(Bucket=bucket_name)
+    # Every other request has a token to hedge with.
+    assert s3_client.hedging_info().hedged == 2
+
+
+@pytest.mark.config_kwargs(
+    {
+        'hedging': {
+            'operations': ['HeadBucket'],
+            'delay': 0.5,
+            'percentile': 50,
+            'budget': 1,
+        }
+    }
+)
+async def test_hedging_records_cancelled_primary(
+    s3_client, bucket_name, slow_first_attempts
+):
+    slow_first_attempts['slow'] = 1
+    await s3_client.head_bucket(Bucket=bucket_name)
+    assert slow_first_attempts['cancelled'] == 1
+    # The primary that lost is sampled for as long as it ran.
+    window = s3_client._endpoint.hedging_policy._latencies['HeadBucket']
+    assert len(window._samples) == 2
+    assert max(window._samples) >= 0.5
+
+
+@pytest.mark.config_kwargs(
+    {'hedging': {'operations': ['HeadBucket'], 'delay': 0.1, 'budget': 1}}
+)
+async def test_hedge_with_server_error_does_not_win(s3_client, bucket_name):
+    state = {'requests': 0, 'failed': 0}
+    contexts = []
+
+    def request_created(request, **kwargs):
+        state['requests'] += 1
+        if state['requests'] == 1:
+            request.headers['x-test-slow'] = 'true'
+
+    async def before_send(request, **kwargs):
+        if 'x-test-slow' in request.headers:
+            # Slower than the hedge, but successful.
+            await anyio.sleep(0.5)
+        elif not state['failed']:
+            state['failed'] += 1
+            response = AioAWSResponse(request.url, 503, {}, None)
+            response._content = b''
+            return response
+
+    s3_client.meta.events.register('request-created.s3', request_created)
+    s3_client.meta.events.register('before-send.s3', before_send)
+    s3_client.meta.events.register(
+        'response-received.s3.HeadBucket',
+        lambda context, **kwargs: contexts.append(context),
+    )
+    response = await s3_client.head_bucket(Bucket=bucket_name)
+    # The primary was waited for, instead of retrying the hedge's error.
+    assert response['ResponseMetadata']['HTTPStatusCode'] == 200
+    assert response['ResponseMetadata']['RetryAttempts'] == 0
+    assert state == {'requests': 2, 'failed': 1}
+    assert s3_client.hedging_info() == (1, 1, 0)
+    # Each attempt has its own context.
+    assert len(contexts) == 2
+    assert contexts[0] is not contexts[1]
+
+
+async def test_hedging_disabled(s3_client):
+    assert s3_client.hedging_info() is None
+
+
+def test_percentile_delay():
+    service_model = ServiceModel({'metadata': {}, 'shapes': {}})
+    operation_model = OperationModel({'name': 'GetItem'}, service_model)
+    policy = HedgingPolicy(['GetItem'], delay=1, percentile=90)
+    assert policy.hedge_delay(operation_model) == 1
+
+    now = time.monotonic()
+    for latency in range(1, _MIN_SAMPLES):
+        policy.record_latency('GetItem', now - latency / 100)
+    # Not enough samples yet.
+    assert policy.hedge_delay(operation_model) == 1
+    policy.record_latency('GetItem', now - _MIN_SAMPLES / 100)
+    assert policy.hedge_delay(operation_model) == pytest.approx(0.18, abs=0.01)
+
+    assert (
+        policy.hedge_delay(OperationModel({'name': 'Query'}, service_model))
+        is None
+    )
@@ -0,0 +1,62 @@
+import functools
+
+from aiobotocore.hooks import AioHierarchicalEmitter
+
+
+async def test_emit_calls_sync_and_async_handlers():
+    emitter = AioHierarchicalEmitter()
+    calls = []
+
+    def sync_handler(**kwargs):
+        calls.append('sync')
+        return 'sync'
+
+    async def async_handler(value, **kwargs):
+        calls.append('async')
+        return value
+
+    class CallableHandler:
+        async def __call__(self, **kwargs):
+            calls.append('callable')
+            return 'callable'
+
+    def returns_awaitable(**kwargs):
+        return async_handler('awaitable')
+
+    emitter.register('foo.bar', sync_handler)
+    emitter.register('foo', functools.partial(async_handler, 'partial'))
+    emitter.register('foo.bar.baz', CallableHandler())
+    emitter.register('foo.bar.baz', returns_awaitable)
+
+    responses = await emitter.emit('foo.bar.baz')
+    assert [response for _, response in responses] == [
+        'callable',
+        'awaitable',
+        'sync',
+        'partial',
+    ]
+    assert calls == ['callable', 'async', 'sync', 'async']
+
+    handler, response = await emitter.emit_until_response('foo.bar')
+    assert (handler, response) == (sync_handler, 'sync')
+
+    assert await emitter.emit('other') == []
+
+
+async def test_emit_dispatch_plan_follows_registrations():
+    emitter = AioHierarchicalEmitter()
+    calls = []
+
+    async def first(**kwargs):
+        calls.append('first')
+
+    def second(**kwargs):
+        calls.append('second')
+
+    emitter.register('foo', first)
+    await emitter.emit('foo.bar')
+    emitter.register('foo.bar', second)
+    await emitter.emit('foo.bar')
+    emitter.unregister('foo', first)
+    await emitter.emit('foo.bar')
+    assert calls == ['first', 'second', 'first', 'second']
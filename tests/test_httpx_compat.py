@@ -64,6 +64,18 @@ def test_httpxsession_warns_only_once_for_many_instances(monkeypatch):
     assert len(deprecations) == 1
 
 
+@pytest.mark.parametrize(
+    'legacy, package', [(False, 'httpx2[http2]'), (True, 'httpx[http2]')]
+)
+def test_http2_requires_h2(monkeypatch, legacy, package):
+    monkeypatch.setattr("aiobotocore.httpxsession.HTTPX_IS_LEGACY", legacy)
+    monkeypatch.setattr("aiobotocore.httpxsession._LEGACY_HTTPX_WARNED", True)
+    monkeypatch.setitem(sys.modules, "h2", None)
+    with pytest.raises(RuntimeError) as e:
+        HttpxSession(connector_args={'http2': True})
+    assert f'(e.g. {package})' in str(e.value)
+
+
 def test_httpxsession_does_not_warn_on_httpx2(monkeypatch, recwarn):
     monkeypatch.setattr("aiobotocore.httpxsession.HTTPX_IS_LEGACY", False)
     HttpxSession()
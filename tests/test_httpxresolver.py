@@ -0,0 +1,204 @@
+import anyio
+import pytest
+from botocore.awsrequest import AWSRequest
+from botocore.exceptions import EndpointConnectionError
+
+from aiobotocore import _httpx
+from aiobotocore.config import AioConfig
+from aiobotocore.httpxresolver import (
+    AbstractResolver,
+    DNSCache,
+    ResolveResult,
+    ThreadedResolver,
+)
+from aiobotocore.httpxsession import HttpxSession
+from aiobotocore.session import AioSession
+from tests.mock_server import AIOServer
+
+pytestmark = [
+    pytest.mark.skipif(
+        _httpx.httpx is None,
+        reason="requires an httpx backend (httpx2 or httpx) to be installed",
+    ),
+    pytest.mark.config_kwargs({'http_session_cls': HttpxSession}),
+]
+
+
+class RecordingResolver(AbstractResolver):
+    def __init__(self, addresses=('127.0.0.1',), ttl=None):
+        self.addresses = list(addresses)
+        self.ttl = ttl
+        self.lookups = []
+        self.gate = None
+
+    async def resolve(self, host, port):
+        self.lookups.append((host, port))
+        if self.gate is not None:
+            await self.gate.wait()
+        return ResolveResult(self.addresses, self.ttl)
+
+
+async def test_threaded_resolver():
+    result = await ThreadedResolver().resolve('localhost', 80)
+    assert result.addresses
+    assert result.ttl is None
+
+
+async def test_dns_cache_ttl(mocker):
+    now = mocker.patch('aiobotocore.httpxresolver.time.monotonic')
+    now.return_value = 100
+    resolver = RecordingResolver()
+    cache = DNSCache(resolver, ttl=10)
+
+    assert await cache.resolve('example.com', 443) == ['127.0.0.1']
+    assert await cache.resolve('example.com', 443) == ['127.0.0.1']
+    assert len(resolver.lookups) == 1
+    # IP addresses are never looked up.
+    assert await cache.resolve('10.0.0.1', 443) == ['10.0.0.1']
+
+    now.return_value = 111
+    resolver.addresses = ['127.0.0.2']
+    assert await cache.resolve('example.com', 443) == ['127.0.0.2']
+    assert len(resolver.lookups) == 2
+
+
+async def test_dns_cache_prefers_record_ttl(mocker):
+    now = mocker.patch('aiobotocore.httpxresolver.time.monotonic')
+    now.return_value = 100
+    resolver = RecordingResolver(ttl=60)
+    cache = DNSCache(resolver, ttl=10)
+
+    await cache.resolve('example.com', 443)
+    now.return_value = 130
+    await cache.resolve('example.com', 443)
+    assert len(resolver.lookups) == 1
+
+
+async def test_dns_cache_refreshes_in_background(mocker):
+    now = mocker.patch('aiobotocore.httpxresolver.time.monotonic')
+    now.return_value = 100
+    resolver = RecordingResolver()
+    cache = DNSCache(resolver, ttl=10)
+    await cache.resolve('example.com', 443)
+
+    # Past the refresh point, the cached addresses are still returned right
+    # away while a lookup runs in the background.
+    now.return_value = 108
+    resolver.addresses = ['127.0.0.2']
+    resolver.gate = anyio.Event()
+    assert await cache.resolve('example.com', 443) == ['127.0.0.1']
+    assert await cache.resolve('example.com', 443) == ['127.0.0.1']
+    resolver.gate.set()
+    with anyio.fail_after(1):
+        while await cache.resolve('example.com', 443) != ['127.0.0.2']:
+            await anyio.sleep(0)
+    assert len(resolver.lookups) == 2
+
+
+async def test_dns_cache_shares_concurrent_lookups():
+    resolver = RecordingResolver()
+    resolver.gate = anyio.Event()
+    cache = DNSCache(resolver)
+    results = []
+
+    async def resolve():
+        results.append(await cache.resolve('example.com', 443))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(3):
+            tg.start_soon(resolve)
+        await anyio.sleep(0.01)
+        resolver.gate.set()
+
+    assert results == [['127.0.0.1']] * 3
+    assert len(resolver.lookups) == 1
+
+
+async def test_dns_cache_retries_failed_shared_lookup():
+    class FailingOnceResolver(RecordingResolver):
+        async def resolve(self, host, port):
+            result = await super().resolve(host, port)
+            if len(self.lookups) == 1:
+                raise OSError('temporary failure')
+            return result
+
+    resolver = FailingOnceResolver()
+    resolver.gate = anyio.Event()
+    cache = DNSCache(resolver)
+    results = []
+
+    async def resolve():
+        try:
+            results.append(await cache.resolve('example.com', 443))
+        except OSError as e:
+            results.append(e)
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(3):
+            tg.start_soon(resolve)
+        await anyio.sleep(0.01)
+        resolver.gate.set()
+
+    # The waiters share one retry of the failed lookup.
+    assert isinstance(results[0], OSError)
+    assert results[1:] == [['127.0.0.1']] * 2
+    assert len(resolver.lookups) == 2
+
+
+async def test_session_connects_through_resolver():
+    resolver = RecordingResolver()
+    async with (
+        AIOServer() as server,
+        HttpxSession(
+            connector_args={'resolver': resolver, 'keepalive_timeout': 12}
+        ) as http,
+    ):
+        port = server.endpoint_url.rsplit(':', 1)[1]
+        # Only the resolver knows this name.
+        url = f'http://endpoint.invalid:{port}/ok'
+        await http.prefetch_dns([('endpoint.invalid', int(port))])
+        assert resolver.lookups == [('endpoint.invalid', int(port))]
+
+        response = await http.send(AWSRequest(method='GET', url=url).prepare())
+        assert response.status_code == 200
+        assert len(resolver.lookups) == 1
+
+
+async def test_session_caches_dns_with_ttl_dns_cache():
+    connector_args = {'keepalive_timeout': 12, 'ttl_dns_cache': 30}
+    async with HttpxSession(connector_args=connector_args) as http:
+        assert http._dns_cache is not None
+        assert http._dns_cache._ttl == 30
+    connector_args['use_dns_cache'] = False
+    async with HttpxSession(connector_args=connector_args) as http:
+        assert http._dns_cache is None
+    async with HttpxSession() as http:
+        assert http._dns_cache is None
+
+
+async def test_session_reports_resolver_failures():
+    resolver = RecordingResolver(addresses=())
+    async with HttpxSession(
+        connector_args={'resolver': resolver, 'keepalive_timeout': 12}
+    ) as http:
+        request = AWSRequest(method='GET', url='http://endpoint.invalid/')
+        with pytest.raises(EndpointConnectionError):
+            await http.send(request.prepare())
+
+
+async def test_client_prefetch_dns_resolves_bucket_endpoint():
+    resolver = RecordingResolver()
+    config = AioConfig(
+        http_session_cls=HttpxSession, connector_args={'resolver': resolver}
+    )
+    async with AioSession().create_client(
+        's3',
+        region_name='us-east-1',
+        aws_access_key_id='xxx',
+        aws_secret_access_key='xxx',
+        config=config,
+    ) as client:
+        await client.prefetch_dns(
+            endpoints=[('HeadBucket', {'Bucket': 'my-bucket'})]
+        )
+    assert resolver.lookups == [('my-bucket.s3.amazonaws.com', 443)]
@@ -45,6 +45,16 @@ from botocore.endpoint import (
     EndpointCreator,
     convert_to_response_dict,
 )
+from botocore.endpoint_provider import (
+    BaseRule,
+    EndpointProvider,
+    EndpointRule,
+    ErrorRule,
+    RuleCreator,
+    RuleSet,
+    RuleSetStandardLibrary,
+    TreeRule,
+)
 from botocore.eventstream import EventStream
 from botocore.handlers import (
     check_for_200_error,
@@ -926,7 +936,118 @@ def test_protocol_parsers():
                 '37e9f1c3b60de17f477a9b79eae8e1acaa7c89d7',
             },
         ),
+        # endpoint_provider.py
+        # CompiledRuleSet compiles the rules into closures with the same
+        # semantics as the interpreter.
+        (
+            EndpointProvider.__init__,
+            {
+                'e54e87e473c83d1c37ce6981dfaa7ea70a881853',
+            },
+        ),
+        (
+            RuleSet.__init__,
+            {
+                'e048f406cc10bf75edca104f5f7a29ecc5711006',
+            },
+        ),
+        (
+            RuleSet.evaluate,
+            {
+                'aada87974481e5867d16cdc986a84c11bddcae58',
+            },
+        ),
+        (
+            RuleSetStandardLibrary.resolve_value,
+            {
+                '53a861dcd15052eac62b3cf3960380c497c5fd03',
+            },
+        ),
+        (
+            RuleSetStandardLibrary.call_function,
+            {
+                '1cfa1a0cc5014120c737a0f0b184338c66b0c03b',
+            },
+        ),
+        (
+            RuleSetStandardLibrary.resolve_template_string,
+            {
+                'bb7bfe2ad893c8d8b2fe93860707d3a7cce9b07a',
+            },
+        ),
+        (
+            RuleSetStandardLibrary.is_set,
+            {
+                '8d6bbfb0bd8e3da582992f1a6f7f991a6978c15f',
+            },
+        ),
+        (
+            RuleSetStandardLibrary._not,
+            {
+                '4e7e8e1eece0421beb52f14be49face4ad4fb8a6',
+            },
+        ),
+        (
+            RuleSetStandardLibrary.boolean_equals,
+            {
+                '1e25a347c2020f52c1fe02934215e010f067f0ba',
+            },
+        ),
+        (
+            RuleSetStandardLibrary.string_equals,
+            {
+                'ee5de9a6512dcc8fe983a3e7b4b8273ec9ee0e04',
+            },
+        ),
+        (
+            BaseRule.evaluate_conditions,
+            {
+                'bfa823a6523ff4ee0cecd154562cf79eb9fb3e00',
+            },
+        ),
+        (
+            EndpointRule.evaluate,
+            {
+                '1422b20265648b2c281338cad1341cb8f68e3e41',
+            },
+        ),
+        (
+            EndpointRule.resolve_properties,
+            {
+                'f48c5673555864737befda6a8e4f1c0ce7248302',
+            },
+        ),
+        (
+            EndpointRule.resolve_headers,
+            {
+                '749f4320c37e5e45a097a3d5997a6b1a31a00c09',
+            },
+        ),
+        (
+            ErrorRule.evaluate,
+            {
+                '633cad8ffb2b21891f897643f3665bdd105761b9',
+            },
+        ),
+        (
+            TreeRule.evaluate,
+            {
+                '4630a0f812f8981dfd69662c04d4edb55e63bf75',
+            },
+        ),
+        (
+            RuleCreator.create,
+            {
+                'b8b8dea9c8dd04fa7b3166089c7190549d14bb79',
+            },
+        ),
         # regions.py
+        (
+            EndpointRulesetResolver.__init__,
+            {
+                '6632ab6a2127374e5ee3260d8172d9c4e770a032',
+            },
+        ),
         (
             EndpointRulesetResolver.construct_endpoint,
             {
@@ -1530,6 +1651,12 @@ def test_protocol_parsers():
             },
         ),
         # awsresponse.py
+        (
+            AWSResponse.__init__,
+            {
+                '0f61ee745b8c5d62206fbe78b1cce80327d1ea61',
+            },
+        ),
         (
             AWSResponse.content,
             {
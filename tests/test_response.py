@@ -1,16 +1,29 @@
+import array
 import asyncio
+import base64
 import gzip
 import io
+import struct
+import time
+import zlib
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
+import aiohttp
 import pytest
 from botocore.exceptions import (
+    FlexibleChecksumError,
     IncompleteReadError,
     ResponseStreamingError,
 )
+from botocore.httpchecksum import Crc32Checksum
 
 from aiobotocore import response
 from aiobotocore._httpx import httpx
+from aiobotocore.httpchecksum import (
+    AioHttpxStreamingChecksumBody,
+    AioStreamingChecksumBody,
+)
 from aiobotocore.response import AioReadTimeoutError, HttpxStreamingBody
 
 
@@ -39,6 +52,15 @@ class AsyncBytesIO(io.BytesIO):
         return super().readinto(b)
 
 
+class StreamReaderResponse:
+    def __init__(self, chunks, limit=2**16):
+        self.url = ''
+        self.protocol = MagicMock()
+        self.content = aiohttp.StreamReader(self.protocol, limit)
+        for chunk in chunks:
+            self.content.feed_data(chunk)
+
+
 async def _tolist(aiter):
     results = []
     async for item in aiter:
@@ -205,6 +227,73 @@ async def test_streaming_line_abstruse_newline_standard():
         )
 
 
+@pytest.mark.parametrize('keepends', [False, True])
+async def test_streaming_line_iter_line_endings(keepends):
+    data = b'ab\r\ncd\r\re\n\nfghij\rk\r\n\r'
+    expected = data.splitlines(keepends)
+    for chunk_size in [None, *range(1, len(data) + 1)]:
+        stream = response.StreamingBody(AsyncBytesIO(data), len(data))
+        lines = await _tolist(stream.iter_lines(chunk_size, keepends))
+        assert lines == expected, chunk_size
+
+
+async def test_iter_any():
+    raw = StreamReaderResponse([b'a' * 1000, b'b' * 5000, b'c' * 10000])
+    raw.content.feed_eof()
+    stream = response.StreamingBody(raw, content_length=16000)
+    chunks = await _tolist(stream.iter_any(max_chunk_size=4096))
+    # What is buffered, in chunks growing from 1k up to the maximum.
+    assert [len(chunk) for chunk in chunks] == [
+        1024,
+        2048,
+        4096,
+        4096,
+        4096,
+        640,
+    ]
+    assert b''.join(chunks) == b'a' * 1000 + b'b' * 5000 + b'c' * 10000
+
+    body = MockHttpxResponse(b'x' * 3000, chunk_size=700)
+    stream = HttpxStreamingBody(body, content_length=3000)
+    chunks = await _tolist(stream.iter_any())
+    assert [len(chunk) for chunk in chunks] == [700, 700, 700, 700, 200]
+    assert stream.tell() == 3000
+
+    body = MockHttpxResponse(b'x' * 3000, chunk_size=700)
+    stream = HttpxStreamingBody(body, content_length=3001)
+    with pytest.raises(IncompleteReadError):
+        await _tolist(stream.iter_any())
+
+
+@pytest.mark.parametrize('backend', ['aiohttp', 'httpx'])
+@pytest.mark.parametrize('method', ['iter_any', 'iter_lines'])
+async def test_iter_any_validates_checksum(backend, method):
+    if backend == 'httpx' and httpx is None:
+        pytest.skip('httpx is not installed')
+    data = b'line\n' * 1000
+
+    def make_stream(data):
+        expected = base64.b64encode(
+            struct.pack('>I', zlib.crc32(b'line\n' * 1000))
+        ).decode()
+        if backend == 'aiohttp':
+            raw = StreamReaderResponse([data[:3000], data[3000:]])
+            raw.content.feed_eof()
+            body_cls = AioStreamingChecksumBody
+        else:
+            raw = MockHttpxResponse(data, chunk_size=700)
+            body_cls = AioHttpxStreamingChecksumBody
+        return body_cls(raw, len(data), Crc32Checksum(), expected)
+
+    chunks = await _tolist(getattr(make_stream(data), method)())
+    if method == 'iter_any':
+        assert b''.join(chunks) == data
+    else:
+        assert chunks == [b'line'] * 1000
+    with pytest.raises(FlexibleChecksumError):
+        await _tolist(getattr(make_stream(data.upper()), method)())
+
+
 async def test_streaming_line_empty_body():
     stream = response.StreamingBody(
         AsyncBytesIO(b''),
@@ -431,6 +520,23 @@ async def test_httpx_small_chunks_buffering():
     assert await stream.read(5) == b''
 
 
+async def test_httpx_mixed_reads_across_chunks():
+    data = bytes(range(256)) * 4
+    body = MockHttpxResponse(data, chunk_size=100)
+    stream = HttpxStreamingBody(body, content_length=len(data))
+    pieces = [await stream.read(1), await stream.read(99)]
+    # A read of exactly a whole chunk is the chunk itself.
+    pieces.append(await stream.read(100))
+    buf = bytearray(250)
+    assert await stream.readinto(memoryview(buf)[10:]) == 240
+    pieces.append(bytes(buf[10:]))
+    pieces.append(await stream.read(333))
+    pieces.append(await stream.read())
+    assert b''.join(pieces) == data
+    assert stream.tell() == len(data)
+    assert not stream.readable()
+
+
 async def test_httpx_read_negative_reads_all():
     body = MockHttpxResponse(b'abcdef', chunk_size=2)
     stream = HttpxStreamingBody(body, content_length=6)
@@ -445,6 +551,102 @@ async def test_streaming_body_read_negative_reads_all():
     assert stream.tell() == 6
 
 
+async def test_streaming_body_readinto_from_stream_reader():
+    raw = StreamReaderResponse([b'abc', b'defgh'], limit=4)
+    stream = response.StreamingBody(raw, content_length=10)
+    buf = array.array('H', [0] * 3)
+    assert await stream.readinto(buf) == 6
+    assert buf.tobytes() == b'abcdef'
+    raw.protocol.resume_reading.assert_called()
+
+    buf = bytearray(4)
+    assert await stream.readinto(memoryview(buf)[:1]) == 1
+    assert await stream.readinto(memoryview(buf)[1:]) == 1
+    # Waits for more data when the buffer is empty.
+    asyncio.get_running_loop().call_soon(raw.content.feed_data, b'ij')
+    assert await stream.readinto(memoryview(buf)[2:]) == 2
+    assert buf == b'ghij'
+    raw.content.feed_eof()
+    assert await stream.readinto(buf) == 0
+    assert stream.tell() == 10
+    assert raw.content.at_eof()
+
+
+async def test_streaming_body_download_into():
+    data = bytes(range(256)) * 4
+    raw = StreamReaderResponse([data[:100], data[100:700], data[700:]])
+    raw.content.feed_eof()
+    stream = response.StreamingBody(raw, content_length=len(data))
+    buf = bytearray(2000)
+    assert await stream.download_into(buf) == len(data)
+    assert buf[: len(data)] == data
+
+    # A buffer that the body fills reads its end, which verifies it.
+    def checksum_body(data, expected):
+        raw = StreamReaderResponse([data[:10], data[10:]])
+        raw.content.feed_eof()
+        checksum = Crc32Checksum()
+        return AioStreamingChecksumBody(raw, len(data), checksum, expected)
+
+    expected = base64.b64encode(struct.pack('>I', zlib.crc32(data))).decode()
+    buf = bytearray(len(data))
+    assert await checksum_body(data, expected).download_into(buf) == len(data)
+    assert buf == data
+    with pytest.raises(FlexibleChecksumError):
+        await checksum_body(data[::-1], expected).download_into(buf)
+
+    # A longer body is left to read.
+    stream = response.StreamingBody(AsyncBytesIO(data), len(data))
+    assert await stream.download_into(memoryview(buf)[:300]) == 300
+    assert await stream.read() == data[300:]
+
+
+@pytest.mark.parametrize('backend', ['aiohttp', 'httpx'])
+async def test_download_to(backend, tmp_path):
+    if backend == 'httpx' and httpx is None:
+        pytest.skip('httpx is not installed')
+    data = bytes(range(256)) * 100
+
+    def make_stream(content_length=len(data)):
+        if backend == 'aiohttp':
+            raw = StreamReaderResponse([data[:1000], data[1000:]])
+            raw.content.feed_eof()
+            return response.StreamingBody(raw, content_length)
+        body = MockHttpxResponse(data, chunk_size=1000)
+        return HttpxStreamingBody(body, content_length)
+
+    path = tmp_path / 'body'
+    assert await make_stream().download_to(path, chunk_size=1024) == len(data)
+    assert path.read_bytes() == data
+
+    # Writes that lag behind reads at most max_pending chunks.
+    stream = make_stream()
+    file = io.BytesIO()
+    leads = []
+
+    def write(data):
+        leads.append(stream.tell() - file.tell())
+        time.sleep(0.001)
+        # Writes only part of the data, as raw files may.
+        return file.write(data[:1000])
+
+    assert await stream.download_to(
+        SimpleNamespace(write=write), chunk_size=2048, max_pending=3
+    ) == len(data)
+    assert file.getvalue() == data
+    # Reads went on during writes, but not too far.
+    assert 2048 < max(leads) <= 3 * 2048
+
+    with pytest.raises(IncompleteReadError):
+        await make_stream(len(data) + 1).download_to(io.BytesIO())
+
+    def failing_write(data):
+        raise OSError('disk full')
+
+    with pytest.raises(OSError, match='disk full'):
+        await make_stream().download_to(SimpleNamespace(write=failing_write))
+
+
 @pytest.mark.skipif(httpx is None, reason='httpx is not installed')
 async def test_httpx_content_encoded_body_validates_wire_bytes():
     """Content-Length describes wire bytes, so a gzip body must not be
@@ -0,0 +1,68 @@
+import pytest
+from botocore.exceptions import ClientError
+
+from aiobotocore.config import AioConfig
+from aiobotocore.response_cache import ResponseCache
+
+
+@pytest.fixture
+async def cached_s3_client(session, region, config, moto_server, aws_auth):
+    cache = ResponseCache(
+        {'GetBucketLocation': 60, 'HeadBucket': 60, 'GetObject': 60},
+        maxsize=2,
+        negative_ttl=60,
+    )
+    async with session.create_client(
+        's3',
+        region_name=region,
+        config=config.merge(AioConfig(response_cache=cache)),
+        endpoint_url=moto_server,
+        **aws_auth,
+    ) as client:
+        yield client, cache
+
+
+async def test_response_cache(cached_s3_client, bucket_name):
+    client, cache = cached_s3_client
+    requests = []
+    client.meta.events.register(
+        'request-created.s3', lambda request, **kwargs: requests.append(1)
+    )
+
+    location = await client.get_bucket_location(Bucket=bucket_name)
+    location['LocationConstraint'] = 'changed'
+    cached = await client.get_bucket_location(Bucket=bucket_name)
+    assert cached['LocationConstraint'] != 'changed'
+    assert len(requests) == 1
+    assert cache.info()[:2] == (1, 1)
+
+    # Not found errors are cached too.
+    for _ in range(2):
+        with pytest.raises(ClientError) as e:
+            await client.head_bucket(Bucket='missing-bucket')
+        assert e.value.response['Error']['Code'] == '404'
+    assert len(requests) == 2
+
+    # maxsize=2, so the bucket location was least recently used.
+    await client.head_bucket(Bucket=bucket_name)
+    assert len(requests) == 3
+    await client.get_bucket_location(Bucket=bucket_name)
+    assert len(requests) == 4
+
+    cache.invalidate('GetBucketLocation', Bucket='other-bucket')
+    await client.get_bucket_location(Bucket=bucket_name)
+    assert len(requests) == 4
+    cache.invalidate('GetBucketLocation', Bucket=bucket_name)
+    await client.get_bucket_location(Bucket=bucket_name)
+    assert len(requests) == 5
+    cache.invalidate()
+    assert cache.info().currsize == 0
+
+    # Streaming output is never cached.
+    await client.put_object(Bucket=bucket_name, Key='key', Body=b'foo')
+    requests.clear()
+    for _ in range(2):
+        response = await client.get_object(Bucket=bucket_name, Key='key')
+        async with response['Body'] as stream:
+            assert await stream.read() == b'foo'
+    assert len(requests) == 2
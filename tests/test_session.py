@@ -322,3 +322,55 @@ def test_session_fixture_uses_primitives_for_http_backend(
     assert session._async_primitives is infer_async_primitives(
         http_session_cls
     )
+
+
+async def test_share_http_session(session, moto_server, http_session_cls):
+    config = AioConfig(
+        share_http_session=True, http_session_cls=http_session_cls
+    )
+    kw = dict(
+        region_name='us-east-1',
+        endpoint_url=moto_server,
+        aws_secret_access_key='xxx',
+        aws_access_key_id='xxx',
+    )
+
+    async with session.create_client('s3', config=config, **kw) as s3:
+        async with session.create_client('sqs', config=config, **kw) as sqs:
+            http_session = s3._endpoint.http_session
+            assert sqs._endpoint.http_session is http_session
+            await s3.list_buckets()
+            await sqs.list_queues()
+
+        # Exiting the SQS client only released its reference.
+        await s3.list_buckets()
+        # close() releases the reference once, however often it is called.
+        await sqs.close()
+        await s3.list_buckets()
+
+    async with session.create_client('s3', **kw) as unshared:
+        assert unshared._endpoint.http_session is not http_session
+
+    # The last reference is gone, so the pool was closed; the next client
+    # to take it opens it again.
+    async with session.create_client('s3', config=config, **kw) as s3:
+        assert s3._endpoint.http_session is http_session
+        await s3.list_buckets()
+
+
+async def test_share_http_session_keyed_by_transport_settings(
+    session, http_session_cls
+):
+    kw = dict(
+        region_name='us-east-1',
+        aws_secret_access_key='xxx',
+        aws_access_key_id='xxx',
+    )
+    config = AioConfig(
+        share_http_session=True, http_session_cls=http_session_cls
+    )
+    async with (
+        session.create_client('s3', config=config, **kw) as s3,
+        session.create_client('s3', config=config, verify=False, **kw) as s3b,
+    ):
+        assert s3._endpoint.http_session is not s3b._endpoint.http_session
@@ -9,11 +9,15 @@ whose certificate is minted by ``trustme``.
 from __future__ import annotations
 
 import json
+import os
+import ssl
 
 import anyio
 import pytest
 from botocore.exceptions import SSLError
 
+from aiobotocore.httpsession import clear_ssl_context_cache
+from aiobotocore.httpxsession import HttpxSession
 from tests.tls_helpers import (
     prepared_request,
     serve_https_target,
@@ -100,3 +104,67 @@ async def test_hostname_mismatch_is_rejected(http_session_cls, ca, ca_bundle):
                 await session.send(prepared_request(target_port))
 
         tg.cancel_scope.cancel()
+
+
+def _endpoint_ssl_context(session):
+    if isinstance(session, HttpxSession):
+        return session._build_ssl_contexts({})[0]
+    return session._build_ssl_contexts(None)[0]
+
+
+async def test_ssl_contexts_are_cached(http_session_cls, ca, ca_bundle):
+    import trustme
+
+    first = _endpoint_ssl_context(http_session_cls(verify=ca_bundle))
+    # A second client with the same settings skips loading the bundle.
+    assert _endpoint_ssl_context(http_session_cls(verify=ca_bundle)) is first
+    assert _endpoint_ssl_context(http_session_cls(verify=False)) is not first
+
+    # Rewriting the bundle changes its mtime, so the new CA is picked up.
+    rotated_ca = trustme.CA()
+    with open(ca_bundle, 'wb') as f:
+        f.write(rotated_ca.cert_pem.bytes())
+    stat = os.stat(ca_bundle)
+    os.utime(ca_bundle, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    rotated = _endpoint_ssl_context(http_session_cls(verify=ca_bundle))
+    assert rotated is not first
+    assert rotated.get_ca_certs(binary_form=True) == [
+        ssl.PEM_cert_to_DER_cert(rotated_ca.cert_pem.bytes().decode())
+    ]
+
+    clear_ssl_context_cache()
+    assert (
+        _endpoint_ssl_context(http_session_cls(verify=ca_bundle))
+        is not rotated
+    )
+
+
+async def test_ssl_context_cache_keys_files_by_role(
+    http_session_cls, ca, tmp_path
+):
+    leaf = ca.issue_cert("client@example.com")
+    pem_path = tmp_path / "client-combined.pem"
+    pem_path.write_bytes(
+        b"".join(b.bytes() for b in leaf.cert_chain_pems)
+        + leaf.private_key_pem.bytes()
+    )
+    pem_path = str(pem_path)
+
+    # The same file as the client certificate, and only as the proxy's.
+    with_cert = _endpoint_ssl_context(
+        http_session_cls(verify=False, client_cert=pem_path)
+    )
+    proxy_only = _endpoint_ssl_context(
+        http_session_cls(
+            verify=False, proxies_config={'proxy_client_cert': pem_path}
+        )
+    )
+    assert proxy_only is not with_cert
+    assert (
+        _endpoint_ssl_context(
+            http_session_cls(
+                verify=False, proxies_config={'proxy_ca_bundle': pem_path}
+            )
+        )
+        is not proxy_only
+    )
@@ -0,0 +1,242 @@
+import base64
+import zlib
+
+import pytest
+from botocore.exceptions import ClientError, FlexibleChecksumError
+
+from aiobotocore.transfer import DownloadState, PartMismatchError, download
+
+_DATA = bytes(range(256)) * 400
+
+
+def _record_gets(s3_client, failing_ranges=()):
+    gets = []
+    failing_ranges = set(failing_ranges)
+
+    def provide_params(params, **kwargs):
+        gets.append(params)
+        if params.get('Range') in failing_ranges:
+            failing_ranges.remove(params['Range'])
+            raise RuntimeError('connection lost')
+
+    s3_client.meta.events.register(
+        'provide-client-params.s3.GetObject', provide_params
+    )
+    return gets
+
+
+async def test_download(s3_client, bucket_name, create_object, tmp_path):
+    await create_object('key', body=_DATA)
+    gets = _record_gets(s3_client)
+    progress = []
+
+    path = tmp_path / 'key'
+    size = await download(
+        s3_client,
+        bucket_name,
+        'key',
+        path,
+        part_size=30000,
+        concurrency=2,
+        progress=progress.append,
+    )
+    assert size == len(_DATA)
+    assert path.read_bytes() == _DATA
+    assert sorted(progress) == [12400, 30000, 30000, 30000]
+    assert sorted(get['Range'] for get in gets) == [
+        'bytes=0-29999',
+        'bytes=30000-59999',
+        'bytes=60000-89999',
+        'bytes=90000-102399',
+    ]
+    etag = (await s3_client.head_object(Bucket=bucket_name, Key='key'))['ETag']
+    assert {get['IfMatch'] for get in gets} == {etag}
+
+    # Into a buffer, and in one GET without a range for a single part.
+    gets.clear()
+    buffer = bytearray(len(_DATA) + 1)
+    await download(s3_client, bucket_name, 'key', buffer, part_size=30000)
+    assert buffer[:-1] == _DATA
+    await download(s3_client, bucket_name, 'key', buffer)
+    assert buffer[:-1] == _DATA
+    assert 'Range' not in gets[-1]
+
+    with pytest.raises(ValueError):
+        await download(s3_client, bucket_name, 'key', bytearray(10))
+
+
+async def test_download_resume(
+    s3_client, bucket_name, create_object, tmp_path
+):
+    await create_object('key', body=_DATA)
+    gets = _record_gets(s3_client, ['bytes=60000-89999'])
+    state = DownloadState()
+    progress = []
+
+    path = tmp_path / 'key'
+    with pytest.raises(RuntimeError):
+        await download(
+            s3_client,
+            bucket_name,
+            'key',
+            path,
+            part_size=30000,
+            concurrency=1,
+            state=state,
+            progress=progress.append,
+        )
+    assert state.completed == {0, 1}
+    assert len(gets) == 3
+
+    # Resumed from the saved state, fetching only the missing parts.
+    gets.clear()
+    state = DownloadState.from_dict(state.to_dict())
+
+    async def async_progress(amount):
+        progress.append(amount)
+
+    await download(
+        s3_client,
+        bucket_name,
+        'key',
+        path,
+        part_size=1000,
+        state=state,
+        progress=async_progress,
+    )
+    assert path.read_bytes() == _DATA
+    # In the parts of the state, whatever part_size is passed.
+    assert sorted(get['Range'] for get in gets) == [
+        'bytes=60000-89999',
+        'bytes=90000-102399',
+    ]
+    assert state.completed == {0, 1, 2, 3}
+    assert sum(progress) == len(_DATA)
+
+    with pytest.raises(ValueError):
+        await download(s3_client, bucket_name, 'other', path, state=state)
+
+    # Parts of a changed object are not mixed with the ones written.
+    state.completed.discard(3)
+    await create_object('key', body=_DATA[::-1])
+    with pytest.raises(ClientError) as e:
+        await download(s3_client, bucket_name, 'key', path, state=state)
+    assert e.value.response['Error']['Code'] == 'PreconditionFailed'
+
+
+async def test_download_validates_checksum(
+    s3_client, bucket_name, create_object
+):
+    await create_object('key', body=_DATA)
+
+    async def before_send(request, **kwargs):
+        # A checksum that does not match the data.
+        response = await s3_client._endpoint._send(request)
+        response.headers['x-amz-checksum-crc32'] = 'AAAAAA=='
+        return response
+
+    s3_client.meta.events.register('before-send.s3.GetObject', before_send)
+    with pytest.raises(FlexibleChecksumError):
+        await download(s3_client, bucket_name, 'key', bytearray(len(_DATA)))
+
+
+async def test_download_checks_part_range(
+    s3_client, bucket_name, create_object, tmp_path
+):
+    await create_object('key', body=_DATA)
+
+    def ignore_range(params, **kwargs):
+        # As an endpoint that ignores Range, sending the whole object.
+        if params.get('Range') == 'bytes=30000-59999':
+            del params['Range']
+
+    s3_client.meta.events.register(
+        'provide-client-params.s3.GetObject', ignore_range
+    )
+    state = DownloadState()
+    with pytest.raises(PartMismatchError):
+        await download(
+            s3_client,
+            bucket_name,
+            'key',
+            tmp_path / 'key',
+            part_size=30000,
+            concurrency=1,
+            state=state,
+        )
+    assert state.completed == {0}
+
+
+async def test_download_by_part_number(s3_client, bucket_name, tmp_path):
+    # Parts of different sizes, whose offsets come from the responses.
+    part_data = [b'a' * 5 * 1024 * 1024, b'b' * (5 * 1024 * 1024 + 7), b'c']
+    data = b''.join(part_data)
+    upload = await s3_client.create_multipart_upload(
+        Bucket=bucket_name, Key='key', ChecksumAlgorithm='CRC32'
+    )
+    parts = []
+    for number, body in enumerate(part_data, 1):
+        response = await s3_client.upload_part(
+            Bucket=bucket_name,
+            Key='key',
+            UploadId=upload['UploadId'],
+            PartNumber=number,
+            Body=body,
+            ChecksumAlgorithm='CRC32',
+        )
+        parts.append(
+            {
+                'PartNumber': number,
+                'ETag': response['ETag'],
+                'ChecksumCRC32': response['ChecksumCRC32'],
+            }
+        )
+    await s3_client.complete_multipart_upload(
+        Bucket=bucket_name,
+        Key='key',
+        UploadId=upload['UploadId'],
+        MultipartUpload={'Parts': parts},
+    )
+
+    # moto sends the whole object for a PartNumber, so this does what S3
+    # does: send the part, with its checksum.
+    ranges = {}
+    start = 0
+    for number, body in enumerate(part_data, 1):
+        checksum = base64.b64encode(zlib.crc32(body).to_bytes(4, 'big'))
+        ranges[f'bytes={start}-{start + len(body) - 1}'] = checksum.decode()
+        start += len(body)
+    range_of_part = list(ranges)
+    gets = []
+
+    def provide_params(params, **kwargs):
+        gets.append(dict(params))
+        params['Range'] = range_of_part[params.pop('PartNumber') - 1]
+
+    async def before_send(request, **kwargs):
+        response = await s3_client._endpoint._send(request)
+        response.headers['x-amz-checksum-crc32'] = ranges[
+            request.headers['Range'].decode()
+        ]
+        return response
+
+    s3_client.meta.events.register(
+        'provide-client-params.s3.GetObject', provide_params
+    )
+    s3_client.meta.events.register('before-send.s3.GetObject', before_send)
+
+    path = tmp_path / 'key'
+    state = DownloadState()
+    size = await download(
+        s3_client, bucket_name, 'key', path, part_size=1000, state=state
+    )
+    assert size == len(data)
+    assert path.read_bytes() == data
+    assert state.part_count == 3
+    assert sorted(get['PartNumber'] for get in gets) == [1, 2, 3]
+    assert {get['ChecksumMode'] for get in gets} == {'ENABLED'}
+
+    # The checksum of each part is validated.
+    ranges[range_of_part[1]] = 'AAAAAA=='
+    with pytest.raises(FlexibleChecksumError):
+        await download(s3_client, bucket_name, 'key', bytearray(len(data)))
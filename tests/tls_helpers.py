@@ -41,15 +41,63 @@ async def handle_target(stream) -> None:
             pass
 
 
+async def handle_h2_target(stream) -> None:
+    """Serve HTTP/2 requests over an accepted stream until it is closed."""
+    import h2.config
+    import h2.connection
+    import h2.events
+
+    connection = h2.connection.H2Connection(
+        config=h2.config.H2Configuration(client_side=False)
+    )
+    connection.initiate_connection()
+    try:
+        await stream.send(connection.data_to_send())
+        while True:
+            for event in connection.receive_data(await stream.receive()):
+                if isinstance(event, h2.events.RequestReceived):
+                    connection.send_headers(
+                        event.stream_id,
+                        [
+                            (':status', '200'),
+                            ('content-length', str(len(RESPONSE_BODY))),
+                            ('content-type', 'application/json'),
+                        ],
+                    )
+                    connection.send_data(
+                        event.stream_id, RESPONSE_BODY, end_stream=True
+                    )
+            await stream.send(connection.data_to_send())
+    except (
+        anyio.EndOfStream,
+        anyio.BrokenResourceError,
+        ConnectionResetError,
+    ):
+        pass
+    finally:
+        try:
+            await stream.aclose()
+        except (
+            anyio.BrokenResourceError,
+            ssl.SSLError,
+        ):  # pragma: no cover
+            pass
+
+
 async def serve_https_target(
-    ca, *, hostname=TARGET_HOST, client_ca=None, task_status
+    ca, *, hostname=TARGET_HOST, client_ca=None, http2=False, task_status
 ) -> None:
+    """Serve HTTPS, over HTTP/2 if ``http2`` and the client offers it by
+    ALPN.
+    """
     server_cert = ca.issue_cert(hostname)
     ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
     server_cert.configure_cert(ssl_context)
     if client_ca is not None:
         ssl_context.verify_mode = ssl.CERT_REQUIRED
         client_ca.configure_trust(ssl_context)
+    if http2:
+        ssl_context.set_alpn_protocols(['h2'])
 
     listener = await anyio.create_tcp_listener(
         local_host="127.0.0.1", local_port=0
@@ -57,7 +105,9 @@ async def serve_https_target(
     async with listener:
         port = listener.extra(SocketAttribute.local_port)
         task_status.started(port)
-        await TLSListener(listener, ssl_context).serve(handle_target)
+        await TLSListener(listener, ssl_context).serve(
+            handle_h2_target if http2 else handle_target
+        )
 
 
 def prepared_request(port: int, host: str = TARGET_HOST) -> AWSRequest: